@@ -33,6 +33,7 @@ from ray.data.read_api import (  # noqa: F401
     range,
     range_table,
     range_tensor,
+    read_arrow_ipc,
     read_binary_files,
     read_csv,
     read_datasource,
@@ -85,6 +86,7 @@ __all__ = [
     "range_table",
     "range_tensor",
     "read_text",
+    "read_arrow_ipc",
     "read_binary_files",
     "read_csv",
     "read_datasource",
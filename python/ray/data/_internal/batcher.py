@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
 
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.arrow_ops import transform_pyarrow
@@ -330,3 +332,111 @@ class ShufflingBatcher(BatcherInterface):
         return BlockAccessor.for_block(self._shuffle_buffer).slice(
             slice_start, self._batch_head
         )
+
+
+class WindowShufflingBatcher(BatcherInterface):
+    """Chunks blocks into shuffled batches, by gathering the rows of each batch at
+    random from a window of buffered blocks."""
+
+    # Implementation Note:
+    #
+    # Unlike ShufflingBatcher, the buffered blocks are never concatenated into a
+    # shuffle buffer. Each buffered block keeps a random permutation of its remaining
+    # row indices instead. For each batch, the number of rows taken from each block is
+    # drawn from a multivariate hypergeometric distribution, i.e. as if the rows were
+    # drawn uniformly without replacement from all the rows of the window, and the rows
+    # are gathered from the blocks with BlockAccessor.take().
+    #
+    # This gives the shuffle quality of a shuffle buffer of the same size, while each
+    # row is only copied into its batch, and the blocks are released as soon as all
+    # their rows have been yielded.
+
+    def __init__(
+        self,
+        batch_size: Optional[int],
+        shuffle_buffer_min_size: int,
+        shuffle_seed: Optional[int] = None,
+    ):
+        """Constructs a random-shuffling block batcher.
+
+        Args:
+            batch_size: Record batch size.
+            shuffle_buffer_min_size: Minimum number of rows that must be in the window
+                of buffered blocks in order to yield a batch. When there are no more
+                rows to be added to the window, the number of rows in the window
+                *will* decrease below this value while yielding the remaining batches,
+                and the final batch may have less than ``batch_size`` rows. Increasing
+                this will improve the randomness of the shuffle but may increase the
+                latency to the first batch.
+            shuffle_seed: The seed to use for the local random shuffle.
+        """
+        if batch_size is None:
+            raise ValueError("Must specify a batch_size if using a local shuffle.")
+        self._batch_size = batch_size
+        self._buffer_min_size = max(shuffle_buffer_min_size, batch_size)
+        self._rng = np.random.default_rng(shuffle_seed)
+        self._blocks: List[Block] = []
+        # The remaining row indices of each buffered block, in random order.
+        self._row_indices: List[np.ndarray] = []
+        self._buffer_size = 0
+        self._done_adding = False
+
+    def add(self, block: Block):
+        """Add a block to the window.
+
+        Note empty block is not added to the window.
+
+        Args:
+            block: Block to add to the window.
+        """
+        num_rows = BlockAccessor.for_block(block).num_rows()
+        if num_rows > 0:
+            self._blocks.append(block)
+            self._row_indices.append(self._rng.permutation(num_rows))
+            self._buffer_size += num_rows
+
+    def done_adding(self) -> bool:
+        """Indicate to the batcher that no more blocks will be added to the batcher.
+
+        No more blocks should be added to the batcher after calling this.
+        """
+        self._done_adding = True
+
+    def has_any(self) -> bool:
+        """Whether this batcher has any data."""
+        return self._buffer_size > 0
+
+    def has_batch(self) -> bool:
+        """Whether this batcher has any batches."""
+        if not self._done_adding:
+            return self._buffer_size >= self._buffer_min_size
+        return self._buffer_size >= self._batch_size
+
+    def next_batch(self) -> Block:
+        """Get the next shuffled batch from the window.
+
+        Returns:
+            A batch represented as a Block.
+        """
+        assert self.has_batch() or (self._done_adding and self.has_any())
+        batch_size = min(self._batch_size, self._buffer_size)
+        counts = self._rng.multivariate_hypergeometric(
+            [len(indices) for indices in self._row_indices], batch_size
+        )
+        builder = DelegatingBlockBuilder()
+        blocks, row_indices = [], []
+        for block, indices, count in zip(self._blocks, self._row_indices, counts):
+            if count > 0:
+                builder.add_block(BlockAccessor.for_block(block).take(indices[:count]))
+                indices = indices[count:]
+            if len(indices) > 0:
+                blocks.append(block)
+                row_indices.append(indices)
+        self._blocks = blocks
+        self._row_indices = row_indices
+        self._buffer_size -= batch_size
+        # The rows taken from each block are contiguous in the batch.
+        batch = builder.build()
+        return BlockAccessor.for_block(batch).random_shuffle(
+            int(self._rng.integers(2**31))
+        )
@@ -17,7 +17,7 @@ from ray.data._internal.block_batching.util import (
 )
 from ray.data._internal.memory_tracing import trace_deallocation
 from ray.data._internal.stats import DatasetStats
-from ray.data.block import Block, BlockMetadata, DataBatch
+from ray.data.block import Block, BlockAccessor, BlockMetadata, DataBatch
 from ray.data.context import DataContext
 from ray.types import ObjectRef
 
@@ -36,6 +36,7 @@ def iter_batches(
     shuffle_seed: Optional[int] = None,
     ensure_copy: bool = False,
     prefetch_batches: int = 1,
+    on_batch_yielded: Optional[Callable[[int], None]] = None,
 ) -> Iterator[DataBatch]:
     """Create formatted batches of data from an iterator of block object references and
     corresponding metadata.
@@ -103,6 +104,8 @@ def iter_batches(
             the specified amount of formatted batches from blocks. This improves
             performance for non-CPU bound UDFs, allowing batch fetching compute and
             formatting to be overlapped with the UDF. Defaults to 1.
+        on_batch_yielded: A function called with the number of rows of each batch
+            right before it's yielded.
 
     Returns:
         An iterator over record batches.
@@ -119,6 +122,8 @@ def iter_batches(
         prefetcher = WaitBlockPrefetcher()
 
     eager_free = clear_block_after_read and DataContext.get_current().eager_free
+    # The number of rows of the batches that haven't been yielded yet, by index.
+    batch_num_rows: Dict[int, int] = {}
 
     def _async_iter_batches(
         block_refs: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
@@ -145,6 +150,8 @@ def iter_batches(
             shuffle_seed=shuffle_seed,
             ensure_copy=ensure_copy,
         )
+        if on_batch_yielded is not None:
+            batch_iter = _record_num_rows(batch_iter, batch_num_rows)
 
         # Step 4: Use a threadpool for formatting and collation.
         batch_iter = _format_in_threadpool(
@@ -170,12 +177,17 @@ def iter_batches(
     # for streaming results.
     async_batch_iter = make_async_gen(block_refs, fn=_async_iter_batches, num_workers=1)
 
+    batch_idx = 0
     while True:
         with stats.iter_total_blocked_s.timer() if stats else nullcontext():
             try:
                 next_batch = next(async_batch_iter)
             except StopIteration:
                 break
+        if on_batch_yielded is not None:
+            # The batches are yielded in the order of their indices.
+            on_batch_yielded(batch_num_rows.pop(batch_idx))
+            batch_idx += 1
         with stats.iter_user_s.timer() if stats else nullcontext():
             yield next_batch
 
@@ -228,6 +240,15 @@ def _format_in_threadpool(
     return collated_iter
 
 
+def _record_num_rows(
+    batch_iter: Iterator[Batch], batch_num_rows: Dict[int, int]
+) -> Iterator[Batch]:
+    """Record the number of rows of each batch by index, before it's formatted."""
+    for batch in batch_iter:
+        batch_num_rows[batch.batch_idx] = BlockAccessor.for_block(batch.data).num_rows()
+        yield batch
+
+
 def prefetch_batches_locally(
     block_ref_iter: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
     prefetcher: BlockPrefetcher,
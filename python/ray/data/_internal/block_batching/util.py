@@ -6,14 +6,19 @@ from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar, Unio
 
 import ray
 from ray.actor import ActorHandle
-from ray.data._internal.batcher import Batcher, ShufflingBatcher
+from ray.data._internal.batcher import (
+    Batcher,
+    ShufflingBatcher,
+    WindowShufflingBatcher,
+)
 from ray.data._internal.block_batching.interfaces import (
     Batch,
     BlockPrefetcher,
     CollatedBatch,
 )
 from ray.data._internal.stats import DatasetPipelineStats, DatasetStats
-from ray.data.block import Block, BlockAccessor, DataBatch
+from ray.data.block import Block, BlockAccessor, BlockMetadata, DataBatch
+from ray.data.context import DataContext
 from ray.types import ObjectRef
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
@@ -69,6 +74,39 @@ def resolve_block_refs(
         stats.iter_unknown_location = unknowns
 
 
+def skip_rows(
+    block_ref_iter: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
+    num_rows: int,
+) -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
+    """Skip the first rows of the blocks.
+
+    The blocks whose number of rows is known from their metadata are skipped without
+    being fetched. The block that's only partially skipped is sliced locally.
+
+    Args:
+        block_ref_iter: An iterator over block object references and their metadata.
+        num_rows: The number of rows to skip.
+    """
+    for block_ref, metadata in block_ref_iter:
+        if num_rows <= 0:
+            yield block_ref, metadata
+            continue
+        if metadata.num_rows is not None and metadata.num_rows <= num_rows:
+            num_rows -= metadata.num_rows
+            continue
+        accessor = BlockAccessor.for_block(ray.get(block_ref))
+        block_num_rows = accessor.num_rows()
+        if block_num_rows <= num_rows:
+            num_rows -= block_num_rows
+            continue
+        block = accessor.slice(num_rows, block_num_rows, copy=False)
+        num_rows = 0
+        metadata = BlockAccessor.for_block(block).get_metadata(
+            input_files=metadata.input_files, exec_stats=None
+        )
+        yield ray.put(block), metadata
+
+
 def blocks_to_batches(
     block_iter: Iterator[Block],
     stats: Optional[Union[DatasetStats, DatasetPipelineStats]] = None,
@@ -101,7 +139,17 @@ def blocks_to_batches(
         An iterator over blocks of the given size that are potentially shuffled.
     """
     if shuffle_buffer_min_size is not None:
-        batcher = ShufflingBatcher(
+        strategy = DataContext.get_current().local_shuffle_strategy
+        if strategy == "buffer":
+            batcher_cls = ShufflingBatcher
+        elif strategy == "window":
+            batcher_cls = WindowShufflingBatcher
+        else:
+            raise ValueError(
+                f"Invalid local shuffle strategy {strategy!r}, expected one of "
+                "'buffer' or 'window'."
+            )
+        batcher = batcher_cls(
             batch_size=batch_size,
             shuffle_buffer_min_size=shuffle_buffer_min_size,
             shuffle_seed=shuffle_seed,
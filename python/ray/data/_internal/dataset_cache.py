@@ -0,0 +1,318 @@
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import posixpath
+import sys
+import sysconfig
+import types
+from typing import TYPE_CHECKING, Any, Optional, Set
+
+import ray
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan
+from ray.data._internal.logical.operators.all_to_all_operator import (
+    RandomizeBlocks,
+    RandomShuffle,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockAccessor
+from ray.data.datasource.arrow_ipc_datasource import ArrowIPCDatasource
+from ray.data.datasource.datasource import RangeDatasource
+from ray.data.datasource.file_based_datasource import (
+    _resolve_paths_and_filesystem,
+    _unwrap_s3_serialization_workaround,
+    _wrap_s3_serialization_workaround,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.dataset import Dataset, MaterializedDataset
+
+logger = logging.getLogger(__name__)
+
+# The file listing the blocks of a cache entry. It's written after the blocks, so that
+# incomplete entries are never read.
+_MANIFEST_FILE_NAME = "_manifest.json"
+
+# The attributes of the logical operators that don't affect their output data.
+_IGNORED_OPERATOR_ATTRIBUTES = {
+    "_name",
+    "_input_dependencies",
+    "_output_dependencies",
+    "_ray_remote_args",
+    "_compute",
+    "_sub_progress_bar_names",
+    "_estimated_num_blocks",
+    # The reads are fingerprinted by their input files.
+    "_datasource",
+    "_read_tasks",
+    "_read_args",
+}
+
+
+class _UnfingerprintableError(Exception):
+    """Raised if the output of a logical plan isn't determined by its definition."""
+
+    pass
+
+
+def cache_dataset(
+    ds: "Dataset",
+    path: str,
+    filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+) -> "MaterializedDataset":
+    """Materialize the dataset, reusing the blocks cached in ``path`` by a dataset
+    with the same logical plan if there are any, and caching them otherwise.
+
+    See ``Dataset.cache()``.
+    """
+    from ray.data.read_api import from_arrow_refs
+
+    fingerprint = None
+    if ds._logical_plan is not None:
+        fingerprint = get_plan_fingerprint(ds._logical_plan)
+    if fingerprint is None:
+        logger.warning(
+            "The dataset can't be cached, since its data isn't determined by its "
+            "definition. It's materialized without caching."
+        )
+        return ds.materialize()
+
+    paths, filesystem = _resolve_paths_and_filesystem(path, filesystem)
+    cache_dir = posixpath.join(paths[0], fingerprint)
+    manifest_path = posixpath.join(cache_dir, _MANIFEST_FILE_NAME)
+    wrapped_filesystem = _wrap_s3_serialization_workaround(filesystem)
+
+    if _file_exists(filesystem, manifest_path):
+        logger.info(f"Reading the dataset from the cache {cache_dir}.")
+        with filesystem.open_input_stream(manifest_path) as f:
+            manifest = json.loads(f.read())
+        read_block = cached_remote_fn(_read_cached_block)
+        return from_arrow_refs(
+            [
+                read_block.remote(wrapped_filesystem, posixpath.join(cache_dir, name))
+                for name in manifest["blocks"]
+            ]
+        )
+
+    materialized = ds.materialize()
+    logger.info(f"Writing the dataset to the cache {cache_dir}.")
+    filesystem.create_dir(cache_dir, recursive=True)
+    block_refs = materialized.get_internal_block_refs()
+    block_names = [f"block_{i:06d}.arrow" for i in range(len(block_refs))]
+    write_block = cached_remote_fn(_write_cached_block)
+    ray.get(
+        [
+            write_block.remote(
+                block, wrapped_filesystem, posixpath.join(cache_dir, name)
+            )
+            for block, name in zip(block_refs, block_names)
+        ]
+    )
+    with filesystem.open_output_stream(manifest_path) as f:
+        f.write(json.dumps({"blocks": block_names}).encode())
+    return materialized
+
+
+def get_plan_fingerprint(plan: LogicalPlan) -> Optional[str]:
+    """Return a hash of the definition of the logical plan, or None if its output
+    isn't determined by its definition.
+
+    The fingerprint covers the Ray version, the types and arguments of the operators,
+    the bytecode of the UDFs and of the functions they reference, and the paths,
+    sizes and modification times of the files that are read.
+    """
+    hasher = hashlib.sha256()
+    # The implementation of the operators can change between versions.
+    hasher.update(ray.__version__.encode())
+    try:
+        _fingerprint_operator(plan.dag, hasher)
+    except (_UnfingerprintableError, RecursionError) as e:
+        logger.info(f"The logical plan can't be fingerprinted: {e}")
+        return None
+    return hasher.hexdigest()
+
+
+def _fingerprint_operator(op: LogicalOperator, hasher: "hashlib._Hash") -> None:
+    hasher.update(type(op).__qualname__.encode())
+    for input_op in op.input_dependencies:
+        _fingerprint_operator(input_op, hasher)
+
+    if isinstance(op, Read):
+        _fingerprint_read(op, hasher)
+    elif not op.input_dependencies:
+        raise _UnfingerprintableError(f"{op.name} reads data from memory.")
+    elif isinstance(op, (RandomShuffle, RandomizeBlocks)) and op._seed is None:
+        raise _UnfingerprintableError(f"{op.name} has no seed.")
+
+    for name, value in sorted(vars(op).items()):
+        if name not in _IGNORED_OPERATOR_ATTRIBUTES:
+            hasher.update(name.encode())
+            _fingerprint_value(value, hasher, set())
+
+
+def _fingerprint_read(op: Read, hasher: "hashlib._Hash") -> None:
+    hasher.update(type(op._datasource).__qualname__.encode())
+    read_args = dict(op._read_args)
+    paths = read_args.pop("paths", None)
+    filesystem = read_args.pop("filesystem", None)
+    _fingerprint_value(read_args, hasher, set())
+    if paths is None:
+        if not isinstance(op._datasource, RangeDatasource):
+            raise _UnfingerprintableError(
+                f"{op.name} doesn't read files, so its data can change."
+            )
+        return
+
+    _, filesystem = _resolve_paths_and_filesystem(paths, filesystem)
+    input_files = set()
+    for read_task in op._read_tasks:
+        # The input files can be a NumPy array.
+        files = read_task.get_metadata().input_files
+        if files is not None:
+            input_files.update(str(f) for f in files)
+    if not input_files:
+        raise _UnfingerprintableError(
+            f"{op.name} doesn't report its input files, so their changes can't be "
+            "detected."
+        )
+    for info in filesystem.get_file_info(sorted(input_files)):
+        if info.mtime_ns is None:
+            raise _UnfingerprintableError(
+                f"The modification time of {info.path} is unknown."
+            )
+        hasher.update(f"{info.path}:{info.size}:{info.mtime_ns}".encode())
+
+
+def _fingerprint_value(value: Any, hasher: "hashlib._Hash", visited: Set[int]) -> None:
+    """Update the hasher with the content of the value.
+
+    Functions are hashed by their bytecode, constants, closures and referenced
+    globals, rather than by their identity.
+    """
+    hasher.update(type(value).__qualname__.encode())
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        hasher.update(repr(value).encode())
+        return
+    if id(value) in visited:
+        # Reference cycle.
+        return
+    visited = visited | {id(value)}
+
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _fingerprint_value(item, hasher, visited)
+    elif isinstance(value, dict):
+        for key, item in sorted(value.items(), key=lambda kv: repr(kv[0])):
+            _fingerprint_value(key, hasher, visited)
+            _fingerprint_value(item, hasher, visited)
+    elif isinstance(value, (set, frozenset)):
+        for item in sorted(value, key=repr):
+            _fingerprint_value(item, hasher, visited)
+    elif isinstance(value, types.ModuleType):
+        hasher.update(value.__name__.encode())
+    elif isinstance(value, types.FunctionType):
+        _fingerprint_function(value, hasher, visited)
+    elif isinstance(value, types.MethodType):
+        _fingerprint_value(value.__func__, hasher, visited)
+        _fingerprint_value(value.__self__, hasher, visited)
+    elif isinstance(value, types.BuiltinFunctionType):
+        hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif inspect.isclass(value):
+        hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+        for name, attribute in sorted(vars(value).items()):
+            if isinstance(attribute, (staticmethod, classmethod)):
+                attribute = attribute.__func__
+            if isinstance(attribute, types.FunctionType):
+                hasher.update(name.encode())
+                _fingerprint_function(attribute, hasher, visited)
+    elif hasattr(value, "__dict__"):
+        _fingerprint_value(type(value), hasher, visited)
+        _fingerprint_value(vars(value), hasher, visited)
+    else:
+        try:
+            hasher.update(pickle.dumps(value))
+        except Exception as e:
+            raise _UnfingerprintableError(
+                f"{type(value).__qualname__} can't be fingerprinted: {e}"
+            )
+
+
+def _fingerprint_function(
+    fn: types.FunctionType, hasher: "hashlib._Hash", visited: Set[int]
+) -> None:
+    hasher.update(f"{fn.__module__}.{fn.__qualname__}".encode())
+    if not _is_library_module(fn.__module__):
+        # Only the functions of the application are hashed by their code. The
+        # library functions are identified by their names, but they can wrap UDFs in
+        # their closures.
+        _fingerprint_code(fn.__code__, fn.__globals__, hasher, visited)
+    _fingerprint_value(fn.__defaults__, hasher, visited)
+    _fingerprint_value(fn.__kwdefaults__, hasher, visited)
+    for cell in fn.__closure__ or []:
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # Empty cell.
+            contents = None
+        _fingerprint_value(contents, hasher, visited)
+
+
+def _fingerprint_code(
+    code: types.CodeType, globals: dict, hasher: "hashlib._Hash", visited: Set[int]
+) -> None:
+    hasher.update(code.co_code)
+    for name in code.co_names:
+        hasher.update(name.encode())
+        if name in globals:
+            _fingerprint_value(globals[name], hasher, visited)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _fingerprint_code(const, globals, hasher, visited)
+        else:
+            _fingerprint_value(const, hasher, visited)
+
+
+def _is_library_module(module_name: Optional[str]) -> bool:
+    """Whether the module is part of the standard library or of an installed
+    package."""
+    if module_name is None:
+        return True
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    if module_file is None:
+        return module_name in sys.builtin_module_names
+    return (
+        "site-packages" in module_file
+        or "dist-packages" in module_file
+        or module_file.startswith(sysconfig.get_paths()["stdlib"])
+    )
+
+
+def _file_exists(filesystem: "pyarrow.fs.FileSystem", path: str) -> bool:
+    from pyarrow.fs import FileType
+
+    return filesystem.get_file_info(path).type != FileType.NotFound
+
+
+def _read_cached_block(filesystem: "pyarrow.fs.FileSystem", path: str) -> Block:
+    import pyarrow as pa
+
+    filesystem = _unwrap_s3_serialization_workaround(filesystem)
+    # Memory-map the local files.
+    with ArrowIPCDatasource()._open_input_source(filesystem, path) as f:
+        return pa.ipc.open_file(f).read_all()
+
+
+def _write_cached_block(
+    block: Block, filesystem: "pyarrow.fs.FileSystem", path: str
+) -> None:
+    import pyarrow as pa
+
+    filesystem = _unwrap_s3_serialization_workaround(filesystem)
+    table = BlockAccessor.for_block(block).to_arrow()
+    with filesystem.open_output_stream(path) as f:
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING
+
+from ray.data._internal.execution.interfaces import (
+    ExecutionResources,
+    PhysicalOperator,
+)
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+
+class BackpressurePolicy:
+    """Interface for policies that throttle the dispatch of new inputs to operators
+    in the streaming executor.
+
+    Policies are enabled by adding their classes to
+    ``DataContext.backpressure_policies``. The streaming executor creates one instance
+    of each policy per execution, and only dispatches inputs to the operators that all
+    the policies allow, in addition to its own resource limits.
+    """
+
+    def __init__(self, topology: "Topology"):
+        """Create the policy for an execution.
+
+        Args:
+            topology: The execution state of the operators. It's updated in place as
+                the execution progresses.
+        """
+        self._topology = topology
+
+    def can_add_input(self, op: PhysicalOperator, limits: ExecutionResources) -> bool:
+        """Return whether a new input can be dispatched to the operator.
+
+        Args:
+            op: The operator that has queued inputs.
+            limits: The current resource limits of the execution.
+        """
+        raise NotImplementedError
+
+
+class MemoryBudgetBackpressurePolicy(BackpressurePolicy):
+    """Backpressure policy that gives every operator a budget of object store memory.
+
+    The object store memory limit of the execution is shared equally by the operators,
+    but each operator reserves at least enough memory for the average output of one
+    of its tasks, as observed so far. An operator can only start processing a new
+    input if its memory usage plus the expected output of the new input fits in its
+    budget. The memory usage of an operator includes its internal buffers, the outputs
+    that are still queued for its downstream operators, and the expected outputs of
+    its active tasks.
+
+    This prevents fast upstream operators, e.g. reads, from filling the object store
+    (and spilling) while their outputs are queued for a slow downstream operator,
+    since their own budget runs out instead of the global limit.
+    """
+
+    def can_add_input(self, op: PhysicalOperator, limits: ExecutionResources) -> bool:
+        if op.throttling_disabled() or limits.object_store_memory is None:
+            return True
+        state = self._topology[op]
+        usage = self.memory_usage(op)
+        if usage == 0:
+            # Always allow some progress.
+            return True
+        expected_output = state.average_output_size_bytes()
+        return usage + expected_output <= self.memory_budget(op, limits)
+
+    def memory_budget(self, op: PhysicalOperator, limits: ExecutionResources) -> float:
+        """Return the object store memory reserved for the operator."""
+        num_ops = sum(1 for o in self._topology if not isinstance(o, InputDataBuffer))
+        share = limits.object_store_memory / max(1, num_ops)
+        return max(share, self._topology[op].average_output_size_bytes())
+
+    def memory_usage(self, op: PhysicalOperator) -> float:
+        """Return the current and expected object store memory usage of the outputs
+        of the operator."""
+        state = self._topology[op]
+        return (
+            (op.current_resource_usage().object_store_memory or 0)
+            + state.outqueue_memory_usage()
+            + op.num_active_work_refs() * state.average_output_size_bytes()
+        )
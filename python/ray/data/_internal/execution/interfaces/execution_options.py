@@ -98,6 +98,10 @@ class ExecutionOptions:
         actor_locality_enabled: Whether to enable locality-aware task dispatch to
             actors (on by default). This applies to both ActorPoolStrategy map and
             streaming_split operations.
+        task_locality_enabled: Whether to enable locality-aware dispatch of map tasks,
+            i.e. to prefer running each task on the node that holds most of its input
+            bytes. This applies to map operations that use the default scheduling
+            strategy and TaskPoolStrategy. Off by default.
         verbose_progress: Whether to report progress individually per operator. By
             default, only AllToAll operators and global progress is reported. This
             option is useful for performance debugging. Off by default.
@@ -111,4 +115,6 @@ class ExecutionOptions:
 
     actor_locality_enabled: bool = True
 
+    task_locality_enabled: bool = False
+
     verbose_progress: bool = bool(int(os.environ.get("RAY_DATA_VERBOSE_PROGRESS", "0")))
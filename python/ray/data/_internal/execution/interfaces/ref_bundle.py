@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import ray
 from .common import NodeIdStr
@@ -105,6 +105,22 @@ class RefBundle:
         else:
             return None  # Return None if cached location is "".
 
+    def get_location_bytes(self) -> Dict[NodeIdStr, int]:
+        """Return the number of bytes of this bundle's blocks stored on each node.
+
+        Blocks that are copied on multiple nodes are counted for each of them. Nodes
+        that don't hold any block of the bundle are omitted.
+        """
+        refs = [ref for ref, _ in self.blocks]
+        locs = ray.experimental.get_object_locations(refs)
+        location_bytes = {}
+        for ref, meta in self.blocks:
+            for node_id in locs[ref]["node_ids"]:
+                location_bytes[node_id] = (
+                    location_bytes.get(node_id, 0) + meta.size_bytes
+                )
+        return location_bytes
+
     def __eq__(self, other) -> bool:
         return self is other
 
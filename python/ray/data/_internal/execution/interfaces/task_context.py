@@ -36,3 +36,7 @@ class TaskContext:
     # The Ray remote arguments of the fused upstream MapOperator.
     # This should be set if upstream_map_transform_fn is set.
     upstream_map_ray_remote_args: Optional[Dict[str, Any]] = None
+
+    # The time at which the task was submitted, if the task is profiled. See
+    # `DataContext.task_profiling_enabled`.
+    submit_time_s: Optional[float] = None
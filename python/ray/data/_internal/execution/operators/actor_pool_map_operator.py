@@ -1,4 +1,5 @@
 import collections
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
@@ -97,6 +98,9 @@ class ActorPoolMapOperator(MapOperator):
         # Whether no more submittable bundles will be added.
         self._inputs_done = False
         self._next_task_idx = 0
+        # Number of actors added and removed by the autoscaling of the pool.
+        self._num_scale_ups = 0
+        self._num_scale_downs = 0
 
     def get_init_fn(self) -> Callable[[], None]:
         return self._init_fn
@@ -170,7 +174,7 @@ class ActorPoolMapOperator(MapOperator):
             # Submit the map task.
             bundle = self._bundle_queue.popleft()
             input_blocks = [block for block, _ in bundle.blocks]
-            ctx = TaskContext(task_idx=self._next_task_idx)
+            ctx = self._create_task_context()
             ref = actor.submit.options(num_returns="dynamic", name=self.name).remote(
                 self._transform_fn_ref, ctx, *input_blocks
             )
@@ -195,6 +199,10 @@ class ActorPoolMapOperator(MapOperator):
             num_running_workers=self._actor_pool.num_running_actors(),
         ):
             self._start_actor()
+            self._num_scale_ups += 1
+            # Measure the utilization of the resized pool from scratch, so that it's
+            # not scaled down right after being scaled up.
+            self._autoscaling_policy.reset_utilization_window()
 
     def _scale_down_if_needed(self):
         """Try to scale down the pool if the autoscaling policy allows it."""
@@ -211,6 +219,24 @@ class ActorPoolMapOperator(MapOperator):
                 # inactive worker exists. If there are no inactive workers to kill, we
                 # break out of the scale-down loop.
                 break
+            self._num_scale_downs += 1
+
+        # Also remove actors one at a time while the running actors are mostly idle,
+        # even if they are all picked for tasks from time to time.
+        busy_time_s, running_time_s = self._actor_pool.get_busy_time()
+        if (
+            self._autoscaling_policy.should_scale_down_underutilized(
+                num_total_workers=self._actor_pool.num_total_actors(),
+                busy_time_s=busy_time_s,
+                running_time_s=running_time_s,
+            )
+            and self._actor_pool.kill_inactive_actor()
+        ):
+            self._num_scale_downs += 1
+            logger.get_logger().debug(
+                f"{self._name}: Scaled the actor pool down to "
+                f"{self._actor_pool.num_total_actors()} actors due to low utilization."
+            )
 
     def notify_work_completed(
         self, ref: Union[ObjectRef[ObjectRefGenerator], ray.ObjectRef]
@@ -346,6 +372,11 @@ class ActorPoolMapOperator(MapOperator):
         if self._actor_locality_enabled:
             parent["locality_hits"] = self._actor_pool._locality_hits
             parent["locality_misses"] = self._actor_pool._locality_misses
+        busy_time_s, running_time_s = self._actor_pool.get_busy_time()
+        if running_time_s > 0:
+            parent["actor_utilization"] = round(busy_time_s / running_time_s, 2)
+        parent["actor_scale_ups"] = self._num_scale_ups
+        parent["actor_scale_downs"] = self._num_scale_downs
         return parent
 
     @staticmethod
@@ -415,6 +446,17 @@ class AutoscalingConfig:
     # Maximum ratio of idle workers to the total number of workers. If the pool goes
     # above this ratio, the pool will be scaled down.
     idle_to_total_workers_ratio: float = 0.5
+    # Minimum utilization of the running workers, i.e. the fraction of their running
+    # time that they spent executing tasks, over a utilization window. If the pool
+    # stays below this utilization for a whole window, it will be scaled down by one
+    # worker. Since the pool is only scaled up when all the worker slots are taken,
+    # the gap between the two thresholds prevents the pool size from oscillating.
+    # None disables utilization-based scale-down.
+    min_utilization: Optional[float] = 0.5
+    # Length of the utilization windows, in seconds. A new window starts after every
+    # scaling of the pool, so it's also the minimum delay before the pool can be scaled
+    # down after a change in its size.
+    utilization_window_s: float = 10.0
 
     def __post_init__(self):
         if self.min_workers < 1:
@@ -430,6 +472,16 @@ class AutoscalingConfig:
                 "max_tasks_in_flight must be >= 1, got: ",
                 self.max_tasks_in_flight,
             )
+        if self.min_utilization is not None and not 0 <= self.min_utilization <= 1:
+            raise ValueError(
+                "min_utilization must be between 0 and 1, got: ",
+                self.min_utilization,
+            )
+        if self.utilization_window_s <= 0:
+            raise ValueError(
+                "utilization_window_s must be > 0, got: ",
+                self.utilization_window_s,
+            )
 
     @classmethod
     def from_compute_strategy(cls, compute_strategy: ActorPoolStrategy):
@@ -452,6 +504,9 @@ class AutoscalingPolicy:
 
     def __init__(self, autoscaling_config: "AutoscalingConfig"):
         self._config = autoscaling_config
+        # The start time of the current utilization window, and the busy and running
+        # times of the pool at that time, or None if no window has started yet.
+        self._window_start: Optional[Tuple[float, float, float]] = None
 
     @property
     def min_workers(self) -> int:
@@ -523,6 +578,57 @@ class AutoscalingPolicy:
             > self._config.idle_to_total_workers_ratio
         )
 
+    def should_scale_down_underutilized(
+        self,
+        num_total_workers: int,
+        busy_time_s: float,
+        running_time_s: float,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Whether the actor pool should scale down by terminating an inactive actor,
+        because its running actors were underutilized over the last utilization window.
+
+        A decision is only made at the end of each utilization window, so this returns
+        True at most once per window.
+
+        Args:
+            num_total_workers: Total number of workers in actor pool.
+            busy_time_s: Total time spent executing tasks by the workers of the pool,
+                in worker-seconds.
+            running_time_s: Total running time of the workers of the pool, in
+                worker-seconds.
+            now: The current time, as returned by ``time.perf_counter()``.
+
+        Returns:
+            Whether the actor pool should be scaled down by one actor.
+        """
+        if (
+            self._config.min_utilization is None
+            or num_total_workers <= self._config.min_workers
+        ):
+            self._window_start = None
+            return False
+        if now is None:
+            now = time.perf_counter()
+        if self._window_start is None:
+            self._window_start = (now, busy_time_s, running_time_s)
+            return False
+        start, start_busy_time_s, start_running_time_s = self._window_start
+        if now - start < self._config.utilization_window_s:
+            return False
+        # Start the next window.
+        self._window_start = (now, busy_time_s, running_time_s)
+        running_time_s -= start_running_time_s
+        if running_time_s <= 0:
+            # No worker was running during the window, e.g. they are all pending.
+            return False
+        utilization = (busy_time_s - start_busy_time_s) / running_time_s
+        return utilization < self._config.min_utilization
+
+    def reset_utilization_window(self):
+        """Discard the current utilization window, e.g. after the pool was resized."""
+        self._window_start = None
+
 
 class _ActorPool:
     """A pool of actors for map task execution.
@@ -546,6 +652,14 @@ class _ActorPool:
         # Track locality matching stats.
         self._locality_hits: int = 0
         self._locality_misses: int = 0
+        # Time spent executing tasks by each running actor, in seconds. An actor is
+        # busy while it has at least one task in flight.
+        self._actor_busy_time_s: Dict[ray.actor.ActorHandle, float] = {}
+        # Total busy time and total running time of all the actors that ran in the
+        # pool, in actor-seconds, as of the last update.
+        self._busy_time_s: float = 0.0
+        self._running_time_s: float = 0.0
+        self._last_update_time = time.perf_counter()
 
     def add_pending_actor(self, actor: ray.actor.ActorHandle, ready_ref: ray.ObjectRef):
         """Adds a pending actor to the pool.
@@ -579,7 +693,9 @@ class _ActorPool:
             # the actor, we can safely drop this reference.
             return False
         actor = self._pending_actors.pop(ready_ref)
+        self._update_busy_time()
         self._num_tasks_in_flight[actor] = 0
+        self._actor_busy_time_s[actor] = 0.0
         self._actor_locations[actor] = ray.get(ready_ref)
         return True
 
@@ -624,6 +740,7 @@ class _ActorPool:
                 self._locality_hits += 1
             else:
                 self._locality_misses += 1
+        self._update_busy_time()
         self._num_tasks_in_flight[actor] += 1
         return actor
 
@@ -632,6 +749,7 @@ class _ActorPool:
         assert actor in self._num_tasks_in_flight
         assert self._num_tasks_in_flight[actor] > 0
 
+        self._update_busy_time()
         self._num_tasks_in_flight[actor] -= 1
         if self._should_kill_idle_actors and self._num_tasks_in_flight[actor] == 0:
             self._kill_running_actor(actor)
@@ -639,6 +757,32 @@ class _ActorPool:
     def get_pending_actor_refs(self) -> List[ray.ObjectRef]:
         return list(self._pending_actors.keys())
 
+    def get_busy_time(self) -> Tuple[float, float]:
+        """Return the total busy time and the total running time of all the actors
+        that ran in the pool so far, in actor-seconds.
+
+        The ratio of the differences of these times between two calls is the
+        utilization of the pool in between.
+        """
+        self._update_busy_time()
+        return self._busy_time_s, self._running_time_s
+
+    def _update_busy_time(self):
+        """Account the time elapsed since the last update to the busy and running
+        times of the actors.
+
+        This must be called before any change to the set of running actors or to their
+        number of tasks in flight.
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last_update_time
+        self._last_update_time = now
+        for actor, num_tasks_in_flight in self._num_tasks_in_flight.items():
+            if num_tasks_in_flight > 0:
+                self._actor_busy_time_s[actor] += elapsed
+                self._busy_time_s += elapsed
+        self._running_time_s += elapsed * len(self._num_tasks_in_flight)
+
     def num_total_actors(self) -> int:
         """Return the total number of actors managed by this pool, including pending
         actors
@@ -698,11 +842,18 @@ class _ActorPool:
         return False
 
     def _maybe_kill_idle_actor(self) -> bool:
-        for actor, tasks_in_flight in self._num_tasks_in_flight.items():
-            if tasks_in_flight == 0:
-                # At least one idle actor, so kill first one found.
-                self._kill_running_actor(actor)
-                return True
+        idle_actors = [
+            actor
+            for actor, tasks_in_flight in self._num_tasks_in_flight.items()
+            if tasks_in_flight == 0
+        ]
+        if idle_actors:
+            # At least one idle actor, so kill the one that was busy for the shortest
+            # time, since it's the least useful.
+            self._kill_running_actor(
+                min(idle_actors, key=self._actor_busy_time_s.__getitem__)
+            )
+            return True
         # No idle actors, so indicate to the caller that no actors were killed.
         return False
 
@@ -748,7 +899,9 @@ class _ActorPool:
     def _kill_running_actor(self, actor: ray.actor.ActorHandle):
         """Kill the provided actor and remove it from the pool."""
         ray.kill(actor)
+        self._update_busy_time()
         del self._num_tasks_in_flight[actor]
+        del self._actor_busy_time_s[actor]
 
     def _kill_pending_actor(self, ready_ref: ray.ObjectRef):
         """Kill the provided pending actor and remove it from the pool."""
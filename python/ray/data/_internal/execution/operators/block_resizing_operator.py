@@ -0,0 +1,186 @@
+import collections
+import math
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import ray
+from ray._raylet import ObjectRefGenerator
+from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
+from ray.data._internal.execution.operators.base_physical_operator import (
+    OneToOneOperator,
+)
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.output_buffer import BlockOutputBuffer
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.types import ObjectRef
+
+
+class BlockResizingOperator(OneToOneOperator):
+    """An operator that keeps the sizes of the blocks within a target range.
+
+    Blocks whose sizes are within the range are passed through without launching any
+    task. Consecutive blocks smaller than the minimum size are buffered, and merged by
+    a task once they add up to the minimum size. Blocks larger than the maximum size
+    are split by a task. The order of the blocks is preserved.
+    """
+
+    def __init__(
+        self,
+        input_op: PhysicalOperator,
+        min_block_size: int,
+        max_block_size: int,
+    ):
+        """Create a BlockResizingOperator.
+
+        Args:
+            input_op: Operator generating input data for this op.
+            min_block_size: The minimum size in bytes of the output blocks. Only the
+                last output block may be smaller.
+            max_block_size: The maximum size in bytes of the output blocks.
+        """
+        assert 0 <= min_block_size <= max_block_size, (min_block_size, max_block_size)
+        self._min_block_size = min_block_size
+        self._max_block_size = max_block_size
+        # The small blocks waiting to be merged, and whether they are all owned.
+        self._small_blocks: List[Tuple[ObjectRef[Block], BlockMetadata]] = []
+        self._small_blocks_size = 0
+        self._small_blocks_owned = True
+        # The outputs in order, either as bundles or as the refs of the resizing tasks
+        # that produce them.
+        self._outputs: Deque[
+            Union[RefBundle, ObjectRef[ObjectRefGenerator]]
+        ] = collections.deque()
+        # The inputs of the running resizing tasks.
+        self._tasks: Dict[ObjectRef[ObjectRefGenerator], RefBundle] = {}
+        # The outputs of the completed resizing tasks.
+        self._task_outputs: Dict[ObjectRef[ObjectRefGenerator], RefBundle] = {}
+        self._output_metadata: List[BlockMetadata] = []
+        self._num_merged_blocks = 0
+        self._num_split_blocks = 0
+        super().__init__("BlockResizing", input_op)
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0, input_index
+        for block, metadata in refs.blocks:
+            if metadata.size_bytes < self._min_block_size:
+                self._small_blocks.append((block, metadata))
+                self._small_blocks_size += metadata.size_bytes
+                self._small_blocks_owned &= refs.owns_blocks
+                if self._small_blocks_size >= self._min_block_size:
+                    self._flush_small_blocks()
+                continue
+            self._flush_small_blocks()
+            if metadata.size_bytes > self._max_block_size:
+                self._num_split_blocks += 1
+                self._submit_resizing_task(
+                    RefBundle([(block, metadata)], owns_blocks=refs.owns_blocks)
+                )
+            else:
+                self._outputs.append(
+                    RefBundle([(block, metadata)], owns_blocks=refs.owns_blocks)
+                )
+
+    def all_inputs_done(self) -> None:
+        self._flush_small_blocks()
+        super().all_inputs_done()
+
+    def _flush_small_blocks(self):
+        """Merge the buffered small blocks into a single block."""
+        if not self._small_blocks:
+            return
+        bundle = RefBundle(self._small_blocks, owns_blocks=self._small_blocks_owned)
+        if len(self._small_blocks) == 1:
+            self._outputs.append(bundle)
+        else:
+            self._num_merged_blocks += len(self._small_blocks)
+            self._submit_resizing_task(bundle)
+        self._small_blocks = []
+        self._small_blocks_size = 0
+        self._small_blocks_owned = True
+
+    def _submit_resizing_task(self, bundle: RefBundle):
+        resize_blocks = cached_remote_fn(_resize_blocks, num_returns="dynamic")
+        input_blocks = [block for block, _ in bundle.blocks]
+        ref = resize_blocks.remote(self._max_block_size, *input_blocks)
+        self._tasks[ref] = bundle
+        self._outputs.append(ref)
+
+    def notify_work_completed(self, ref: ObjectRef[ObjectRefGenerator]) -> None:
+        inputs = self._tasks.pop(ref)
+        self._task_outputs[ref] = MapOperator._map_ref_to_ref_bundle(ref)
+        # The inputs were copied into the outputs.
+        inputs.destroy_if_owned()
+
+    def get_work_refs(self) -> List[ray.ObjectRef]:
+        return list(self._tasks.keys())
+
+    def has_next(self) -> bool:
+        if not self._outputs:
+            return False
+        output = self._outputs[0]
+        return isinstance(output, RefBundle) or output in self._task_outputs
+
+    def get_next(self) -> RefBundle:
+        output = self._outputs.popleft()
+        if not isinstance(output, RefBundle):
+            output = self._task_outputs.pop(output)
+        self._output_metadata.extend(metadata for _, metadata in output.blocks)
+        return output
+
+    def get_stats(self) -> StatsDict:
+        return {self._name: self._output_metadata}
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "num_merged_blocks": self._num_merged_blocks,
+            "num_split_blocks": self._num_split_blocks,
+        }
+
+    def num_outputs_total(self) -> Optional[int]:
+        # The number of output bundles depends on the sizes of the blocks.
+        return None
+
+
+def _resize_blocks(
+    max_block_size: int, *blocks: Block
+) -> Iterator[Union[Block, List[BlockMetadata]]]:
+    """Split a single block, or merge multiple blocks, into blocks of at most
+    ``max_block_size`` bytes.
+
+    This yields the output blocks, followed by the list of their metadata.
+    """
+    stats = BlockExecStats.builder()
+    if len(blocks) == 1:
+        accessor = BlockAccessor.for_block(blocks[0])
+        num_rows = accessor.num_rows()
+        num_splits = max(1, math.ceil(accessor.size_bytes() / max_block_size))
+        rows_per_split = max(1, math.ceil(num_rows / num_splits))
+        output_blocks = (
+            accessor.slice(start, min(start + rows_per_split, num_rows), copy=True)
+            for start in range(0, num_rows, rows_per_split)
+        )
+    else:
+        output_blocks = _merge_blocks(max_block_size, blocks)
+
+    output_metadata = []
+    for block in output_blocks:
+        accessor = BlockAccessor.for_block(block)
+        output_metadata.append(
+            accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        )
+        yield block
+        stats = BlockExecStats.builder()
+    yield output_metadata
+
+
+def _merge_blocks(max_block_size: int, blocks: Tuple[Block]) -> Iterator[Block]:
+    output = BlockOutputBuffer(None, max_block_size)
+    for block in blocks:
+        output.add_block(block)
+        if output.has_next():
+            yield output.next()
+    output.finalize()
+    if output.has_next():
+        yield output.next()
@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING, List, Optional
+
+from ray.data._internal.execution.interfaces import (
+    PhysicalOperator,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.execution.operators.base_physical_operator import (
+    AllToAllOperator,
+)
+
+if TYPE_CHECKING:
+    from ray.data._internal.planner.join import JoinTransformFn
+
+
+class JoinOperator(AllToAllOperator):
+    """A blocking operator that joins its two inputs once they are complete.
+
+    Unlike other AllToAllOperators, this operator has two input dependencies, the
+    left and right sides of the join.
+    """
+
+    def __init__(
+        self,
+        bulk_fn: "JoinTransformFn",
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        num_outputs: Optional[int] = None,
+        sub_progress_bar_names: Optional[List[str]] = None,
+        name: str = "Join",
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            bulk_fn: The blocking join function to run. The inputs are the lists of
+                left and right input ref bundles, and the outputs are the output ref
+                bundles and a stats dict.
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            num_outputs: The number of expected output bundles for progress bar.
+            sub_progress_bar_names: The names of internal sub progress bars.
+            name: The name of this operator.
+        """
+        super().__init__(
+            bulk_fn,
+            left_input_op,
+            num_outputs=num_outputs,
+            sub_progress_bar_names=sub_progress_bar_names,
+            name=name,
+        )
+        self._input_dependencies.append(right_input_op)
+        right_input_op._output_dependencies.append(self)
+        self._right_input_buffer: List[RefBundle] = []
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._input_buffer.append(refs)
+        else:
+            self._right_input_buffer.append(refs)
+
+    def all_inputs_done(self) -> None:
+        ctx = TaskContext(
+            task_idx=self._next_task_index,
+            sub_progress_bar_dict=self._sub_progress_bar_dict,
+        )
+        self._output_buffer, self._stats = self._bulk_fn(
+            self._input_buffer, self._right_input_buffer, ctx
+        )
+        self._next_task_index += 1
+        self._input_buffer.clear()
+        self._right_input_buffer.clear()
+        PhysicalOperator.all_inputs_done(self)
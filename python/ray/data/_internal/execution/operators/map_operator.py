@@ -1,5 +1,6 @@
 import copy
 import itertools
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, replace
 from typing import Any, Callable, Dict, Iterator, List, Optional, Union
@@ -24,6 +25,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
 )
 from ray.data._internal.memory_tracing import trace_allocation
 from ray.data._internal.stats import StatsDict
+from ray.data._internal.task_profiler import TaskProfiler, set_current_profiler
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import DataContext
 from ray.types import ObjectRef
@@ -63,6 +65,7 @@ class MapOperator(OneToOneOperator, ABC):
         self._output_queue: _OutputQueue = None
         # Output metadata, added to on get_next().
         self._output_metadata: List[BlockMetadata] = []
+        self._task_profiling_enabled = DataContext.get_current().task_profiling_enabled
 
         super().__init__(name, input_op)
 
@@ -234,6 +237,14 @@ class MapOperator(OneToOneOperator, ABC):
         """
         raise NotImplementedError
 
+    def _create_task_context(self) -> TaskContext:
+        """Create the context of the next task, which is profiled if task profiling
+        is enabled."""
+        ctx = TaskContext(task_idx=self._next_task_idx)
+        if self._task_profiling_enabled:
+            ctx.submit_time_s = time.time()
+        return ctx
+
     def _handle_task_submitted(self, task: "_TaskState"):
         """Handle a newly submitted task, notifying the output queue and updating
         object store metrics.
@@ -408,17 +419,36 @@ def _map_task(
 
     Returns:
         A generator of blocks, followed by the list of BlockMetadata for the blocks
-        as the last generator return.
+        as the last generator return. If the task is profiled, its profile is
+        attached to the stats of the last block.
     """
     output_metadata = []
-    stats = BlockExecStats.builder()
-    for b_out in fn(iter(blocks), ctx):
-        # TODO(Clark): Add input file propagation from input blocks.
-        m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
-        m_out.exec_stats = stats.build()
-        output_metadata.append(m_out)
-        yield b_out
+    profiler = None
+    if ctx.submit_time_s is not None:
+        profiler = TaskProfiler(
+            ctx.task_idx,
+            ray.get_runtime_context().get_node_id(),
+            ctx.submit_time_s,
+        )
+        set_current_profiler(profiler)
+    try:
         stats = BlockExecStats.builder()
+        for b_out in fn(iter(blocks), ctx):
+            # TODO(Clark): Add input file propagation from input blocks.
+            m_out = BlockAccessor.for_block(b_out).get_metadata([], None)
+            m_out.exec_stats = stats.build()
+            output_metadata.append(m_out)
+            yield_start_s = time.time()
+            yield b_out
+            if profiler is not None:
+                # The block is serialized into the object store when it's yielded.
+                profiler.record("serialization", yield_start_s, time.time())
+            stats = BlockExecStats.builder()
+    finally:
+        if profiler is not None:
+            set_current_profiler(None)
+    if profiler is not None and output_metadata:
+        output_metadata[-1].exec_stats.task_profile = profiler.finish()
     yield output_metadata
 
 
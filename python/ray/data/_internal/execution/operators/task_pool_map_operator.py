@@ -3,19 +3,22 @@ from typing import Any, Callable, Dict, Iterator, List, Optional
 import ray
 from ray._raylet import ObjectRefGenerator
 from ray.data._internal.execution.interfaces import (
+    ExecutionOptions,
     ExecutionResources,
+    NodeIdStr,
     PhysicalOperator,
     RefBundle,
-    TaskContext,
 )
 from ray.data._internal.execution.operators.map_operator import (
     MapOperator,
     _map_task,
     _TaskState,
 )
+from ray.data._internal.execution.util import locality_string
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data.block import Block
 from ray.types import ObjectRef
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 
 class TaskPoolMapOperator(MapOperator):
@@ -46,25 +49,78 @@ class TaskPoolMapOperator(MapOperator):
         )
         self._tasks: Dict[ObjectRef[ObjectRefGenerator], _TaskState] = {}
         self._next_task_idx = 0
+        # The number of input bytes on each node for the running tasks that were
+        # scheduled with locality.
+        self._task_location_bytes: Dict[
+            ObjectRef[ObjectRefGenerator], Dict[NodeIdStr, int]
+        ] = {}
+        # Track locality matching stats, i.e. whether the tasks scheduled with
+        # locality ran on the node that holds most of their input bytes.
+        self._locality_hits = 0
+        self._locality_misses = 0
+        self._remote_input_bytes = 0
+
+    def start(self, options: ExecutionOptions):
+        super().start(options)
+        # Locality is only applied if neither the user nor locality_with_output chose
+        # where to run the tasks.
+        self._task_locality_enabled = (
+            options.task_locality_enabled
+            and "scheduling_strategy" not in self._ray_remote_args
+            and not self._ray_remote_args_factory
+        )
 
     def _add_bundled_input(self, bundle: RefBundle):
         # Submit the task as a normal Ray task.
         map_task = cached_remote_fn(_map_task, num_returns="dynamic")
         input_blocks = [block for block, _ in bundle.blocks]
-        ctx = TaskContext(task_idx=self._next_task_idx)
-        ref = map_task.options(
-            **self._get_runtime_ray_remote_args(input_bundle=bundle), name=self.name
-        ).remote(self._transform_fn_ref, ctx, *input_blocks)
+        ctx = self._create_task_context()
+        ray_remote_args = self._get_runtime_ray_remote_args(input_bundle=bundle)
+        location_bytes = None
+        if self._task_locality_enabled:
+            location_bytes = bundle.get_location_bytes()
+            if location_bytes:
+                # Prefer the node that holds most of the input bytes, but let the
+                # task run elsewhere if that node is busy, so as not to delay it.
+                ray_remote_args["scheduling_strategy"] = NodeAffinitySchedulingStrategy(
+                    max(location_bytes, key=location_bytes.get),
+                    soft=True,
+                    _spill_on_unavailable=True,
+                )
+        ref = map_task.options(**ray_remote_args, name=self.name).remote(
+            self._transform_fn_ref, ctx, *input_blocks
+        )
         self._next_task_idx += 1
         task = _TaskState(bundle)
         self._tasks[ref] = task
+        if location_bytes:
+            self._task_location_bytes[ref] = location_bytes
         self._handle_task_submitted(task)
 
     def notify_work_completed(self, ref: ObjectRef[ObjectRefGenerator]):
         task: _TaskState = self._tasks.pop(ref)
+        location_bytes = self._task_location_bytes.pop(ref, None)
         task.output = self._map_ref_to_ref_bundle(ref)
+        if location_bytes and task.output.blocks:
+            self._update_locality_stats(task, location_bytes)
         self._handle_task_done(task)
 
+    def _update_locality_stats(
+        self, task: _TaskState, location_bytes: Dict[NodeIdStr, int]
+    ):
+        """Record whether a task scheduled with locality ran on its preferred node."""
+        # The outputs of a task are computed on the node that ran it.
+        exec_stats = task.output.blocks[0][1].exec_stats
+        if exec_stats is None:
+            return
+        preferred_node = max(location_bytes, key=location_bytes.get)
+        if exec_stats.node_id == preferred_node:
+            self._locality_hits += 1
+        else:
+            self._locality_misses += 1
+        local_bytes = location_bytes.get(exec_stats.node_id, 0)
+        self._remote_input_bytes += max(0, task.inputs.size_bytes() - local_bytes)
+
     def shutdown(self):
         task_refs = self.get_work_refs()
         # Cancel all active tasks.
@@ -82,6 +138,8 @@ class TaskPoolMapOperator(MapOperator):
         super().shutdown()
 
     def progress_str(self) -> str:
+        if self._task_locality_enabled:
+            return locality_string(self._locality_hits, self._locality_misses)
         return ""
 
     def get_work_refs(self) -> List[ray.ObjectRef]:
@@ -106,3 +164,11 @@ class TaskPoolMapOperator(MapOperator):
             cpu=self._ray_remote_args.get("num_cpus", 0),
             gpu=self._ray_remote_args.get("num_gpus", 0),
         )
+
+    def get_metrics(self) -> Dict[str, int]:
+        metrics = super().get_metrics()
+        if self._task_locality_enabled:
+            metrics["locality_hits"] = self._locality_hits
+            metrics["locality_misses"] = self._locality_misses
+            metrics["remote_input_bytes"] = self._remote_input_bytes
+        return metrics
@@ -2,13 +2,14 @@ import os
 import threading
 import time
 import uuid
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional
 
 import ray
 from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data._internal.execution.autoscaling_requester import (
     get_or_create_autoscaling_requester_actor,
 )
+from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -72,6 +73,7 @@ class StreamingExecutor(Executor, threading.Thread):
         # generator `yield`s.
         self._topology: Optional[Topology] = None
         self._output_node: Optional[OpState] = None
+        self._backpressure_policies: List[BackpressurePolicy] = []
 
         Executor.__init__(self, options)
         threading.Thread.__init__(self, daemon=True)
@@ -100,6 +102,10 @@ class StreamingExecutor(Executor, threading.Thread):
 
         # Setup the streaming DAG topology and start the runner thread.
         self._topology, _ = build_streaming_topology(dag, self._options)
+        self._backpressure_policies = [
+            policy_cls(self._topology)
+            for policy_cls in DataContext.get_current().backpressure_policies
+        ]
 
         if not isinstance(dag, InputDataBuffer):
             # Note: DAG must be initialized in order to query num_outputs_total.
@@ -244,6 +250,7 @@ class StreamingExecutor(Executor, threading.Thread):
             ensure_at_least_one_running=self._consumer_idling(),
             execution_id=self._execution_id,
             autoscaling_state=self._autoscaling_state,
+            backpressure_policies=self._backpressure_policies,
         )
         i = 0
         while op is not None:
@@ -261,6 +268,7 @@ class StreamingExecutor(Executor, threading.Thread):
                 ensure_at_least_one_running=self._consumer_idling(),
                 execution_id=self._execution_id,
                 autoscaling_state=self._autoscaling_state,
+                backpressure_policies=self._backpressure_policies,
             )
 
         update_operator_states(topology)
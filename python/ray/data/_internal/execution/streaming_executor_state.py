@@ -13,6 +13,7 @@ import ray
 from ray.data._internal.execution.autoscaling_requester import (
     get_or_create_autoscaling_requester_actor,
 )
+from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -121,6 +122,8 @@ class OpState:
         self.op = op
         self.progress_bar = None
         self.num_completed_tasks = 0
+        # The total size of the bundles output by the operator so far.
+        self.output_size_bytes = 0
         self.inputs_done_called = False
         # Tracks whether `input_done` is called for each input op.
         self.input_done_called = [False] * len(op.input_dependencies)
@@ -168,6 +171,7 @@ class OpState:
         """Move a bundle produced by the operator to its outqueue."""
         self.outqueue.append(ref)
         self.num_completed_tasks += 1
+        self.output_size_bytes += ref.size_bytes()
         if self.progress_bar:
             self.progress_bar.update(1)
 
@@ -241,6 +245,13 @@ class OpState:
         """Return the object store memory of this operator's outqueue."""
         return self._queue_memory_usage(self.outqueue)
 
+    def average_output_size_bytes(self) -> float:
+        """Return the average size of the bundles output by the operator so far, or
+        zero if it hasn't output any yet."""
+        if self.num_completed_tasks == 0:
+            return 0
+        return self.output_size_bytes / self.num_completed_tasks
+
     def _queue_memory_usage(self, queue: Deque[RefBundle]) -> int:
         """Sum the object store memory usage in this queue.
 
@@ -380,6 +391,7 @@ def select_operator_to_run(
     ensure_at_least_one_running: bool,
     execution_id: str,
     autoscaling_state: AutoscalingState,
+    backpressure_policies: Optional[List[BackpressurePolicy]] = None,
 ) -> Optional[PhysicalOperator]:
     """Select an operator to run, if possible.
 
@@ -388,7 +400,8 @@ def select_operator_to_run(
 
     This is currently implemented by applying backpressure on operators that are
     producing outputs faster than they are consuming them `len(outqueue)`, as well as
-    operators with a large number of running tasks `num_processing()`.
+    operators with a large number of running tasks `num_processing()`. Operators can
+    be further throttled by the given `backpressure_policies`.
 
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
@@ -400,6 +413,13 @@ def select_operator_to_run(
     ops = []
     for op, state in topology.items():
         under_resource_limits = _execution_allowed(op, cur_usage, limits)
+        if under_resource_limits and state.num_queued() > 0 and not op.completed():
+            # The policies are only evaluated for the operators that have inputs to
+            # dispatch, since they can be expensive.
+            under_resource_limits = all(
+                policy.can_add_input(op, limits)
+                for policy in backpressure_policies or []
+            )
         if (
             op.need_more_inputs()
             and state.num_queued() > 0
@@ -110,7 +110,15 @@ class Sort(AbstractAllToAll):
         self,
         input_op: LogicalOperator,
         sort_key: SortKey,
+        split_heavy_keys: bool = False,
     ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            sort_key: The key to sort by.
+            split_heavy_keys: Whether the rows of heavy keys may be spread across
+                output blocks, if enabled by `DataContext.sort_split_heavy_keys`.
+        """
         super().__init__(
             "Sort",
             input_op,
@@ -121,6 +129,7 @@ class Sort(AbstractAllToAll):
             ],
         )
         self._sort_key = sort_key
+        self._split_heavy_keys = split_heavy_keys
 
 
 class Aggregate(AbstractAllToAll):
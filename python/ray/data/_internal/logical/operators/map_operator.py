@@ -1,12 +1,16 @@
 import inspect
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.logical.operators.one_to_one_operator import AbstractOneToOne
-from ray.data.block import UserDefinedFunction
+from ray.data.block import BlockAccessor, UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
+from ray.data.expressions import Expr
+
+if TYPE_CHECKING:
+    import pandas
 
 logger = DatasetLogger(__name__)
 
@@ -45,6 +49,9 @@ def _get_udf_name(fn: UserDefinedFunction) -> str:
         elif inspect.isfunction(fn):
             # normal function or lambda function.
             return fn.__name__
+        elif isinstance(fn, Expr):
+            # expression.
+            return repr(fn)
         else:
             # callable object.
             return fn.__class__.__name__
@@ -139,6 +146,32 @@ class MapBatches(AbstractUDFMap):
         return False
 
 
+class ColumnProjection:
+    """Batch UDF for ``Dataset.select_columns()`` and ``Dataset.drop_columns()``.
+
+    Unlike arbitrary UDFs, the optimizer knows which columns this function reads
+    and outputs, so that the projection can be pushed down into the read.
+    """
+
+    def __init__(self, cols: List[str], drop: bool = False):
+        self.cols = list(cols)
+        self.drop = drop
+
+    def __call__(self, batch: "pandas.DataFrame") -> "pandas.DataFrame":
+        if self.drop:
+            return batch.drop(columns=self.cols)
+        return BlockAccessor.for_block(batch).select(columns=self.cols)
+
+    def output_columns(self, input_columns: Optional[List[str]]) -> Optional[List[str]]:
+        """Return the columns output for the given input columns, or None if they
+        are unknown."""
+        if not self.drop:
+            return list(self.cols)
+        if input_columns is None:
+            return None
+        return [col for col in input_columns if col not in self.cols]
+
+
 class MapRows(AbstractUDFMap):
     """Logical operator for map."""
 
@@ -185,6 +218,32 @@ class Filter(AbstractUDFMap):
         return True
 
 
+class WithColumn(AbstractUDFMap):
+    """Logical operator for with_column."""
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        col: str,
+        expr: Expr,
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            "WithColumn",
+            input_op,
+            expr,
+            fn_args=(col,),
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._col = col
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+
 class FlatMap(AbstractUDFMap):
     """Logical operator for flat_map."""
 
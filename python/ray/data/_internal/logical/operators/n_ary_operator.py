@@ -1,3 +1,5 @@
+from typing import List, Optional, Tuple
+
 from ray.data._internal.logical.interfaces import LogicalOperator
 
 
@@ -39,3 +41,37 @@ class Union(NAry):
         *input_ops: LogicalOperator,
     ):
         super().__init__(*input_ops)
+
+
+class Join(NAry):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        key_columns: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+        num_outputs: Optional[int] = None,
+        broadcast: Optional[bool] = None,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            key_columns: The columns to join on.
+            how: The type of join, one of "inner", "left", "right" and "outer".
+            suffixes: The suffixes to add to the names of the non-key columns that
+                exist on both sides.
+            num_outputs: The number of output blocks of the join, if the inputs are
+                shuffled.
+            broadcast: Whether to broadcast the right side to the tasks joining the
+                left blocks, or None to decide based on the size of the right side.
+        """
+        super().__init__(left_input_op, right_input_op)
+        self._key_columns = key_columns
+        self._how = how
+        self._suffixes = suffixes
+        self._num_outputs = num_outputs
+        self._broadcast = broadcast
@@ -13,6 +13,7 @@ class Read(AbstractMap):
         read_tasks: List[ReadTask],
         estimated_num_blocks: int,
         ray_remote_args: Optional[Dict[str, Any]] = None,
+        read_args: Optional[Dict[str, Any]] = None,
     ):
         if len(read_tasks) == estimated_num_blocks:
             suffix = ""
@@ -22,6 +23,8 @@ class Read(AbstractMap):
         self._datasource = datasource
         self._estimated_num_blocks = estimated_num_blocks
         self._read_tasks = read_tasks
+        # The arguments the read tasks were created from.
+        self._read_args = read_args or {}
 
     def fusable(self) -> bool:
         """Whether this should be fused with downstream operators.
@@ -7,7 +7,10 @@ from ray.data._internal.logical.interfaces import (
     Rule,
 )
 from ray.data._internal.logical.rules import (
+    InsertBlockResizingRule,
     OperatorFusionRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
     ReorderRandomizeBlocksRule,
 )
 from ray.data._internal.planner.planner import Planner
@@ -17,10 +20,13 @@ from ray.data._internal.planner.planner import Planner
 # for Map/MapBatches ops.
 LOGICAL_OPTIMIZER_RULES = [
     ReorderRandomizeBlocksRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
 ]
 
 PHYSICAL_OPTIMIZER_RULES = [
     OperatorFusionRule,
+    InsertBlockResizingRule,
 ]
 
 
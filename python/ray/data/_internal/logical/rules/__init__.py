@@ -1,4 +1,13 @@
+from ray.data._internal.logical.rules.block_resizing import InsertBlockResizingRule
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
+from ray.data._internal.logical.rules.predicate_pushdown import PredicatePushdownRule
+from ray.data._internal.logical.rules.projection_pushdown import ProjectionPushdownRule
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 
-__all__ = ["ReorderRandomizeBlocksRule", "OperatorFusionRule"]
+__all__ = [
+    "ReorderRandomizeBlocksRule",
+    "OperatorFusionRule",
+    "InsertBlockResizingRule",
+    "PredicatePushdownRule",
+    "ProjectionPushdownRule",
+]
@@ -0,0 +1,57 @@
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.base_physical_operator import (
+    AllToAllOperator,
+)
+from ray.data._internal.execution.operators.block_resizing_operator import (
+    BlockResizingOperator,
+)
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.logical.interfaces import PhysicalPlan, Rule
+from ray.data.context import DataContext
+
+
+class InsertBlockResizingRule(Rule):
+    """Inserts a BlockResizingOperator after each map operator, if
+    `DataContext.block_resizing_enabled` is set.
+
+    This must be applied after operator fusion, since the inserted operators would
+    otherwise prevent the map operators from being fused. Map operators whose outputs
+    are consumed by all-to-all operators are left as they are, since all-to-all
+    operators produce their own output blocks.
+    """
+
+    def apply(self, plan: PhysicalPlan) -> PhysicalPlan:
+        ctx = DataContext.get_current()
+        if not ctx.block_resizing_enabled:
+            return plan
+        self._min_block_size = ctx.target_min_block_size
+        self._max_block_size = ctx.target_max_block_size
+        self._op_map = plan.op_map.copy()
+        dag = self._insert_block_resizing(plan.dag)
+        if isinstance(dag, MapOperator):
+            dag = self._create_block_resizing_op(dag)
+        return PhysicalPlan(dag, self._op_map)
+
+    def _insert_block_resizing(self, op: PhysicalOperator) -> PhysicalOperator:
+        """Insert the BlockResizingOperators between the upstream operators of the
+        given operator, and return the operator."""
+        for i, input_op in enumerate(op.input_dependencies):
+            input_op = self._insert_block_resizing(input_op)
+            if isinstance(input_op, MapOperator) and not isinstance(
+                op, AllToAllOperator
+            ):
+                input_op._output_dependencies.remove(op)
+                resizing_op = self._create_block_resizing_op(input_op)
+                resizing_op._output_dependencies.append(op)
+                op._input_dependencies[i] = resizing_op
+        return op
+
+    def _create_block_resizing_op(
+        self, input_op: PhysicalOperator
+    ) -> BlockResizingOperator:
+        resizing_op = BlockResizingOperator(
+            input_op, self._min_block_size, self._max_block_size
+        )
+        if input_op in self._op_map:
+            self._op_map[resizing_op] = self._op_map[input_op]
+        return resizing_op
@@ -0,0 +1,111 @@
+import copy
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Filter
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.rules.projection_pushdown import (
+    _get_projection,
+    _with_input_dependencies,
+)
+from ray.data.datasource.datasource import ReadTask
+from ray.data.expressions import Expr
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing filter expressions down into the Read operator.
+
+    Filters whose predicate is an ``Expr`` (e.g. ``ds.filter(col("a") > 1)``) are
+    moved upstream through operators that don't change the rows (other expression
+    filters and column projections), and when reaching a Read operator whose read
+    tasks all support it, merged into the read. Then:
+
+    - Read tasks whose column statistics (e.g. from Parquet file metadata) show that
+      no row can match are removed altogether.
+    - The remaining read tasks pass the predicate to the datasource, e.g. so that
+      Arrow skips the non-matching Parquet row groups and filters rows while decoding.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        """Push down the expression filters in the DAG rooted at `op`.
+
+        Returns the new operator. Operators are copied rather than modified in place,
+        since they may be shared by multiple Datasets.
+        """
+        new_inputs = [self._apply(x) for x in op.input_dependencies]
+        op = _with_input_dependencies(op, new_inputs)
+
+        predicate = _get_predicate(op)
+        if predicate is None:
+            return op
+        new_input_op = self._push_down(op.input_dependency, predicate)
+        if new_input_op is None:
+            return op
+        return new_input_op
+
+    def _push_down(
+        self, op: LogicalOperator, predicate: Expr
+    ) -> Optional[LogicalOperator]:
+        """Return a copy of `op` that only outputs the rows satisfying `predicate`,
+        or None if the predicate can't be pushed into `op`."""
+        if isinstance(op, Read):
+            return _filter_read(op, predicate)
+
+        projection = _get_projection(op)
+        if projection is not None:
+            columns = predicate._columns()
+            if projection.drop:
+                can_push = not columns & set(projection.cols)
+            else:
+                can_push = columns <= set(projection.cols)
+            if not can_push:
+                return None
+        elif _get_predicate(op) is None:
+            return None
+
+        new_input_op = self._push_down(op.input_dependency, predicate)
+        if new_input_op is None:
+            return None
+        return _with_input_dependencies(op, [new_input_op])
+
+
+def _get_predicate(op: LogicalOperator) -> Optional[Expr]:
+    """Return the predicate of `op` if it's an expression filter."""
+    if isinstance(op, Filter) and isinstance(op._fn, Expr):
+        return op._fn
+    return None
+
+
+def _filter_read(op: Read, predicate: Expr) -> Optional[Read]:
+    if not op._read_tasks or not all(
+        task._supports_filter_pushdown() for task in op._read_tasks
+    ):
+        return None
+
+    read_tasks: List[ReadTask] = []
+    for task in op._read_tasks:
+        if not task._could_match(predicate):
+            # None of the rows read by this task can satisfy the predicate.
+            continue
+        new_task = copy.copy(task)
+        new_task._set_read_filter(predicate)
+        read_tasks.append(new_task)
+    if not read_tasks:
+        # Keep a single read task, so that the schema of the output is preserved.
+        new_task = copy.copy(op._read_tasks[0])
+        new_task._set_read_filter(predicate)
+        read_tasks.append(new_task)
+
+    new_op = copy.copy(op)
+    new_op._read_tasks = read_tasks
+    # Keep the number of output blocks per read task.
+    blocks_per_task = op._estimated_num_blocks / len(op._read_tasks)
+    new_op._estimated_num_blocks = max(
+        len(read_tasks), int(blocks_per_task * len(read_tasks))
+    )
+    new_op._output_dependencies = []
+    return new_op
@@ -0,0 +1,170 @@
+import copy
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import (
+    ColumnProjection,
+    Filter,
+    MapBatches,
+    WithColumn,
+)
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.expressions import Expr
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing column projections down into the Read operator.
+
+    ``select_columns()`` and ``drop_columns()`` are planned as MapBatches operators
+    with a ``ColumnProjection`` UDF. Starting from such an operator, we walk the DAG
+    upstream through operators that don't change the set of columns (e.g. Limit,
+    expression filters, or other projections) or that only derive columns from
+    expressions (``with_column()``), and when reaching a Read operator,
+    restrict its read tasks to the required columns. Datasources such as Parquet and
+    CSV then skip reading and decoding the unused columns altogether.
+
+    If the Read operator then outputs exactly the projected columns, the projection
+    operator itself is removed from the DAG.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag, None)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(
+        self, op: LogicalOperator, required_columns: Optional[List[str]]
+    ) -> LogicalOperator:
+        """Push down the columns required by the downstream operators of `op`
+        (or None if all columns are required) into `op`.
+
+        Returns the new operator. Operators are copied rather than modified in place,
+        since they may be shared by multiple Datasets.
+        """
+        if isinstance(op, Read):
+            return self._prune_read(op, required_columns)
+
+        projection = _get_projection(op)
+        if projection is not None:
+            input_op = op.input_dependency
+            input_columns = _get_projection_input_columns(projection, input_op)
+            new_input_op = self._apply(input_op, input_columns)
+            if input_columns is not None and _get_output_columns(
+                new_input_op
+            ) == projection.output_columns(input_columns):
+                # The input already outputs the projected columns.
+                return new_input_op
+            return _with_input_dependencies(op, [new_input_op])
+
+        if isinstance(op, Limit):
+            # Limit doesn't change the columns, so keep pushing down.
+            new_inputs = [self._apply(op.input_dependency, required_columns)]
+        elif _is_expression_filter(op):
+            # Expression filters don't change the columns either, but also require
+            # the columns referenced by their predicate.
+            if required_columns is not None:
+                required_columns = required_columns + sorted(
+                    op._fn._columns() - set(required_columns)
+                )
+            new_inputs = [self._apply(op.input_dependency, required_columns)]
+        elif isinstance(op, WithColumn):
+            # The derived column is computed from the columns referenced by its
+            # expression.
+            if required_columns is not None:
+                required_columns = [c for c in required_columns if c != op._col]
+                required_columns += sorted(op._fn._columns() - set(required_columns))
+            new_inputs = [self._apply(op.input_dependency, required_columns)]
+        else:
+            new_inputs = [self._apply(x, None) for x in op.input_dependencies]
+        return _with_input_dependencies(op, new_inputs)
+
+    def _prune_read(self, op: Read, required_columns: Optional[List[str]]) -> Read:
+        if not required_columns:
+            return op
+        if not all(task._supports_column_pruning() for task in op._read_tasks):
+            return op
+        output_columns = _get_output_columns(op)
+        if output_columns == required_columns:
+            return op
+        if output_columns is not None and any(
+            col not in output_columns for col in required_columns
+        ):
+            # Let the projection operator raise the error for the missing columns.
+            return op
+
+        new_op = copy.copy(op)
+        new_op._read_tasks = []
+        for task in op._read_tasks:
+            new_task = copy.copy(task)
+            new_task._set_read_columns(required_columns)
+            new_op._read_tasks.append(new_task)
+        new_op._output_dependencies = []
+        return new_op
+
+
+def _get_projection(op: LogicalOperator) -> Optional[ColumnProjection]:
+    """Return the column projection performed by `op`, if any."""
+    if isinstance(op, MapBatches) and isinstance(op._fn, ColumnProjection):
+        return op._fn
+    return None
+
+
+def _get_projection_input_columns(
+    projection: ColumnProjection, input_op: LogicalOperator
+) -> Optional[List[str]]:
+    """Return the input columns required by `projection`, or None if they can't be
+    determined."""
+    if len(set(projection.cols)) != len(projection.cols):
+        return None
+    if not projection.drop:
+        return list(projection.cols)
+    input_columns = _get_output_columns(input_op)
+    if input_columns is None or any(
+        col not in input_columns for col in projection.cols
+    ):
+        return None
+    return projection.output_columns(input_columns)
+
+
+def _get_output_columns(op: LogicalOperator) -> Optional[List[str]]:
+    """Return the columns output by `op`, or None if they are unknown."""
+    if isinstance(op, Read):
+        if not op._read_tasks:
+            return None
+        task = op._read_tasks[0]
+        if task._read_columns is not None:
+            return list(task._read_columns)
+        names = getattr(task.get_metadata().schema, "names", None)
+        return list(names) if names is not None else None
+
+    projection = _get_projection(op)
+    if projection is not None:
+        return projection.output_columns(_get_output_columns(op.input_dependency))
+
+    if isinstance(op, Limit) or _is_expression_filter(op):
+        return _get_output_columns(op.input_dependency)
+    if isinstance(op, WithColumn):
+        input_columns = _get_output_columns(op.input_dependency)
+        if input_columns is None or op._col in input_columns:
+            return input_columns
+        return input_columns + [op._col]
+    return None
+
+
+def _is_expression_filter(op: LogicalOperator) -> bool:
+    return isinstance(op, Filter) and isinstance(op._fn, Expr)
+
+
+def _with_input_dependencies(
+    op: LogicalOperator, input_dependencies: List[LogicalOperator]
+) -> LogicalOperator:
+    """Return a copy of `op` with the given input dependencies, or `op` itself if
+    the input dependencies are unchanged."""
+    if all(new is old for new, old in zip(input_dependencies, op.input_dependencies)):
+        return op
+    new_op = copy.copy(op)
+    new_op._input_dependencies = input_dependencies
+    new_op._output_dependencies = []
+    for input_op in input_dependencies:
+        input_op._output_dependencies.append(new_op)
+    return new_op
@@ -46,6 +46,7 @@ _op_name_white_list = [
     "MapBatches",
     "Filter",
     "FlatMap",
+    "WithColumn",
     # All-to-all
     "RandomizeBlockOrder",
     "RandomShuffle",
@@ -55,6 +56,7 @@ _op_name_white_list = [
     # N-ary
     "Zip",
     "Union",
+    "Join",
 ]
 
 
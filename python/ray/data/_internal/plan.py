@@ -42,6 +42,7 @@ if TYPE_CHECKING:
     import pyarrow
 
     from ray.data._internal.execution.interfaces import Executor
+    from ray.data.datasource.datasource import _ColumnStatistics
 
 
 # Scheduling strategy can be inherited from prev stage if not specified.
@@ -477,6 +478,32 @@ class ExecutionPlan:
         # Snapshot is now guaranteed to be the final block or None.
         return self._get_num_rows_from_blocks_metadata(self._snapshot_blocks)
 
+    def meta_column_statistics(self) -> Optional[Dict[str, "_ColumnStatistics"]]:
+        """Get the statistics of the columns of the result Dataset from the metadata of
+        its read tasks, e.g. from the Parquet file footers, if possible.
+
+        This method will never trigger any computation.
+
+        Returns:
+            Mapping from column name to its statistics over all the read tasks, or
+            None if the plan transforms the read data, or if any read task has no
+            column statistics. Columns whose statistics are unknown for any read
+            task are omitted.
+        """
+        from ray.data.datasource.datasource import _merge_column_statistics
+
+        if not self.is_read_stage_equivalent():
+            return None
+        read_tasks = self._in_blocks._tasks
+        if not read_tasks or any(
+            read_task._column_statistics is None or read_task._read_filter is not None
+            for read_task in read_tasks
+        ):
+            return None
+        return _merge_column_statistics(
+            [read_task._column_statistics for read_task in read_tasks]
+        )
+
     def _get_num_rows_from_blocks_metadata(self, blocks: BlockList) -> Optional[int]:
         metadata = blocks.get_metadata() if blocks else None
         if metadata and all(m.num_rows is not None for m in metadata):
@@ -1,11 +1,14 @@
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
     RefBundle,
     TaskContext,
 )
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
     SortAggregateTaskSpec,
 )
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
@@ -21,6 +24,14 @@ from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.aggregate import AggregateFn
 from ray.data.context import DataContext
 
+# The supported values of `DataContext.aggregate_strategy`.
+AGGREGATE_STRATEGIES = ("sort", "hash", "auto")
+
+# With the "auto" strategy, the hash aggregate is used when the ratio of distinct keys
+# in the sampled keys is at most this. Few distinct keys make the map-side combining
+# effective, and would give duplicate (i.e. skewed) boundaries to the sort aggregate.
+HASH_AGGREGATE_MAX_DISTINCT_RATIO = 0.5
+
 
 def generate_aggregate_fn(
     key: Optional[str],
@@ -49,25 +60,41 @@ def generate_aggregate_fn(
             agg_fn._validate(unified_schema)
 
         num_mappers = len(blocks)
+        strategy = DataContext.get_current().aggregate_strategy
+        if strategy not in AGGREGATE_STRATEGIES:
+            raise ValueError(
+                f"Unknown aggregate strategy {strategy!r}, expected one of "
+                f"{AGGREGATE_STRATEGIES}."
+            )
 
         if key is None:
             num_outputs = 1
-            boundaries = []
+            agg_spec = SortAggregateTaskSpec(boundaries=[], key=key, aggs=aggs)
         else:
             # Use same number of output partitions.
             num_outputs = num_mappers
-            # Sample boundaries for aggregate key.
-            boundaries = SortTaskSpec.sample_boundaries(
-                blocks,
-                SortKey(key),
-                num_outputs,
-            )
+            sample_items = None
+            if strategy != "hash":
+                # Sample aggregate keys.
+                sample_items = SortTaskSpec.sample_keys(
+                    blocks,
+                    SortKey(key),
+                    num_outputs,
+                )
+            if strategy == "hash" or (
+                strategy == "auto" and _has_few_distinct_keys(sample_items)
+            ):
+                agg_spec = HashAggregateTaskSpec(key=key, aggs=aggs)
+            else:
+                boundaries = SortTaskSpec.boundaries_from_samples(
+                    sample_items, num_outputs
+                )
+                agg_spec = SortAggregateTaskSpec(
+                    boundaries=boundaries,
+                    key=key,
+                    aggs=aggs,
+                )
 
-        agg_spec = SortAggregateTaskSpec(
-            boundaries=boundaries,
-            key=key,
-            aggs=aggs,
-        )
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
         else:
@@ -76,3 +103,11 @@ def generate_aggregate_fn(
         return scheduler.execute(refs, num_outputs, ctx)
 
     return fn
+
+
+def _has_few_distinct_keys(sample_items: Optional[np.ndarray]) -> bool:
+    """Return whether the sorted sample of the keys has few distinct values."""
+    if sample_items is None:
+        return False
+    num_distinct = 1 + np.count_nonzero(sample_items[1:] != sample_items[:-1])
+    return num_distinct <= HASH_AGGREGATE_MAX_DISTINCT_RATIO * len(sample_items)
@@ -1,6 +1,9 @@
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.join_task_spec import hash_partition_ids
 from ray.data._internal.sort import SortKey
 from ray.data._internal.table_block import TableBlockAccessor
 from ray.data.aggregate import AggregateFn, Count
@@ -102,3 +105,77 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Unlike the sort-based aggregate, no boundaries need to be sampled before
+    shuffling, and the output blocks are not sorted with respect to each other.
+
+    Partial aggregate (`map`): each block is sorted and combined locally, so that it
+    has a single row per key (the combiner). The combined rows are then partitioned by
+    the hash of their key, and passed to a final aggregate task.
+
+    Final aggregate (`reduce`): each task would receive a block from every worker that
+    consists of the combined rows of the keys with a certain hash. It then merges the
+    sorted blocks and aggregates on-the-fly.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        aggs: List[AggregateFn],
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        [sorted_block] = BlockAccessor.for_block(block).sort_and_partition(
+            [], SortKey(key)
+        )
+        combined = BlockAccessor.for_block(sorted_block).combine(key, aggs)
+        accessor = BlockAccessor.for_block(combined)
+        if accessor.num_rows() == 0:
+            parts = [combined] * output_num_blocks
+        else:
+            keys = BlockAccessor.for_block(accessor.select([key])).to_arrow()
+            partition_ids = hash_partition_ids(keys, [key], output_num_blocks)
+            counts = np.bincount(partition_ids, minlength=output_num_blocks)
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            # Group the rows by output block, keeping them sorted by key within each
+            # group, and slice out each group.
+            combined = accessor.take(np.argsort(partition_ids, kind="stable"))
+            accessor = BlockAccessor.for_block(combined)
+            parts = [
+                accessor.slice(offsets[i], offsets[i + 1])
+                for i in range(output_num_blocks)
+            ]
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: List[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return BlockAccessor.for_block(mapper_outputs[0]).aggregate_combined_blocks(
+            list(mapper_outputs), key, aggs, finalize=not partial_reduce
+        )
@@ -26,6 +26,11 @@ class ExchangeTaskSpec:
     MAP_SUB_PROGRESS_BAR_NAME = "Shuffle Map"
     REDUCE_SUB_PROGRESS_BAR_NAME = "Shuffle Reduce"
 
+    # Whether `reduce` is a generator of output blocks followed by the list of their
+    # metadata, instead of returning a single block and its metadata. Only supported
+    # by `PullBasedShuffleTaskScheduler`.
+    REDUCE_RETURNS_GENERATOR = False
+
     def __init__(self, map_args: List[Any] = None, reduce_args: List[Any] = None):
         self._map_args = map_args or []
         self._reduce_args = reduce_args or []
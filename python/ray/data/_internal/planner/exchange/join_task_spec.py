@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+import numpy as np
+
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class JoinTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash partitioning the inputs of distributed join tasks.
+
+    Both sides of a join are shuffled with the same spec and number of output blocks,
+    so that the rows with equal keys end up in output blocks of the same index on
+    both sides. The output blocks are then joined pairwise.
+
+    Partitioning (`map`): the hash of the key columns of each row modulo the number of
+    output blocks gives the index of the output block of the row.
+
+    Combining (`reduce`): the map output blocks of the same index are concatenated.
+    """
+
+    JOIN_SUB_PROGRESS_BAR_NAME = "Join"
+
+    def __init__(self, key_columns: List[str]):
+        super().__init__(
+            map_args=[key_columns],
+            reduce_args=[],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key_columns: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        table = accessor.to_arrow()
+
+        partition_ids = hash_partition_ids(table, key_columns, output_num_blocks)
+        counts = np.bincount(partition_ids, minlength=output_num_blocks)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        # Group the rows by output block, and slice out each group.
+        table = table.take(np.argsort(partition_ids, kind="stable"))
+        parts = [table.slice(offsets[i], counts[i]) for i in range(output_num_blocks)]
+
+        meta = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        builder = DelegatingBlockBuilder()
+        for block in mapper_outputs:
+            builder.add_block(block)
+        new_block = builder.build()
+        accessor = BlockAccessor.for_block(new_block)
+        new_metadata = BlockMetadata(
+            num_rows=accessor.num_rows(),
+            size_bytes=accessor.size_bytes(),
+            schema=accessor.schema(),
+            input_files=None,
+            exec_stats=stats.build(),
+        )
+        return new_block, new_metadata
+
+
+def hash_partition_ids(
+    table: "pyarrow.Table", key_columns: List[str], num_partitions: int
+) -> np.ndarray:
+    """Return the index of the partition of each row of ``table``.
+
+    Rows with equal keys are assigned to the same partition, even across tables whose
+    key columns have different numeric types (e.g. int32 and float64), or contain
+    nulls.
+    """
+    import pandas as pd
+
+    keys = table.select(key_columns).to_pandas()
+    for column in keys.columns:
+        if pd.api.types.is_numeric_dtype(keys[column]) and not (
+            pd.api.types.is_bool_dtype(keys[column])
+        ):
+            # Integer columns with nulls are converted to floats, so convert all
+            # numbers to floats to hash them consistently. Adding 0.0 turns -0.0
+            # into 0.0.
+            keys[column] = keys[column].astype("float64") + 0.0
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return (hashes % num_partitions).astype(np.int64)
@@ -1,12 +1,16 @@
 from typing import Any, Dict, List, Optional, Tuple
 
+import ray
 from ray.data._internal.execution.interfaces import RefBundle, TaskContext
 from ray.data._internal.planner.exchange.interfaces import (
     ExchangeTaskScheduler,
     ExchangeTaskSpec,
 )
+from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockMetadata
+from ray.types import ObjectRef
 
 
 class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
@@ -75,6 +79,16 @@ class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         assert bar_name in sub_progress_bar_dict, sub_progress_bar_dict
         reduce_bar = sub_progress_bar_dict[bar_name]
 
+        if self._exchange_spec.REDUCE_RETURNS_GENERATOR:
+            return self._execute_generator_reduce(
+                shuffle_map_out,
+                shuffle_map_metadata,
+                output_num_blocks,
+                input_owned,
+                reduce_bar,
+                reduce_ray_remote_args,
+            )
+
         shuffle_reduce_out = [
             shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2).remote(
                 *self._exchange_spec._reduce_args,
@@ -107,3 +121,49 @@ class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         }
 
         return (output, stats)
+
+    def _execute_generator_reduce(
+        self,
+        shuffle_map_out: List[List[ObjectRef[Block]]],
+        shuffle_map_metadata: List[BlockMetadata],
+        output_num_blocks: int,
+        input_owned: bool,
+        reduce_bar: ProgressBar,
+        reduce_ray_remote_args: Dict[str, Any],
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        """Run reduce tasks that yield any number of output blocks each.
+
+        Each reduce task outputs a ref bundle of the blocks it yields.
+        """
+        shuffle_reduce = cached_remote_fn(self._exchange_spec.reduce)
+        shuffle_reduce_out = [
+            shuffle_reduce.options(
+                **reduce_ray_remote_args, num_returns="dynamic"
+            ).remote(
+                *self._exchange_spec._reduce_args,
+                *[map_out[j] for map_out in shuffle_map_out],
+            )
+            for j in range(output_num_blocks)
+        ]
+        generators = reduce_bar.fetch_until_complete(shuffle_reduce_out)
+
+        # The last item yielded by each reduce task is the list of BlockMetadata.
+        all_refs = [list(generator) for generator in generators]
+        all_metadata = ray.get([refs[-1] for refs in all_refs])
+
+        output = []
+        new_metadata = []
+        for refs, metadata in zip(all_refs, all_metadata):
+            block_refs = refs[:-1]
+            assert len(block_refs) == len(metadata), (block_refs, metadata)
+            new_metadata.extend(metadata)
+            if block_refs:
+                output.append(
+                    RefBundle(list(zip(block_refs, metadata)), owns_blocks=input_owned)
+                )
+        stats = {
+            "map": shuffle_map_metadata,
+            "reduce": new_metadata,
+        }
+
+        return (output, stats)
@@ -380,6 +380,7 @@ class PushBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         reduce_ray_remote_args: Optional[Dict[str, Any]] = None,
         merge_factor: int = 2,
     ) -> Tuple[List[RefBundle], StatsDict]:
+        assert not self._exchange_spec.REDUCE_RETURNS_GENERATOR, self._exchange_spec
         logger.info("Using experimental push-based shuffle.")
         # TODO: Preemptively clear the blocks list since we will incrementally delete
         # the last remaining references as we submit the dependent map tasks during the
@@ -1,4 +1,5 @@
-from typing import List, Tuple, TypeVar, Union
+import heapq
+from typing import Any, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -33,6 +34,12 @@ class SortTaskSpec(ExchangeTaskSpec):
     Merging (`reduce`): a merge task would receive a block from every worker that
     consists of items in a certain range. It then merges the sorted blocks into one
     sorted block and becomes part of the new, sorted block.
+
+    Heavy keys, i.e. keys that are so frequent that they make up several consecutive
+    boundaries, would all land in a single merge task. If `split_heavy_keys` is set,
+    the rows of each heavy key are instead spread evenly across the merge tasks of
+    the ranges that the key spans. This keeps the output sorted, but rows with the
+    same key may end up in different output blocks.
     """
 
     SORT_SAMPLE_SUB_PROGRESS_BAR_NAME = "Sort Sample"
@@ -41,9 +48,10 @@ class SortTaskSpec(ExchangeTaskSpec):
         self,
         boundaries: List[T],
         sort_key: SortKey,
+        split_heavy_keys: bool = False,
     ):
         super().__init__(
-            map_args=[boundaries, sort_key],
+            map_args=[boundaries, sort_key, split_heavy_keys],
             reduce_args=[sort_key],
         )
 
@@ -54,9 +62,12 @@ class SortTaskSpec(ExchangeTaskSpec):
         output_num_blocks: int,
         boundaries: List[T],
         sort_key: SortKey,
+        split_heavy_keys: bool,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(boundaries, sort_key)
+        if split_heavy_keys:
+            out = _split_heavy_keys(idx, out, boundaries, sort_key)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -80,6 +91,17 @@ class SortTaskSpec(ExchangeTaskSpec):
         Return (num_reducers - 1) items in ascending order from the blocks that
         partition the domain into ranges with approximately equally many elements.
         """
+        sample_items = SortTaskSpec.sample_keys(blocks, sort_key, num_reducers)
+        return SortTaskSpec.boundaries_from_samples(sample_items, num_reducers)
+
+    @staticmethod
+    def sample_keys(
+        blocks: List[ObjectRef[Block]], sort_key: SortKey, num_reducers: int
+    ) -> Optional[np.ndarray]:
+        """
+        Return a sorted sample of the sort key column of the blocks, or None if the
+        blocks are empty.
+        """
         columns = sort_key.get_columns()
         # TODO(Clark): Support multiple boundary sampling keys.
         if len(columns) > 1:
@@ -101,14 +123,25 @@ class SortTaskSpec(ExchangeTaskSpec):
         samples = [s for s in samples if len(s) > 0]
         # The dataset is empty
         if len(samples) == 0:
-            return [None] * (num_reducers - 1)
+            return None
         builder = DelegatingBlockBuilder()
         for sample in samples:
             builder.add_block(sample)
         samples = builder.build()
         column = columns[0]
         sample_items = BlockAccessor.for_block(samples).to_numpy(column)
-        sample_items = np.sort(sample_items)
+        return np.sort(sample_items)
+
+    @staticmethod
+    def boundaries_from_samples(
+        sample_items: Optional[np.ndarray], num_reducers: int
+    ) -> List[T]:
+        """
+        Return (num_reducers - 1) items in ascending order from the sorted sample
+        returned by `sample_keys`.
+        """
+        if sample_items is None:
+            return [None] * (num_reducers - 1)
         ret = [
             np.quantile(sample_items, q, interpolation="nearest")
             for q in np.linspace(0, 1, num_reducers)
@@ -116,5 +149,240 @@ class SortTaskSpec(ExchangeTaskSpec):
         return ret[1:]
 
 
+class ExternalSortTaskSpec(SortTaskSpec):
+    """
+    The implementation for distributed sort tasks with bounded reduce task memory.
+
+    Sampling and sorting are the same as for `SortTaskSpec`.
+
+    Merging (`reduce`): instead of concatenating and sorting all the blocks it
+    receives, a merge task does a k-way merge of windows of the sorted blocks (runs)
+    with a heap, and yields the merged rows as output blocks of bounded size as soon
+    as they are ready. Only about `memory_budget` bytes of rows are merged at once.
+    """
+
+    REDUCE_RETURNS_GENERATOR = True
+
+    def __init__(
+        self,
+        boundaries: List[T],
+        sort_key: SortKey,
+        memory_budget: int,
+        split_heavy_keys: bool = False,
+    ):
+        ExchangeTaskSpec.__init__(
+            self,
+            map_args=[boundaries, sort_key, split_heavy_keys],
+            reduce_args=[sort_key, memory_budget],
+        )
+
+    @staticmethod
+    def reduce(
+        sort_key: SortKey,
+        memory_budget: int,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Iterator[Union[Block, List[BlockMetadata]]]:
+        output_metadata = []
+        stats = BlockExecStats.builder()
+        for block in _merge_sorted_runs(list(mapper_outputs), sort_key, memory_budget):
+            meta = BlockAccessor.for_block(block).get_metadata(
+                input_files=None, exec_stats=stats.build()
+            )
+            output_metadata.append(meta)
+            yield block
+            stats = BlockExecStats.builder()
+        yield output_metadata
+
+
 def _sample_block(block: Block, n_samples: int, sort_key: SortKey) -> Block:
     return BlockAccessor.for_block(block).sample(n_samples, sort_key)
+
+
+def _split_heavy_keys(
+    idx: int, partitions: List[Block], boundaries: List[T], sort_key: SortKey
+) -> List[Block]:
+    """Spread the rows of the keys repeated in `boundaries` across the partitions
+    between the repeated boundaries.
+
+    The partitions are the output of `sort_and_partition()` for the boundaries. Since
+    it partitions the rows with `boundaries[i - 1] <= x < boundaries[i]` into
+    partition `i` (or `boundaries[i - 1] > x >= boundaries[i]` if descending), the
+    partitions between repeated boundaries are empty, and the rows equal to the
+    repeated key are at the start of the partition after them (or at the end of the
+    partition before them if descending).
+    """
+    col = sort_key.get_columns()[0]
+    descending = sort_key.get_descending()
+    partitions = list(partitions)
+    start = 0
+    while start < len(boundaries):
+        end = start + 1
+        while end < len(boundaries) and boundaries[end] == boundaries[start]:
+            end += 1
+        num_repeats, key = end - start, boundaries[start]
+        start = end
+        if num_repeats == 1 or key is None:
+            continue
+
+        # The indices of the partitions to spread the key across.
+        if descending:
+            targets = list(range(end - num_repeats, end))
+            source = targets[0]
+        else:
+            targets = list(range(end - num_repeats + 1, end + 1))
+            source = targets[-1]
+        accessor = BlockAccessor.for_block(partitions[source])
+        num_rows = accessor.num_rows()
+        if num_rows == 0:
+            continue
+        keys = accessor.to_numpy(col)
+        if descending:
+            key_start = num_rows - _count_leading(keys[::-1], key)
+            key_end = num_rows
+        else:
+            key_start, key_end = 0, _count_leading(keys, key)
+
+        # Split the rows of the key into contiguous slices of (almost) equal sizes.
+        # The larger slices are rotated by the map task index, so that they are
+        # evenly spread across the merge tasks.
+        num_key_rows = key_end - key_start
+        sizes = [num_key_rows // num_repeats] * num_repeats
+        for i in range(num_key_rows % num_repeats):
+            sizes[(i + idx) % num_repeats] += 1
+        offsets = np.concatenate([[key_start], key_start + np.cumsum(sizes)])
+        # The rows of the other keys stay in the first (or last) partition.
+        offsets[0], offsets[-1] = 0, num_rows
+        for i, target in enumerate(targets):
+            partitions[target] = accessor.slice(offsets[i], offsets[i + 1])
+    return partitions
+
+
+def _count_leading(keys: np.ndarray, key: T) -> int:
+    """Return the number of leading items of `keys` equal to `key`."""
+    not_equal = keys != key
+    if not not_equal.any():
+        return len(keys)
+    return int(np.argmax(not_equal))
+
+
+class _Descending:
+    """Heap key that reverses the order of `value`."""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+
+class _RunKeys:
+    """The sort keys of a sorted run, compared as tuples of the sort columns."""
+
+    def __init__(self, run: Block, sort_key: SortKey):
+        accessor = BlockAccessor.for_block(run)
+        self._columns = [accessor.to_numpy(c) for c in sort_key.get_columns()]
+        self._descending = sort_key.get_descending()
+        self._num_rows = accessor.num_rows()
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def key_at(self, idx: int) -> Tuple[Any, ...]:
+        return tuple(column[idx] for column in self._columns)
+
+    def num_rows_until(self, pivot: Tuple[Any, ...]) -> int:
+        """Return the number of rows that are sorted before or equal to `pivot`."""
+        if len(self._columns) == 1:
+            keys = self._columns[0]
+            if self._descending:
+                return len(keys) - np.searchsorted(keys[::-1], pivot[0], "left")
+            return np.searchsorted(keys, pivot[0], "right")
+        # Binary search for the first row sorted after the pivot.
+        lo, hi = 0, self._num_rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key = self.key_at(mid)
+            if (pivot < key) if not self._descending else (key < pivot):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+
+def _merge_sorted_runs(
+    runs: List[Block], sort_key: SortKey, memory_budget: int
+) -> Iterator[Block]:
+    """Merge the blocks sorted by `sort_key` into sorted blocks of bounded size.
+
+    At every step, the run whose next window of rows ends with the smallest key (the
+    pivot) is popped from a heap, and the rows up to the pivot are merged from all
+    the runs. The keys are compared as tuples of all the sort columns. The windows
+    are sized so that a step merges about half of `memory_budget` bytes, except for
+    rows with keys equal to the pivot, and the merged rows are yielded in blocks of
+    at most that size.
+    """
+    accessor = BlockAccessor.for_block(runs[0])
+    non_empty_runs = [r for r in runs if BlockAccessor.for_block(r).num_rows() > 0]
+    if not non_empty_runs:
+        block, _ = accessor.merge_sorted_blocks(runs, sort_key)
+        yield block
+        return
+    runs = non_empty_runs
+
+    num_rows = sum(BlockAccessor.for_block(r).num_rows() for r in runs)
+    size_bytes = sum(BlockAccessor.for_block(r).size_bytes() for r in runs)
+    rows_per_block = max(1, int(memory_budget / 2 / max(1, size_bytes / num_rows)))
+    window = max(1, rows_per_block // len(runs))
+    keys = [_RunKeys(r, sort_key) for r in runs]
+    descending = sort_key.get_descending()
+
+    cursors = [0] * len(runs)
+    heap = []
+
+    def push_window(i: int):
+        end = min(len(keys[i]), cursors[i] + window)
+        last_key = keys[i].key_at(end - 1)
+        heapq.heappush(
+            heap, (_Descending(last_key) if descending else last_key, i, end)
+        )
+
+    for i in range(len(runs)):
+        push_window(i)
+
+    buffer, buffer_rows = [], 0
+    while heap:
+        _, i, end = heapq.heappop(heap)
+        if cursors[i] >= end:
+            # The window was already merged as part of the windows of other runs.
+            if cursors[i] < len(keys[i]):
+                push_window(i)
+            continue
+        pivot = keys[i].key_at(end - 1)
+        slices = []
+        for j, run_keys in enumerate(keys):
+            stop = run_keys.num_rows_until(pivot)
+            if stop > cursors[j]:
+                slices.append(BlockAccessor.for_block(runs[j]).slice(cursors[j], stop))
+                cursors[j] = stop
+        if cursors[i] < len(keys[i]):
+            push_window(i)
+
+        merged, _ = accessor.merge_sorted_blocks(slices, sort_key)
+        merged_rows = BlockAccessor.for_block(merged).num_rows()
+        if buffer and buffer_rows + merged_rows > rows_per_block:
+            yield _concat_blocks(buffer)
+            buffer, buffer_rows = [], 0
+        buffer.append(merged)
+        buffer_rows += merged_rows
+    if buffer:
+        yield _concat_blocks(buffer)
+
+
+def _concat_blocks(blocks: List[Block]) -> Block:
+    if len(blocks) == 1:
+        return blocks[0]
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
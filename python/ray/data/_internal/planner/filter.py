@@ -1,9 +1,12 @@
-from typing import Callable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterator
 
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data.block import Block, BlockAccessor, UserDefinedFunction
 from ray.data.context import DataContext
 
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
 
 def generate_filter_fn() -> Callable[
     [Iterator[Block], TaskContext, UserDefinedFunction], Iterator[Block]
@@ -30,3 +33,28 @@ def generate_filter_fn() -> Callable[
             yield builder.build()
 
     return fn
+
+
+def generate_expression_filter_fn() -> Callable[
+    [Iterator[Block], TaskContext, "Expr"], Iterator[Block]
+]:
+    """Generate function to filter out the records of blocks that do not satisfy the
+    given predicate expression.
+
+    Unlike ``generate_filter_fn()``, the predicate is evaluated on whole blocks with
+    Arrow compute kernels.
+    """
+
+    context = DataContext.get_current()
+
+    def fn(
+        blocks: Iterator[Block], ctx: TaskContext, predicate: "Expr"
+    ) -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            # NOTE: like generate_filter_fn(), this yields an empty block if all rows
+            # are filtered out.
+            yield predicate._filter(table)
+
+    return fn
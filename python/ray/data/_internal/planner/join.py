@@ -0,0 +1,275 @@
+from functools import partial
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from ray.data._internal.execution.interfaces import RefBundle, TaskContext
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.join_task_spec import JoinTaskSpec
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
+    PushBasedShuffleTaskScheduler,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+
+if TYPE_CHECKING:
+    import pandas
+
+# The supported join types, mapped to the names of the corresponding Arrow join types.
+JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+# The join types that can be executed by broadcasting the right side, i.e. that don't
+# need to know whether a right row matched any of the left blocks.
+BROADCAST_JOIN_TYPES = ("inner", "left")
+
+# Transform function of JoinOperator. The inputs are the ref bundles of the left and
+# right sides, and the outputs are the output ref bundles and a stats dict.
+JoinTransformFn = Callable[
+    [List[RefBundle], List[RefBundle], TaskContext], Tuple[List[RefBundle], StatsDict]
+]
+
+
+def generate_join_fn(
+    key_columns: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+    num_outputs: Optional[int] = None,
+    broadcast: Optional[bool] = None,
+) -> JoinTransformFn:
+    """Generate function to join the blocks of two datasets on the given key columns.
+
+    If ``broadcast`` is True, or None and the right side is smaller than
+    ``DataContext.join_broadcast_threshold``, every left block is joined with the
+    whole right side, without shuffling. Otherwise, both sides are hash partitioned on
+    the key columns, and the partitions are joined pairwise.
+    """
+    assert how in JOIN_TYPES, how
+    assert not broadcast or how in BROADCAST_JOIN_TYPES, (how, broadcast)
+
+    def fn(
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_blocks = [b for ref_bundle in left_refs for b, _ in ref_bundle.blocks]
+        left_metadata = [m for ref_bundle in left_refs for _, m in ref_bundle.blocks]
+        right_metadata = [m for ref_bundle in right_refs for _, m in ref_bundle.blocks]
+        right_blocks = [b for ref_bundle in right_refs for b, _ in ref_bundle.blocks]
+
+        input_owned = all(b.owns_blocks for b in left_refs + right_refs)
+        join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+
+        stats = {}
+        left_empty, right_empty = _is_empty(left_metadata), _is_empty(right_metadata)
+        if left_empty or right_empty:
+            if how in ("left", "outer") and not left_empty:
+                empty_block = _get_block_with_schema(right_refs)
+                if empty_block is None:
+                    # The right side has no block with a schema, so its columns
+                    # are unknown. The input lists are cleared by the caller.
+                    return list(left_refs), {}
+                # Join with an empty right block, so that the right columns are
+                # added as nulls.
+                join_out = [
+                    join_blocks.remote(key_columns, how, suffixes, block, empty_block)
+                    for block in left_blocks
+                ]
+            elif how in ("right", "outer") and not right_empty:
+                empty_block = _get_block_with_schema(left_refs)
+                if empty_block is None:
+                    return list(right_refs), {}
+                join_out = [
+                    join_blocks.remote(key_columns, how, suffixes, empty_block, block)
+                    for block in right_blocks
+                ]
+            else:
+                return [], {}
+            return _finish_join(
+                join_out, left_refs, right_refs, input_owned, stats, ctx
+            )
+
+        use_broadcast = broadcast
+        if use_broadcast is None:
+            right_size = sum(m.size_bytes or 0 for m in right_metadata)
+            use_broadcast = (
+                how in BROADCAST_JOIN_TYPES
+                and all(m.size_bytes is not None for m in right_metadata)
+                and right_size <= DataContext.get_current().join_broadcast_threshold
+            )
+
+        if use_broadcast:
+            # Join each left block with all the right blocks.
+            join_out = [
+                join_blocks.remote(key_columns, how, suffixes, block, *right_blocks)
+                for block in left_blocks
+            ]
+        else:
+            output_num_blocks = num_outputs or max(len(left_blocks), len(right_blocks))
+            join_spec = JoinTaskSpec(key_columns)
+            if DataContext.get_current().use_push_based_shuffle:
+                scheduler = PushBasedShuffleTaskScheduler(join_spec)
+            else:
+                scheduler = PullBasedShuffleTaskScheduler(join_spec)
+            left_partitions, left_stats = scheduler.execute(
+                left_refs, output_num_blocks, ctx
+            )
+            right_partitions, right_stats = scheduler.execute(
+                right_refs, output_num_blocks, ctx
+            )
+            for name in left_stats:
+                stats[name] = left_stats[name] + right_stats.get(name, [])
+
+            # Join the partitions of the same index, which hold the same keys.
+            join_out = [
+                join_blocks.remote(
+                    key_columns,
+                    how,
+                    suffixes,
+                    left.blocks[0][0],
+                    right.blocks[0][0],
+                )
+                for left, right in zip(left_partitions, right_partitions)
+            ]
+            del left_partitions, right_partitions
+
+        return _finish_join(join_out, left_refs, right_refs, input_owned, stats, ctx)
+
+    return fn
+
+
+def _finish_join(
+    join_out: List[Tuple[ObjectRef[Block], ObjectRef[BlockMetadata]]],
+    left_refs: List[RefBundle],
+    right_refs: List[RefBundle],
+    input_owned: bool,
+    stats: StatsDict,
+    ctx: TaskContext,
+) -> Tuple[List[RefBundle], StatsDict]:
+    """Wait for the join tasks, clean up the inputs, and return the output bundles."""
+    new_blocks, new_metadata = zip(*join_out)
+    sub_progress_bar_dict = ctx.sub_progress_bar_dict
+    bar_name = JoinTaskSpec.JOIN_SUB_PROGRESS_BAR_NAME
+    assert bar_name in sub_progress_bar_dict, sub_progress_bar_dict
+    join_bar = sub_progress_bar_dict[bar_name]
+    new_metadata = join_bar.fetch_until_complete(list(new_metadata))
+    stats["join"] = new_metadata
+
+    # Clean up inputs.
+    for ref in left_refs:
+        ref.destroy_if_owned()
+    for ref in right_refs:
+        ref.destroy_if_owned()
+
+    output = [
+        RefBundle([(block, meta)], owns_blocks=input_owned)
+        for block, meta in zip(new_blocks, new_metadata)
+    ]
+    return output, stats
+
+
+def _is_empty(metadata: List[BlockMetadata]) -> bool:
+    """Whether the blocks are known to have no rows."""
+    return all(m.num_rows == 0 for m in metadata)
+
+
+def _get_block_with_schema(refs: List[RefBundle]) -> Optional[ObjectRef[Block]]:
+    """Return a block of the bundles that has a schema with column names, if any."""
+    for ref_bundle in refs:
+        for block, metadata in ref_bundle.blocks:
+            if getattr(metadata.schema, "names", None):
+                return block
+    return None
+
+
+def get_join_sub_progress_bar_names(broadcast: Optional[bool]) -> List[str]:
+    """Return the names of the sub progress bars used by the join function."""
+    if broadcast:
+        return [JoinTaskSpec.JOIN_SUB_PROGRESS_BAR_NAME]
+    # Whether the inputs are shuffled may only be known during execution.
+    return [
+        ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+        ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+        JoinTaskSpec.JOIN_SUB_PROGRESS_BAR_NAME,
+    ]
+
+
+def _join_blocks(
+    key_columns: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+    left_block: Block,
+    *right_blocks: Block,
+) -> Tuple[Block, BlockMetadata]:
+    """Join `left_block` with the concatenation of `right_blocks`."""
+    import pyarrow as pa
+
+    stats = BlockExecStats.builder()
+    left = BlockAccessor.for_block(left_block).to_arrow()
+    if len(right_blocks) == 1:
+        right = BlockAccessor.for_block(right_blocks[0]).to_arrow()
+    else:
+        right = pa.concat_tables(
+            [BlockAccessor.for_block(b).to_arrow() for b in right_blocks],
+            promote=True,
+        )
+
+    left_suffix, right_suffix = suffixes
+    try:
+        if not hasattr(pa.Table, "join"):
+            # Table.join() is only available in pyarrow 7.0.0+.
+            raise NotImplementedError
+        result = left.join(
+            right,
+            keys=key_columns,
+            join_type=JOIN_TYPES[how],
+            left_suffix=left_suffix or None,
+            right_suffix=right_suffix or None,
+            coalesce_keys=True,
+            use_threads=False,
+        )
+    except NotImplementedError:
+        # Fall back to pandas, e.g. for column types that Arrow can't join on yet.
+        result = _join_pandas(
+            left.to_pandas(), right.to_pandas(), key_columns, how, suffixes
+        )
+
+    accessor = BlockAccessor.for_block(result)
+    return result, accessor.get_metadata(input_files=None, exec_stats=stats.build())
+
+
+def _join_pandas(
+    left: "pandas.DataFrame",
+    right: "pandas.DataFrame",
+    key_columns: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+) -> "pandas.DataFrame":
+    """Join the DataFrames like Arrow's ``Table.join()``.
+
+    Unlike Arrow, pandas matches null keys with each other, so the rows with null keys
+    are kept out of the merge, and only added back as unmatched rows of the outer
+    sides of the join.
+    """
+    import pandas as pd
+
+    left_null = left[key_columns].isna().any(axis=1)
+    right_null = right[key_columns].isna().any(axis=1)
+    merge = partial(pd.merge, on=key_columns, suffixes=suffixes)
+    results = [merge(left[~left_null], right[~right_null], how=how)]
+    if how in ("left", "outer") and left_null.any():
+        # Merging with no rows adds the columns of the other side as nulls.
+        results.append(merge(left[left_null], right.iloc[:0], how="left"))
+    if how in ("right", "outer") and right_null.any():
+        results.append(merge(left.iloc[:0], right[right_null], how="right"))
+    if len(results) == 1:
+        return results[0]
+    return pd.concat(results, ignore_index=True)
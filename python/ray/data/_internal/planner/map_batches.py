@@ -6,6 +6,7 @@ from ray.data._internal.block_batching import batch_blocks
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.numpy_support import is_valid_udf_return
 from ray.data._internal.output_buffer import BlockOutputBuffer
+from ray.data._internal.task_profiler import profile_iter, profile_span
 from ray.data._internal.util import _truncated_repr
 from ray.data.block import Block, DataBatch, UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE, DataContext
@@ -76,17 +77,24 @@ def generate_map_batches_fn(
         def process_next_batch(batch: DataBatch) -> Iterator[Block]:
             # Apply UDF.
             try:
-                batch = batch_fn(batch, *fn_args, **fn_kwargs)
+                with profile_span("udf"):
+                    batch = batch_fn(batch, *fn_args, **fn_kwargs)
 
-                if not isinstance(batch, GeneratorType):
+                if isinstance(batch, GeneratorType):
+                    batch = profile_iter("udf", batch)
+                else:
                     batch = [batch]
 
                 for b in batch:
                     validate_batch(b)
                     # Add output batch to output buffer.
-                    output_buffer.add_batch(b)
-                    if output_buffer.has_next():
-                        yield output_buffer.next()
+                    with profile_span("format_conversion"):
+                        output_buffer.add_batch(b)
+                        output_block = None
+                        if output_buffer.has_next():
+                            output_block = output_buffer.next()
+                    if output_block is not None:
+                        yield output_block
             except ValueError as e:
                 read_only_msgs = [
                     "assignment destination is read-only",
@@ -114,12 +122,18 @@ def generate_map_batches_fn(
             ensure_copy=not zero_copy_batch and batch_size is not None,
         )
 
-        for batch in formatted_batch_iter:
+        # The conversions of the blocks into batches are recorded as spans, in which
+        # the upstream fused operators producing the blocks have nested spans.
+        for batch in profile_iter("format_conversion", formatted_batch_iter):
             yield from process_next_batch(batch)
 
         # Yield remainder block from output buffer.
-        output_buffer.finalize()
-        if output_buffer.has_next():
-            yield output_buffer.next()
+        with profile_span("format_conversion"):
+            output_buffer.finalize()
+            output_block = None
+            if output_buffer.has_next():
+                output_block = output_buffer.next()
+        if output_block is not None:
+            yield output_block
 
     return fn
@@ -0,0 +1,34 @@
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.join_operator import JoinOperator
+from ray.data._internal.logical.operators.n_ary_operator import Join
+from ray.data._internal.planner.join import (
+    generate_join_fn,
+    get_join_sub_progress_bar_names,
+)
+
+
+def _plan_join_op(
+    op: Join,
+    left_input_physical_op: PhysicalOperator,
+    right_input_physical_op: PhysicalOperator,
+) -> JoinOperator:
+    """Get the corresponding physical operator for the Join logical operator.
+
+    Note this method only converts the given `op`, but not its input dependencies.
+    See Planner.plan() for more details.
+    """
+    fn = generate_join_fn(
+        op._key_columns,
+        op._how,
+        op._suffixes,
+        num_outputs=op._num_outputs,
+        broadcast=op._broadcast,
+    )
+    return JoinOperator(
+        fn,
+        left_input_physical_op,
+        right_input_physical_op,
+        num_outputs=op._num_outputs,
+        sub_progress_bar_names=get_join_sub_progress_bar_names(op._broadcast),
+        name=op.name,
+    )
@@ -10,6 +10,7 @@ from ray.data._internal.execution.interfaces import (
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.task_profiler import profile_iter
 from ray.data.block import Block
 from ray.data.datasource.datasource import ReadTask
 
@@ -64,7 +65,8 @@ def _plan_read_op(op: Read) -> PhysicalOperator:
 
     def do_read(blocks: Iterator[ReadTask], _: TaskContext) -> Iterator[Block]:
         for read_task in blocks:
-            yield from read_task()
+            # The read spans include both the I/O and the decoding of the data.
+            yield from profile_iter("read", read_task())
 
     return MapOperator.create(
         do_read,
@@ -11,13 +11,20 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    WithColumn,
+)
+from ray.data._internal.planner.filter import (
+    generate_expression_filter_fn,
+    generate_filter_fn,
 )
-from ray.data._internal.planner.filter import generate_filter_fn
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.with_column import generate_with_column_fn
+from ray.data._internal.task_profiler import profile_iter
 from ray.data._internal.util import validate_compute
 from ray.data.block import Block, CallableClass
+from ray.data.expressions import Expr
 
 
 def _plan_udf_map_op(
@@ -39,7 +46,12 @@ def _plan_udf_map_op(
     elif isinstance(op, FlatMap):
         transform_fn = generate_flat_map_fn()
     elif isinstance(op, Filter):
-        transform_fn = generate_filter_fn()
+        if isinstance(op._fn, Expr):
+            transform_fn = generate_expression_filter_fn()
+        else:
+            transform_fn = generate_filter_fn()
+    elif isinstance(op, WithColumn):
+        transform_fn = generate_with_column_fn()
     else:
         raise ValueError(f"Found unknown logical operator during planning: {op}")
 
@@ -73,7 +85,12 @@ def _plan_udf_map_op(
     fn_kwargs = op._fn_kwargs or {}
 
     def do_map(blocks: Iterator[Block], ctx: TaskContext) -> Iterator[Block]:
-        yield from transform_fn(blocks, ctx, *fn_args, **fn_kwargs)
+        # If the task is profiled, the time spent in this operator that isn't covered
+        # by the spans of the transform function, e.g. in row UDFs, is recorded
+        # under the name of the operator.
+        yield from profile_iter(
+            op.name, transform_fn(blocks, ctx, *fn_args, **fn_kwargs)
+        )
 
     return MapOperator.create(
         do_map,
@@ -12,13 +12,14 @@ from ray.data._internal.logical.operators.all_to_all_operator import AbstractAll
 from ray.data._internal.logical.operators.from_operators import AbstractFrom
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
-from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
 from ray.data._internal.logical.operators.one_to_one_operator import Limit
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.planner.plan_all_to_all_op import _plan_all_to_all_op
 from ray.data._internal.planner.plan_from_op import _plan_from_op
 from ray.data._internal.planner.plan_input_data_op import _plan_input_data_op
+from ray.data._internal.planner.plan_join_op import _plan_join_op
 from ray.data._internal.planner.plan_limit_op import _plan_limit_op
 from ray.data._internal.planner.plan_read_op import _plan_read_op
 from ray.data._internal.planner.plan_udf_map_op import _plan_udf_map_op
@@ -67,6 +68,11 @@ class Planner:
         elif isinstance(logical_op, Zip):
             assert len(physical_children) == 2
             physical_op = ZipOperator(physical_children[0], physical_children[1])
+        elif isinstance(logical_op, Join):
+            assert len(physical_children) == 2
+            physical_op = _plan_join_op(
+                logical_op, physical_children[0], physical_children[1]
+            )
         elif isinstance(logical_op, Union):
             assert len(physical_children) >= 2
             physical_op = UnionOperator(*physical_children)
@@ -12,7 +12,10 @@ from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler impor
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
     PushBasedShuffleTaskScheduler,
 )
-from ray.data._internal.planner.exchange.sort_task_spec import SortTaskSpec
+from ray.data._internal.planner.exchange.sort_task_spec import (
+    ExternalSortTaskSpec,
+    SortTaskSpec,
+)
 from ray.data._internal.sort import SortKey
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import unify_block_metadata_schema
@@ -21,8 +24,13 @@ from ray.data.context import DataContext
 
 def generate_sort_fn(
     sort_key: SortKey,
+    split_heavy_keys: bool = False,
 ) -> AllToAllTransformFn:
-    """Generate function to sort blocks by the specified key column or key function."""
+    """Generate function to sort blocks by the specified key column or key function.
+
+    If `split_heavy_keys` and `DataContext.sort_split_heavy_keys` are set, the rows of
+    the keys that span several sampled ranges are spread across their output blocks.
+    """
 
     def fn(
         sort_key: SortKey,
@@ -48,9 +56,23 @@ def generate_sort_fn(
         _, ascending = sort_key.to_pandas_sort_args()
         if not ascending:
             boundaries.reverse()
-        sort_spec = SortTaskSpec(boundaries=boundaries, sort_key=sort_key)
+        context = DataContext.get_current()
+        split = split_heavy_keys and context.sort_split_heavy_keys
+        if context.use_external_sort:
+            sort_spec = ExternalSortTaskSpec(
+                boundaries=boundaries,
+                sort_key=sort_key,
+                memory_budget=context.external_sort_memory_budget,
+                split_heavy_keys=split,
+            )
+            # Reduce tasks yielding multiple blocks require the pull-based shuffle.
+            scheduler = PullBasedShuffleTaskScheduler(sort_spec)
+            return scheduler.execute(refs, num_outputs, ctx)
 
-        if DataContext.get_current().use_push_based_shuffle:
+        sort_spec = SortTaskSpec(
+            boundaries=boundaries, sort_key=sort_key, split_heavy_keys=split
+        )
+        if context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(sort_spec)
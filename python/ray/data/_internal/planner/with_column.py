@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from ray.data._internal.execution.interfaces import TaskContext
+from ray.data.block import Block, BlockAccessor
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
+
+def generate_with_column_fn() -> Callable[
+    [Iterator[Block], TaskContext, "Expr", str], Iterator[Block]
+]:
+    """Generate function to set a column of blocks to the values of an expression.
+
+    The expression is evaluated on whole blocks with Arrow compute kernels, so the
+    blocks are never converted to pandas.
+    """
+
+    context = DataContext.get_current()
+
+    def fn(
+        blocks: Iterator[Block], ctx: TaskContext, expr: "Expr", col: str
+    ) -> Iterator[Block]:
+        DataContext._set_current(context)
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            yield expr._with_column(table, col)
+
+    return fn
@@ -1,6 +1,7 @@
 from typing import Callable, Iterator
 
 from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.task_profiler import profile_span
 from ray.data.block import Block
 from ray.data.datasource import Datasource
 
@@ -16,9 +17,9 @@ def generate_write_fn(
         # NOTE: `WriteResult` isn't a valid block type, so we need to wrap it up.
         import pandas as pd
 
-        block = pd.DataFrame(
-            {"write_result": [datasource.write(blocks, ctx, **write_args)]}
-        )
+        with profile_span("write"):
+            write_result = datasource.write(blocks, ctx, **write_args)
+        block = pd.DataFrame({"write_result": [write_result]})
         return [block]
 
     return fn
@@ -7,6 +7,10 @@ from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.fast_repartition import fast_repartition
 from ray.data._internal.plan import AllToAllStage
+from ray.data._internal.planner.join import (
+    generate_join_fn,
+    get_join_sub_progress_bar_names,
+)
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.shuffle_and_partition import (
     PushBasedShufflePartitionOp,
@@ -308,6 +312,50 @@ def _do_zip(
     return result, br.get_metadata(input_files=[], exec_stats=stats.build())
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Dataset.join()`."""
+
+    def __init__(
+        self,
+        other: "Dataset",
+        key_columns: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+        num_blocks: Optional[int],
+        broadcast: Optional[bool],
+    ):
+        join_fn = generate_join_fn(
+            key_columns, how, suffixes, num_outputs=num_blocks, broadcast=broadcast
+        )
+
+        def do_join(
+            block_list: BlockList, ctx: TaskContext, clear_input_blocks: bool, *_
+        ):
+            from ray.data._internal.execution.legacy_compat import (
+                _block_list_to_bundles,
+                _bundles_to_block_list,
+            )
+
+            other_block_list = other._plan.execute()
+            left_refs = _block_list_to_bundles(
+                block_list, owns_blocks=clear_input_blocks
+            )
+            right_refs = _block_list_to_bundles(
+                other_block_list, owns_blocks=other_block_list._owned_by_consumer
+            )
+            if clear_input_blocks:
+                block_list.clear()
+            output, stats = join_fn(left_refs, right_refs, ctx)
+            return _bundles_to_block_list(output), stats
+
+        super().__init__(
+            "Join",
+            num_blocks,
+            do_join,
+            sub_stage_names=get_join_sub_progress_bar_names(broadcast),
+        )
+
+
 class SortStage(AllToAllStage):
     """Implementation of `Dataset.sort()`."""
 
@@ -8,6 +8,11 @@ import numpy as np
 
 import ray
 from ray.data._internal.block_list import BlockList
+from ray.data._internal.task_profiler import (
+    TASK_SPAN_NAME,
+    TaskProfile,
+    to_chrome_trace_events,
+)
 from ray.data._internal.util import capfirst
 from ray.data.block import BlockMetadata
 from ray.data.context import DataContext
@@ -284,6 +289,26 @@ class DatasetStats:
         """Placeholder for ops not yet instrumented."""
         return DatasetStats(stages={"TODO": []}, parent=None)
 
+    def get_task_profiles(self) -> Dict[str, List[TaskProfile]]:
+        """Return the profiles of the profiled tasks of each stage of this Dataset and
+        its parents. See `DataContext.task_profiling_enabled`."""
+        task_profiles = {}
+        for parent in self.parents:
+            task_profiles.update(parent.get_task_profiles())
+        for stage_name, metadata in self.stages.items():
+            profiles = [
+                m.exec_stats.task_profile
+                for m in metadata
+                if m.exec_stats is not None and m.exec_stats.task_profile is not None
+            ]
+            if profiles:
+                task_profiles[stage_name] = profiles
+        return task_profiles
+
+    def to_chrome_trace(self) -> List[Dict[str, Any]]:
+        """Return the spans of the profiled tasks as Chrome trace events."""
+        return to_chrome_trace_events(self.get_task_profiles())
+
     def to_summary(self) -> "DatasetStatsSummary":
         """Generate a `DatasetStatsSummary` object from the given `DatasetStats`
         object, which can be used to generate a summary string."""
@@ -458,6 +483,25 @@ class DatasetStatsSummary:
         )
 
 
+# The ratio of the max to the mean num rows of the output blocks of a stage above
+# which its outputs are considered skewed.
+SKEWED_OUTPUT_NUM_ROWS_RATIO = 2
+
+# The number of buckets of the output num rows histograms.
+NUM_HISTOGRAM_BUCKETS = 5
+
+
+def _histogram(values: List[int]) -> Dict[str, int]:
+    """Return the number of values in each of the equal width ranges between 0 and
+    the max value."""
+    width = max(values) // NUM_HISTOGRAM_BUCKETS + 1
+    counts = collections.Counter(v // width for v in values)
+    return {
+        f"[{i * width}, {(i + 1) * width})": counts[i]
+        for i in range(NUM_HISTOGRAM_BUCKETS)
+    }
+
+
 @dataclass
 class StageStatsSummary:
     stage_name: str
@@ -481,6 +525,11 @@ class StageStatsSummary:
     output_size_bytes: Optional[Dict[str, float]] = None
     # node_count: "count" stat instead of "sum"
     node_count: Optional[Dict[str, float]] = None
+    # The number of output blocks per range of num rows, e.g. {"[0, 20)": 3, ...}.
+    output_num_rows_histogram: Optional[Dict[str, int]] = None
+    # The self time of the spans of the profiled tasks, summed by span name, e.g.
+    # {"read": ..., "udf": ..., "serialization": ...}.
+    task_time_breakdown: Optional[Dict[str, float]] = None
 
     @classmethod
     def from_block_metadata(
@@ -573,6 +622,10 @@ class StageStatsSummary:
                 "sum": sum(output_num_rows),
             }
 
+        output_num_rows_histogram = None
+        if output_num_rows:
+            output_num_rows_histogram = _histogram(output_num_rows)
+
         output_size_bytes_stats = None
         output_size_bytes = [
             m.size_bytes for m in block_metas if m.size_bytes is not None
@@ -597,6 +650,17 @@ class StageStatsSummary:
                 "count": len(node_counts),
             }
 
+        task_time_breakdown = None
+        task_profiles = [
+            s.task_profile for s in exec_stats if s.task_profile is not None
+        ]
+        if task_profiles:
+            task_time_breakdown = collections.defaultdict(float)
+            for profile in task_profiles:
+                for span in profile.spans:
+                    task_time_breakdown[span.name] += span.self_time_s
+            task_time_breakdown = dict(task_time_breakdown)
+
         return StageStatsSummary(
             stage_name=stage_name,
             is_substage=is_substage,
@@ -608,6 +672,8 @@ class StageStatsSummary:
             output_num_rows=output_num_rows_stats,
             output_size_bytes=output_size_bytes_stats,
             node_count=node_counts_stats,
+            output_num_rows_histogram=output_num_rows_histogram,
+            task_time_breakdown=task_time_breakdown,
         )
 
     def __str__(self) -> str:
@@ -660,6 +726,19 @@ class StageStatsSummary:
                 output_num_rows_stats["sum"],
             )
 
+        if self.output_num_rows_histogram and (
+            output_num_rows_stats["max"]
+            > SKEWED_OUTPUT_NUM_ROWS_RATIO * max(1, output_num_rows_stats["mean"])
+        ):
+            # Only show the histogram of skewed outputs, e.g. due to heavy keys.
+            out += indent
+            out += "* Output num rows histogram: {}\n".format(
+                ", ".join(
+                    f"{bucket}: {count}"
+                    for bucket, count in self.output_num_rows_histogram.items()
+                )
+            )
+
         output_size_bytes_stats = self.output_size_bytes
         if output_size_bytes_stats:
             out += indent
@@ -679,6 +758,21 @@ class StageStatsSummary:
                 node_count_stats["mean"],
                 node_count_stats["count"],
             )
+
+        if self.task_time_breakdown:
+            total = sum(self.task_time_breakdown.values())
+            out += indent
+            out += "* Task time breakdown (summed across profiled tasks):\n"
+            for name, time_s in sorted(
+                self.task_time_breakdown.items(), key=lambda item: -item[1]
+            ):
+                if name == TASK_SPAN_NAME:
+                    # The time not covered by any other span.
+                    name = "other"
+                out += indent
+                out += "    * {}: {} ({}%)\n".format(
+                    name, fmt(time_s), round(100 * time_s / max(total, 1e-9), 1)
+                )
         return out
 
     def __repr__(self, level=0) -> str:
@@ -0,0 +1,165 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The name of the span covering the execution of a whole task. Its self time is the
+# time that isn't covered by any other span.
+TASK_SPAN_NAME = "task"
+
+# The name of the span from the submission to the start of a task, which is spent
+# waiting for resources and fetching the input blocks.
+SCHEDULING_SPAN_NAME = "scheduling"
+
+# The profiler of the task running in the current thread, if it's profiled.
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    """A timed section of a task."""
+
+    name: str
+    # The wall-clock start and end times, in seconds since the epoch, so that the
+    # spans of tasks that ran in different processes can be compared.
+    start_s: float
+    end_s: float
+    # The time spent in the span, excluding the time spent in its nested spans.
+    self_time_s: float
+
+
+@dataclass
+class TaskProfile:
+    """The spans recorded while executing a task."""
+
+    task_idx: int
+    node_id: str
+    spans: List[Span] = field(default_factory=list)
+
+
+class TaskProfiler:
+    """Records the spans of a task, e.g. the time spent reading the input, in UDFs, or
+    serializing the outputs.
+
+    The spans are recorded by ``profile_span()`` and ``profile_iter()``, which are
+    no-ops unless a profiler is active in the current thread. Spans can be nested,
+    as long as they're properly nested, so they must not be open across yields.
+    """
+
+    def __init__(self, task_idx: int, node_id: str, submit_time_s: float):
+        self.profile = TaskProfile(task_idx, node_id)
+        self._start_s = time.time()
+        self._record(SCHEDULING_SPAN_NAME, submit_time_s, self._start_s, 0)
+        # The time spent in the nested spans of the open spans, starting with the
+        # task span.
+        self._nested_times: List[float] = [0]
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Record the enclosed code as a span nested in the innermost open span."""
+        start_s = time.time()
+        self._nested_times.append(0)
+        try:
+            yield
+        finally:
+            self.record(name, start_s, time.time(), self._nested_times.pop())
+
+    def record(
+        self, name: str, start_s: float, end_s: float, nested_time_s: float = 0
+    ) -> None:
+        """Record a span that was timed by the caller, nested in the innermost open
+        span."""
+        self._record(name, start_s, end_s, nested_time_s)
+        self._nested_times[-1] += end_s - start_s
+
+    def finish(self) -> TaskProfile:
+        """Record the task span, and return the profile of the task."""
+        self._record(
+            TASK_SPAN_NAME, self._start_s, time.time(), self._nested_times.pop()
+        )
+        return self.profile
+
+    def _record(
+        self, name: str, start_s: float, end_s: float, nested_time_s: float
+    ) -> None:
+        self_time_s = max(0, end_s - start_s - nested_time_s)
+        self.profile.spans.append(Span(name, start_s, end_s, self_time_s))
+
+
+def get_current_profiler() -> Optional[TaskProfiler]:
+    """Return the profiler of the task running in the current thread, if any."""
+    return getattr(_local, "profiler", None)
+
+
+def set_current_profiler(profiler: Optional[TaskProfiler]) -> None:
+    _local.profiler = profiler
+
+
+@contextmanager
+def profile_span(name: str) -> Iterator[None]:
+    """Record the enclosed code as a span of the current task, if it's profiled."""
+    profiler = get_current_profiler()
+    if profiler is None:
+        yield
+    else:
+        with profiler.span(name):
+            yield
+
+
+def profile_iter(name: str, iterable: Iterable[T]) -> Iterator[T]:
+    """Iterate over the iterable, recording the time spent producing each item as a
+    span of the current task, if it's profiled."""
+    profiler = get_current_profiler()
+    if profiler is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        with profiler.span(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def to_chrome_trace_events(
+    operator_profiles: Dict[str, List[TaskProfile]]
+) -> List[Dict[str, Any]]:
+    """Convert the profiles of the tasks of each operator into Chrome trace events.
+
+    Each operator is shown as a process, and each of its tasks as a thread, so that
+    the spans of a task are shown as a flame graph on the timeline. The trace can be
+    loaded in chrome://tracing or https://ui.perfetto.dev.
+    """
+    events = []
+    for pid, (operator_name, profiles) in enumerate(operator_profiles.items()):
+        events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": operator_name},
+            }
+        )
+        for profile in profiles:
+            for span in profile.spans:
+                events.append(
+                    {
+                        "name": span.name,
+                        "cat": operator_name,
+                        "ph": "X",
+                        "ts": span.start_s * 1e6,
+                        "dur": (span.end_s - span.start_s) * 1e6,
+                        "pid": pid,
+                        "tid": profile.task_idx,
+                        "args": {
+                            "node_id": profile.node_id,
+                            "self_time_s": span.self_time_s,
+                        },
+                    }
+                )
+    return events
@@ -0,0 +1,171 @@
+import collections
+import threading
+import warnings
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import torch
+
+# The maximum number of idle buffer sets kept for reuse.
+MAX_IDLE_BUFFER_SETS = 8
+
+# The NumPy dtype kinds that can be copied into Torch tensors: booleans, signed and
+# unsigned integers, floats, and complex numbers.
+_COPYABLE_DTYPE_KINDS = "biufc"
+
+_Signature = Tuple[Tuple[Optional[str], Tuple[int, ...], "torch.dtype"], ...]
+
+
+class HostBufferBatch:
+    """A batch collated into a buffer set of a ``TorchHostBufferPool``."""
+
+    def __init__(self, buffers: Dict[Optional[str], "torch.Tensor"]):
+        # The buffers by column name, or under None for single-tensor batches.
+        self.buffers = buffers
+
+
+class TorchHostBufferPool:
+    """A pool of reusable host tensors that batches are collated into before being
+    transferred to the device.
+
+    Collating a batch fills a set of host tensors with the same column names, shapes
+    and dtypes as the batch, instead of allocating new tensors for each batch. When
+    the batch is transferred to the device, its buffer set is returned to the pool,
+    and reused by a later batch as soon as the transfer has completed. Since a
+    buffer set is only reused once the batch collated into it has been transferred,
+    the next batches are collated into other buffer sets in the meantime (double
+    buffering), and the number of buffer sets grows to the number of batches that are
+    in flight at once.
+
+    If ``pin_memory`` is set, the buffers are allocated in page-locked memory, so
+    that the transfers to CUDA devices can be asynchronous.
+
+    The pool is thread-safe, since the batches are collated and finalized in separate
+    threadpools.
+    """
+
+    def __init__(
+        self,
+        dtypes: Optional[Union["torch.dtype", Dict[str, "torch.dtype"]]] = None,
+        pin_memory: bool = False,
+    ):
+        self._dtypes = dtypes
+        self._pin_memory = pin_memory
+        # The released buffer sets, oldest first, with their signatures and the CUDA
+        # events recorded after their transfers were enqueued, if any.
+        self._idle: Deque[
+            Tuple[_Signature, Dict[Optional[str], "torch.Tensor"], Optional[object]]
+        ] = collections.deque()
+        self._lock = threading.Lock()
+        self._num_allocated_sets = 0
+
+    def collate(
+        self, batch: Union[np.ndarray, Dict[str, np.ndarray]]
+    ) -> Optional[HostBufferBatch]:
+        """Copy the NumPy batch into a set of host buffers.
+
+        Returns None if the batch has columns that can't be copied into tensors,
+        e.g. ragged or object columns, so that the caller falls back to the default
+        conversion.
+        """
+        import torch
+
+        if isinstance(batch, np.ndarray):
+            columns = {None: batch}
+        else:
+            columns = batch
+        if not all(
+            isinstance(array, np.ndarray) and array.dtype.kind in _COPYABLE_DTYPE_KINDS
+            for array in columns.values()
+        ):
+            return None
+
+        sources = {}
+        with warnings.catch_warnings():
+            # The arrays can come from the Ray object store, so they may not be
+            # writeable, but they're only read from.
+            warnings.simplefilter("ignore")
+            for name, array in columns.items():
+                try:
+                    sources[name] = torch.from_numpy(array)
+                except TypeError:
+                    # The dtype isn't supported by Torch, e.g. uint32.
+                    return None
+
+        signature = tuple(
+            (name, tuple(source.shape), self._get_dtype(name, source.dtype))
+            for name, source in sources.items()
+        )
+        buffers = self._acquire(signature)
+        for name, source in sources.items():
+            buffers[name].copy_(source)
+
+        return HostBufferBatch(buffers)
+
+    def to_device(
+        self, batch: HostBufferBatch, device: Union[str, "torch.device"]
+    ) -> Union["torch.Tensor", Dict[str, "torch.Tensor"]]:
+        """Transfer the collated batch to the device, and return its buffers to the
+        pool.
+
+        If the buffers are pinned, the transfer is asynchronous, and the buffers
+        aren't reused until it has completed.
+        """
+        import torch
+
+        tensors = {
+            name: buffer.to(device=device, non_blocking=self._pin_memory)
+            for name, buffer in batch.buffers.items()
+        }
+        event = None
+        if self._pin_memory:
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(device))
+
+        signature = tuple(
+            (name, tuple(buffer.shape), buffer.dtype)
+            for name, buffer in batch.buffers.items()
+        )
+        with self._lock:
+            self._idle.append((signature, batch.buffers, event))
+            if len(self._idle) > MAX_IDLE_BUFFER_SETS:
+                self._idle.popleft()
+
+        if list(tensors) == [None]:
+            return tensors[None]
+        return tensors
+
+    def num_allocated_sets(self) -> int:
+        """Return the number of buffer sets allocated so far."""
+        return self._num_allocated_sets
+
+    def _get_dtype(self, name: Optional[str], dtype: "torch.dtype") -> "torch.dtype":
+        if isinstance(self._dtypes, dict):
+            if name is None:
+                if len(self._dtypes) != 1:
+                    raise ValueError(
+                        "When constructing a single-tensor batch, only a single "
+                        f"dtype should be given, instead got: {self._dtypes}"
+                    )
+                return next(iter(self._dtypes.values()))
+            return self._dtypes.get(name, dtype)
+        if self._dtypes is not None:
+            return self._dtypes
+        return dtype
+
+    def _acquire(self, signature: _Signature) -> Dict[Optional[str], "torch.Tensor"]:
+        """Return an idle buffer set with the signature, or allocate a new one."""
+        import torch
+
+        with self._lock:
+            for i, (idle_signature, buffers, event) in enumerate(self._idle):
+                if idle_signature == signature and (event is None or event.query()):
+                    del self._idle[i]
+                    return buffers
+            self._num_allocated_sets += 1
+        return {
+            name: torch.empty(shape, dtype=dtype, pin_memory=self._pin_memory)
+            for name, shape, dtype in signature
+        }
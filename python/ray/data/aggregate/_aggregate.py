@@ -1,5 +1,10 @@
+import collections
+import itertools
 import math
-from typing import TYPE_CHECKING, Callable, List, Optional, Union
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from ray.data._internal.null_aggregate import (
     _null_wrap_accumulate_block,
@@ -429,3 +434,346 @@ class Quantile(_AggregateOnKeyBase):
             finalize=_null_wrap_finalize(percentile),
             name=(self._rs_name),
         )
+
+
+@PublicAPI
+class ApproxCountDistinct(_AggregateOnKeyBase):
+    """Defines approximate distinct count aggregation.
+
+    Uses a HyperLogLog sketch, which estimates the number of distinct values from
+    ``2 ** precision`` registers, so that the memory used doesn't depend on the
+    number of rows or distinct values. The relative standard error of the estimate
+    is about ``1.04 / sqrt(2 ** precision)``, e.g. 1.6% for the default precision.
+    See https://en.wikipedia.org/wiki/HyperLogLog
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        precision: int = 12,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        if not 4 <= precision <= 18:
+            raise ValueError(
+                f"The precision must be between 4 and 18, but got {precision}."
+            )
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_count_distinct({str(on)})"
+
+        def merge(a: bytes, b: bytes) -> bytes:
+            registers_a = np.frombuffer(a, dtype=np.uint8)
+            registers_b = np.frombuffer(b, dtype=np.uint8)
+            return np.maximum(registers_a, registers_b).tobytes()
+
+        def sketch(values: np.ndarray) -> bytes:
+            return _hll_registers(values, precision).astype(np.uint8).tobytes()
+
+        super().__init__(
+            init=lambda k: b"",
+            merge=_sketch_merge(merge),
+            accumulate_block=_sketch_accumulate_block(on, ignore_nulls, sketch, merge),
+            finalize=_sketch_finalize(
+                lambda a: _hll_estimate(np.frombuffer(a, dtype=np.uint8))
+            ),
+            name=(self._rs_name),
+        )
+
+
+@PublicAPI
+class ApproxQuantile(_AggregateOnKeyBase):
+    """Defines approximate quantile aggregation.
+
+    Uses a t-digest sketch, which summarizes the values by at most about
+    ``compression / 2`` weighted centroids. The centroids are smaller near the
+    extremes, so the estimates of extreme quantiles are more accurate than those of
+    the median. Unlike ``Quantile``, the values aren't collected, so the memory used
+    doesn't depend on the number of rows.
+    See https://arxiv.org/abs/1902.04023
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        q: float = 0.5,
+        compression: int = 100,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        if not 0 <= q <= 1:
+            raise ValueError(f"The quantile must be between 0 and 1, but got {q}.")
+        if compression < 2:
+            raise ValueError(
+                f"The compression must be at least 2, but got {compression}."
+            )
+        self._set_key_fn(on)
+        self._q = q
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_quantile({str(on)})"
+
+        def merge(a: bytes, b: bytes) -> bytes:
+            min_a, max_a, means_a, weights_a = _unpack_tdigest(a)
+            min_b, max_b, means_b, weights_b = _unpack_tdigest(b)
+            means, weights = _compress_tdigest(
+                np.concatenate([means_a, means_b]),
+                np.concatenate([weights_a, weights_b]),
+                compression,
+            )
+            return _pack_tdigest(min(min_a, min_b), max(max_a, max_b), means, weights)
+
+        def sketch(values: np.ndarray) -> bytes:
+            values = values.astype(np.float64)
+            means, weights = _compress_tdigest(
+                values, np.ones(len(values)), compression
+            )
+            return _pack_tdigest(values.min(), values.max(), means, weights)
+
+        def finalize(a: bytes) -> float:
+            min_, max_, means, weights = _unpack_tdigest(a)
+            # Interpolate between the centroids, which are located at the middle of
+            # the ranks that they cover, and the exact extremes.
+            centers = np.cumsum(weights) - weights / 2
+            total = weights.sum()
+            return float(
+                np.interp(
+                    self._q * total,
+                    np.concatenate([[0], centers, [total]]),
+                    np.concatenate([[min_], means, [max_]]),
+                )
+            )
+
+        super().__init__(
+            init=lambda k: b"",
+            merge=_sketch_merge(merge),
+            accumulate_block=_sketch_accumulate_block(on, ignore_nulls, sketch, merge),
+            finalize=_sketch_finalize(finalize),
+            name=(self._rs_name),
+        )
+
+
+@PublicAPI
+class ApproxTopK(_AggregateOnKeyBase):
+    """Defines approximate top-k (most frequent values) aggregation.
+
+    Uses a Misra-Gries summary of ``num_counters`` counters, which keeps every value
+    occurring in more than ``1 / (num_counters + 1)`` of the rows. The counts are
+    lower bounds of the true counts, which underestimate them by at most
+    ``num_rows / (num_counters + 1)``.
+    See https://en.wikipedia.org/wiki/Misra%E2%80%93Gries_summary
+
+    The result is a list of up to ``k`` ``{"value": ..., "count": ...}`` dicts,
+    sorted by decreasing count. If ``ignore_nulls`` is False, the nulls are counted
+    as a value instead of making the result null.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        k: int = 10,
+        num_counters: Optional[int] = None,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        if num_counters is None:
+            num_counters = 10 * k
+        if not 0 < k <= num_counters:
+            raise ValueError(
+                "k must be positive and at most num_counters, but got "
+                f"k={k} and num_counters={num_counters}."
+            )
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_top_k({str(on)})"
+
+        def merge(a: bytes, b: bytes) -> bytes:
+            if len(a) == 0:
+                return b
+            if len(b) == 0:
+                return a
+            counts = collections.Counter()
+            for value, count in itertools.chain(pickle.loads(a), pickle.loads(b)):
+                counts[value] += count
+            values = list(counts.keys())
+            return _prune_counters(
+                values, np.array([counts[v] for v in values]), num_counters
+            )
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            import pyarrow.compute as pac
+
+            column = BlockAccessor.for_block(block).to_arrow().column(on)
+            if ignore_nulls:
+                column = column.drop_null()
+            value_counts = pac.value_counts(column)
+            counts = value_counts.field("counts").to_numpy()
+            if len(counts) > num_counters + 1:
+                # Only the most frequent values can be kept.
+                top = np.argpartition(-counts, num_counters)[: num_counters + 1]
+                counts = counts[top]
+                values = value_counts.field("values").take(top).to_pylist()
+            else:
+                values = value_counts.field("values").to_pylist()
+            return merge(a, _prune_counters(values, counts, num_counters))
+
+        def finalize(a: bytes) -> Optional[List[dict]]:
+            if a is None or len(a) == 0:
+                # Empty or all null.
+                return None
+            counters = sorted(pickle.loads(a), key=lambda c: c[1], reverse=True)
+            return [{"value": value, "count": count} for value, count in counters[:k]]
+
+        super().__init__(
+            init=lambda key: b"",
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=finalize,
+            name=(self._rs_name),
+        )
+
+
+# The sketch aggregations serialize their sketches into a single bytes accumulator, so
+# that the partial aggregations can be stored in both Arrow and pandas blocks. The
+# empty bytes is an empty sketch, and None is the result of nulls that aren't ignored.
+
+
+def _sketch_accumulate_block(
+    on: str,
+    ignore_nulls: bool,
+    sketch: Callable[[np.ndarray], bytes],
+    merge: Callable[[bytes, bytes], bytes],
+) -> Callable[[Optional[bytes], Block], Optional[bytes]]:
+    """Return a function that merges the sketch of the non-null values of the column
+    of a block into the accumulator."""
+
+    def accumulate_block(a: Optional[bytes], block: Block) -> Optional[bytes]:
+        if a is None:
+            return None
+        column = BlockAccessor.for_block(block).to_arrow().column(on)
+        if column.null_count > 0:
+            if not ignore_nulls:
+                return None
+            column = column.drop_null()
+        if len(column) == 0:
+            return a
+        b = sketch(column.to_numpy())
+        return b if len(a) == 0 else merge(a, b)
+
+    return accumulate_block
+
+
+def _sketch_merge(
+    merge: Callable[[bytes, bytes], bytes]
+) -> Callable[[Optional[bytes], Optional[bytes]], Optional[bytes]]:
+    def _merge(a: Optional[bytes], b: Optional[bytes]) -> Optional[bytes]:
+        if a is None or b is None:
+            return None
+        if len(a) == 0:
+            return b
+        if len(b) == 0:
+            return a
+        return merge(a, b)
+
+    return _merge
+
+
+def _sketch_finalize(finalize: Callable[[bytes], U]) -> Callable[[bytes], U]:
+    def _finalize(a: Optional[bytes]) -> Optional[U]:
+        if a is None or len(a) == 0:
+            # Empty or all null.
+            return None
+        return finalize(a)
+
+    return _finalize
+
+
+def _hll_registers(values: np.ndarray, precision: int) -> np.ndarray:
+    """Return the HyperLogLog registers of the values."""
+    import pandas as pd
+
+    hashes = pd.util.hash_array(values)
+    # The first bits of the hashes select the registers, and the registers keep the
+    # maximum position of the first 1 bit in the remaining bits.
+    num_bits = 64 - precision
+    indices = (hashes >> np.uint64(num_bits)).astype(np.int64)
+    remaining = hashes & np.uint64((1 << num_bits) - 1)
+    ranks = num_bits - _bit_length(remaining) + 1
+    registers = np.zeros(1 << precision, dtype=np.int64)
+    np.maximum.at(registers, indices, ranks)
+    return registers
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Return the number of bits needed to represent each of the uint64 values."""
+    length = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= np.uint64(1 << shift)
+        length[mask] += shift
+        x = np.where(mask, x >> np.uint64(shift), x)
+    return length + (x > 0)
+
+
+def _hll_estimate(registers: np.ndarray) -> int:
+    registers = registers.astype(np.int64)
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers))
+    num_zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and num_zeros > 0:
+        # Use linear counting for small cardinalities, for which the raw estimate
+        # is biased.
+        estimate = m * math.log(m / num_zeros)
+    return int(round(estimate))
+
+
+def _pack_tdigest(
+    min_: float, max_: float, means: np.ndarray, weights: np.ndarray
+) -> bytes:
+    """Serialize a t-digest into the bytes of an array of floats."""
+    return np.concatenate([[min_, max_], means, weights]).astype(np.float64).tobytes()
+
+
+def _unpack_tdigest(a: bytes) -> Tuple[float, float, np.ndarray, np.ndarray]:
+    a = np.frombuffer(a, dtype=np.float64)
+    num_centroids = (len(a) - 2) // 2
+    return a[0], a[1], a[2 : 2 + num_centroids], a[2 + num_centroids :]
+
+
+def _compress_tdigest(
+    means: np.ndarray, weights: np.ndarray, compression: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge the centroids into the centroids of a t-digest, sorted by mean."""
+    order = np.argsort(means, kind="stable")
+    means, weights = means[order], weights[order]
+    # The centroids are assigned by their middle rank to unit intervals of the k1
+    # scale function, which maps the quantiles to [0, compression / 2].
+    q = (np.cumsum(weights) - weights / 2) / weights.sum()
+    k = compression / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+    bins = np.floor(k + compression / 4).astype(np.int64)
+    _, inverse = np.unique(bins, return_inverse=True)
+    merged_weights = np.bincount(inverse, weights=weights)
+    merged_means = np.bincount(inverse, weights=means * weights) / merged_weights
+    return merged_means, merged_weights
+
+
+def _prune_counters(values: List[Any], counts: np.ndarray, num_counters: int) -> bytes:
+    """Reduce the counters to at most ``num_counters``, by subtracting the count of
+    the ``num_counters + 1``-th most frequent value from all counts, and dropping the
+    counters that aren't positive.
+
+    The counters are serialized as a pickled list of ``(value, count)`` pairs.
+    """
+    if len(counts) > num_counters:
+        threshold = np.partition(counts, len(counts) - num_counters - 1)[
+            len(counts) - num_counters - 1
+        ]
+        counts = counts - threshold
+    return pickle.dumps(
+        [(value, int(count)) for value, count in zip(values, counts) if count > 0]
+    )
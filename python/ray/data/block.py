@@ -41,6 +41,7 @@ if TYPE_CHECKING:
 
     from ray.data._internal.block_builder import BlockBuilder
     from ray.data._internal.sort import SortKey
+    from ray.data._internal.task_profiler import TaskProfile
     from ray.data.aggregate import AggregateFn
 
 
@@ -131,6 +132,8 @@ class BlockExecStats:
         wall_time_s: The wall-clock time it took to compute this block.
         cpu_time_s: The CPU time it took to compute this block.
         node_id: A unique id for the node that computed this block.
+        task_profile: The spans recorded by the task that computed this block, if
+            it was profiled and this is its last output block.
     """
 
     def __init__(self):
@@ -142,6 +145,9 @@ class BlockExecStats:
         # Max memory usage. May be an overestimate since we do not
         # differentiate from previous tasks on the same worker.
         self.max_rss_bytes: int = 0
+        # The profile of the task that computed this block, if the task was profiled
+        # and this is its last output block.
+        self.task_profile: Optional["TaskProfile"] = None
 
     @staticmethod
     def builder() -> "_BlockExecStatsBuilder":
@@ -1,6 +1,6 @@
 import os
 import threading
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Type
 
 import ray
 from ray._private.ray_constants import env_integer
@@ -8,6 +8,7 @@ from ray.util.annotations import DeveloperAPI
 from ray.util.scheduling_strategies import SchedulingStrategyT
 
 if TYPE_CHECKING:
+    from ray.data._internal.execution.backpressure_policy import BackpressurePolicy
     from ray.data._internal.execution.interfaces import ExecutionOptions
 
 # The context singleton on this process.
@@ -119,6 +120,79 @@ DEFAULT_USE_RAY_TQDM = bool(int(os.environ.get("RAY_TQDM", "1")))
 # Set this to True to use the legacy iter_batches codepath prior to 2.4.
 DEFAULT_USE_LEGACY_ITER_BATCHES = False
 
+# Whether to collect the column statistics of Parquet files from their metadata, so
+# that the optimizer can skip reading files that can't match a pushed-down filter.
+DEFAULT_PARQUET_COLUMN_STATISTICS_ENABLED = True
+
+# The directory where the Parquet file metadata (footers) fetched by read_parquet() is
+# cached, keyed by the path, size and modification time of the files, so that later
+# reads of unchanged files don't fetch it again. The directory can be any path
+# supported by pyarrow, e.g. a local directory or a cloud storage bucket. Caching is
+# disabled if None.
+DEFAULT_PARQUET_METADATA_CACHE_DIR = None
+
+# The maximum size in bytes of the right side of a join for it to be broadcast to the
+# tasks joining each left block, instead of shuffling both sides.
+DEFAULT_JOIN_BROADCAST_THRESHOLD = 32 * 1024 * 1024
+
+# The strategy of groupby aggregations: "sort" partitions the keys by sampled ranges,
+# "hash" partitions them by hash after combining the rows of each key in every block,
+# and "auto" uses "hash" when the sampled keys have few distinct values. The output
+# blocks of hash aggregations are not sorted by key.
+DEFAULT_AGGREGATE_STRATEGY = "sort"
+
+# Whether Dataset.sort() merges the sorted map outputs of each reduce task in bounded
+# batches, yielding multiple output blocks, instead of sorting the whole partition in
+# memory. External sorts always use the pull-based shuffle.
+DEFAULT_USE_EXTERNAL_SORT = False
+
+# The maximum size in bytes of the rows that an external sort reduce task merges at
+# once. Its output blocks are at most half of this size.
+DEFAULT_EXTERNAL_SORT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Whether Dataset.sort() spreads the rows of keys that are frequent enough to span
+# several sampled ranges across the output blocks of those ranges, instead of putting
+# them all in a single block. The output is still sorted, but rows with equal keys may
+# then be in different blocks. GroupedData.map_groups() always keeps them together.
+DEFAULT_SORT_SPLIT_HEAVY_KEYS = False
+
+# The classes of the backpressure policies applied by the streaming executor, in
+# addition to its resource limits, e.g. `MemoryBudgetBackpressurePolicy` from
+# `ray.data._internal.execution.backpressure_policy`.
+DEFAULT_BACKPRESSURE_POLICIES = []
+
+# Whether the streaming executor merges the small blocks and splits the large blocks
+# output by map operators, so that their sizes are between target_min_block_size and
+# target_max_block_size. This avoids the overheads of many tiny blocks, e.g. after
+# selective filters. Blocks that are already within the range are left as they are.
+DEFAULT_BLOCK_RESIZING_ENABLED = False
+
+# Whether reads split large files into multiple read tasks, so that the tasks read
+# similar amounts of data instead of one task reading each large file. Parquet files
+# are split at row group boundaries, and uncompressed CSV and JSON lines files at line
+# boundaries. The target size of each read task is the estimated in-memory size of the
+# dataset divided by the read parallelism.
+DEFAULT_READ_FILE_SPLITTING_ENABLED = False
+
+# The strategy of the local shuffles of iter_batches() with local_shuffle_buffer_size:
+# "buffer" concatenates the blocks into a shuffle buffer that is shuffled every time
+# it's compacted, and "window" keeps a window of blocks and gathers the rows of each
+# batch at random from all of them, so that each row is only copied into its batch.
+DEFAULT_LOCAL_SHUFFLE_STRATEGY = "buffer"
+
+# Whether iter_torch_batches() collates the batches into reusable host tensors before
+# transferring them to the device, instead of allocating new tensors for each batch.
+DEFAULT_TORCH_HOST_BUFFERS_ENABLED = False
+
+# Whether the reusable host tensors are pinned, so that the transfers to CUDA devices
+# are asynchronous.
+DEFAULT_TORCH_HOST_BUFFERS_PIN_MEMORY = True
+
+# Whether the map tasks record how their time is spent, e.g. reading, in UDFs, or
+# serializing the outputs. The breakdown is shown by Dataset.stats(), and the spans
+# can be exported as a Chrome trace with Dataset.export_trace().
+DEFAULT_TASK_PROFILING_ENABLED = False
+
 # Use this to prefix important warning messages for the user.
 WARN_PREFIX = "⚠️ "
 
@@ -176,6 +250,20 @@ class DataContext:
         use_ray_tqdm: bool,
         use_legacy_iter_batches: bool,
         enable_progress_bars: bool,
+        parquet_column_statistics_enabled: bool,
+        parquet_metadata_cache_dir: Optional[str],
+        join_broadcast_threshold: int,
+        aggregate_strategy: str,
+        use_external_sort: bool,
+        external_sort_memory_budget: int,
+        sort_split_heavy_keys: bool,
+        backpressure_policies: List[Type["BackpressurePolicy"]],
+        block_resizing_enabled: bool,
+        read_file_splitting_enabled: bool,
+        local_shuffle_strategy: str,
+        torch_host_buffers_enabled: bool,
+        torch_host_buffers_pin_memory: bool,
+        task_profiling_enabled: bool,
     ):
         """Private constructor (use get_current() instead)."""
         self.block_splitting_enabled = block_splitting_enabled
@@ -210,6 +298,20 @@ class DataContext:
         self.use_ray_tqdm = use_ray_tqdm
         self.use_legacy_iter_batches = use_legacy_iter_batches
         self.enable_progress_bars = enable_progress_bars
+        self.parquet_column_statistics_enabled = parquet_column_statistics_enabled
+        self.parquet_metadata_cache_dir = parquet_metadata_cache_dir
+        self.join_broadcast_threshold = join_broadcast_threshold
+        self.aggregate_strategy = aggregate_strategy
+        self.use_external_sort = use_external_sort
+        self.external_sort_memory_budget = external_sort_memory_budget
+        self.sort_split_heavy_keys = sort_split_heavy_keys
+        self.backpressure_policies = backpressure_policies
+        self.block_resizing_enabled = block_resizing_enabled
+        self.read_file_splitting_enabled = read_file_splitting_enabled
+        self.local_shuffle_strategy = local_shuffle_strategy
+        self.torch_host_buffers_enabled = torch_host_buffers_enabled
+        self.torch_host_buffers_pin_memory = torch_host_buffers_pin_memory
+        self.task_profiling_enabled = task_profiling_enabled
 
     @staticmethod
     def get_current() -> "DataContext":
@@ -260,6 +362,24 @@ class DataContext:
                     use_ray_tqdm=DEFAULT_USE_RAY_TQDM,
                     use_legacy_iter_batches=DEFAULT_USE_LEGACY_ITER_BATCHES,
                     enable_progress_bars=DEFAULT_ENABLE_PROGRESS_BARS,
+                    parquet_column_statistics_enabled=(
+                        DEFAULT_PARQUET_COLUMN_STATISTICS_ENABLED
+                    ),
+                    parquet_metadata_cache_dir=DEFAULT_PARQUET_METADATA_CACHE_DIR,
+                    join_broadcast_threshold=DEFAULT_JOIN_BROADCAST_THRESHOLD,
+                    aggregate_strategy=DEFAULT_AGGREGATE_STRATEGY,
+                    use_external_sort=DEFAULT_USE_EXTERNAL_SORT,
+                    external_sort_memory_budget=DEFAULT_EXTERNAL_SORT_MEMORY_BUDGET,
+                    sort_split_heavy_keys=DEFAULT_SORT_SPLIT_HEAVY_KEYS,
+                    backpressure_policies=list(DEFAULT_BACKPRESSURE_POLICIES),
+                    block_resizing_enabled=DEFAULT_BLOCK_RESIZING_ENABLED,
+                    read_file_splitting_enabled=DEFAULT_READ_FILE_SPLITTING_ENABLED,
+                    local_shuffle_strategy=DEFAULT_LOCAL_SHUFFLE_STRATEGY,
+                    torch_host_buffers_enabled=DEFAULT_TORCH_HOST_BUFFERS_ENABLED,
+                    torch_host_buffers_pin_memory=(
+                        DEFAULT_TORCH_HOST_BUFFERS_PIN_MEMORY
+                    ),
+                    task_profiling_enabled=DEFAULT_TASK_PROFILING_ENABLED,
                 )
 
             return _default_context
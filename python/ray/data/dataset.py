@@ -2,6 +2,7 @@ import collections
 import copy
 import html
 import itertools
+import json
 import logging
 import sys
 import time
@@ -38,6 +39,7 @@ from ray.data._internal.compute import (
     ComputeStrategy,
     TaskPoolStrategy,
 )
+from ray.data._internal.dataset_cache import cache_dataset
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.equalize import _equalize
 from ray.data._internal.execution.interfaces import RefBundle
@@ -53,30 +55,38 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
 )
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.map_operator import (
+    ColumnProjection,
     Filter,
     FlatMap,
     MapBatches,
     MapRows,
+    WithColumn,
 )
 from ray.data._internal.logical.operators.n_ary_operator import (
     Union as UnionLogicalOperator,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.one_to_one_operator import Limit
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.pandas_block import PandasBlockSchema
 from ray.data._internal.plan import ExecutionPlan, OneToOneStage
-from ray.data._internal.planner.filter import generate_filter_fn
+from ray.data._internal.planner.filter import (
+    generate_expression_filter_fn,
+    generate_filter_fn,
+)
 from ray.data._internal.planner.flat_map import generate_flat_map_fn
+from ray.data._internal.planner.join import BROADCAST_JOIN_TYPES, JOIN_TYPES
 from ray.data._internal.planner.map_batches import generate_map_batches_fn
 from ray.data._internal.planner.map_rows import generate_map_rows_fn
+from ray.data._internal.planner.with_column import generate_with_column_fn
 from ray.data._internal.planner.write import generate_write_fn
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.sort import SortKey
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stage_impl import (
+    JoinStage,
     LimitStage,
     RandomizeBlocksStage,
     RandomShuffleStage,
@@ -112,6 +122,7 @@ from ray.data.context import (
     DataContext,
 )
 from ray.data.datasource import (
+    ArrowIPCDatasource,
     BlockWritePathProvider,
     CSVDatasource,
     Datasource,
@@ -127,6 +138,7 @@ from ray.data.datasource.file_based_datasource import (
     _unwrap_arrow_serialization_workaround,
     _wrap_arrow_serialization_workaround,
 )
+from ray.data.expressions import Expr
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -684,6 +696,70 @@ class Dataset:
             **ray_remote_args,
         )
 
+    def with_column(
+        self,
+        col: str,
+        expr: Expr,
+        *,
+        compute: Optional[str] = None,
+        **ray_remote_args,
+    ) -> "Dataset":
+        """Set a column of the dataset to the values of an expression.
+
+        Unlike :meth:`~Dataset.add_column`, the expression is evaluated on the
+        blocks in Arrow format with vectorized Arrow kernels, without converting
+        them to pandas or calling Python functions. Consecutive calls are fused
+        into the same tasks.
+
+        Examples:
+            >>> import ray
+            >>> from ray.data.expressions import col
+            >>> ds = ray.data.range(3)
+            >>> ds = ds.with_column("double_id", col("id") * 2)
+            >>> ds.with_column("sum", col("id") + col("double_id") + 1).take(2)
+            [{'id': 0, 'double_id': 0, 'sum': 1}, {'id': 1, 'double_id': 2, 'sum': 4}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            col: Name of the column to set. If the name already exists, the
+                column is overwritten.
+            expr: The expression computing the column values, built with
+                :func:`~ray.data.expressions.col` and Python operators.
+            compute: The compute strategy, either "tasks" (default) to use Ray
+                tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
+                pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
+                autoscaling actor pool.
+            ray_remote_args: Additional resource requirements to request from
+                ray (e.g., num_gpus=1 to request GPUs for the map tasks).
+        """
+        if not isinstance(expr, Expr):
+            raise ValueError(f"`expr` must be an expression, got {expr}")
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "WithColumn",
+                generate_with_column_fn(),
+                compute,
+                ray_remote_args,
+                fn=expr,
+                fn_args=(col,),
+            )
+        )
+
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = WithColumn(
+                input_op=logical_plan.dag,
+                col=col,
+                expr=expr,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     def drop_columns(
         self,
         cols: List[str],
@@ -727,7 +803,7 @@ class Dataset:
         """  # noqa: E501
 
         return self.map_batches(
-            lambda batch: batch.drop(columns=cols),
+            ColumnProjection(cols, drop=True),
             batch_format="pandas",
             zero_copy_batch=True,
             compute=compute,
@@ -776,7 +852,7 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
         return self.map_batches(
-            lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
+            ColumnProjection(cols),
             batch_format="pandas",
             zero_copy_batch=True,
             compute=compute,
@@ -874,7 +950,7 @@ class Dataset:
 
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Union[UserDefinedFunction[Dict[str, Any], bool], Expr],
         *,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
@@ -893,12 +969,22 @@ class Dataset:
             >>> ds.filter(lambda row: row["id"] % 2 == 0).take_all()
             [{'id': 0}, {'id': 2}, {'id': 4}, ...]
 
+            The predicate can also be an :class:`~ray.data.expressions.Expr`, which
+            is evaluated with vectorized Arrow kernels. Expression filters can be
+            pushed down into reads, so that datasources like Parquet skip the data
+            that can't match.
+
+            >>> from ray.data.expressions import col
+            >>> ds.filter((col("id") >= 10) & (col("id") < 13)).take_all()
+            [{'id': 10}, {'id': 11}, {'id': 12}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each row, or a class type
                 that can be instantiated to create such a callable. Callable classes are
-                only supported for the actor compute strategy.
+                only supported for the actor compute strategy. Alternatively, a
+                predicate expression built with :func:`~ray.data.expressions.col`.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -908,7 +994,10 @@ class Dataset:
         """
         validate_compute(fn, compute)
 
-        transform_fn = generate_filter_fn()
+        if isinstance(fn, Expr):
+            transform_fn = generate_expression_filter_fn()
+        else:
+            transform_fn = generate_filter_fn()
 
         plan = self._plan.with_stage(
             OneToOneStage("Filter", transform_fn, compute, ray_remote_args, fn=fn)
@@ -2008,8 +2097,15 @@ class Dataset:
 
             If the dataset is empty, all values are null. If ``ignore_nulls`` is
             ``False`` and any value is null, then the output is ``None``.
+
+        .. note::
+            If the dataset is read from Parquet files without any transformation,
+            the min is computed from the statistics in the file footers, without
+            reading the data, if they're available.
         """
-        ret = self._aggregate_on(Min, on, ignore_nulls)
+        ret = self._aggregate_from_column_statistics(Min, "min", on, ignore_nulls)
+        if ret is None:
+            ret = self._aggregate_on(Min, on, ignore_nulls)
         return self._aggregate_result(ret)
 
     @ConsumptionAPI
@@ -2050,8 +2146,15 @@ class Dataset:
 
             If the dataset is empty, all values are null. If ``ignore_nulls`` is
             ``False`` and any value is null, then the output is ``None``.
+
+        .. note::
+            If the dataset is read from Parquet files without any transformation,
+            the max is computed from the statistics in the file footers, without
+            reading the data, if they're available.
         """
-        ret = self._aggregate_on(Max, on, ignore_nulls)
+        ret = self._aggregate_from_column_statistics(Max, "max", on, ignore_nulls)
+        if ret is None:
+            ret = self._aggregate_on(Max, on, ignore_nulls)
         return self._aggregate_result(ret)
 
     @ConsumptionAPI
@@ -2172,7 +2275,15 @@ class Dataset:
             A new, sorted :class:`Dataset`.
         """
 
-        sort_key = SortKey(key, descending)
+        return self._sort(SortKey(key, descending), split_heavy_keys=True)
+
+    def _sort(self, sort_key: SortKey, split_heavy_keys: bool = False) -> "Dataset":
+        """Sort the dataset by the sort key.
+
+        If ``split_heavy_keys`` and ``DataContext.sort_split_heavy_keys`` are set, the
+        rows with the same key may be spread across output blocks. Otherwise, they're
+        never split.
+        """
         plan = self._plan.with_stage(SortStage(self, sort_key))
 
         logical_plan = self._logical_plan
@@ -2180,6 +2291,7 @@ class Dataset:
             op = Sort(
                 logical_plan.dag,
                 sort_key=sort_key,
+                split_heavy_keys=split_heavy_keys,
             )
             logical_plan = LogicalPlan(op)
         return Dataset(plan, self._epoch, self._lazy, logical_plan)
@@ -2226,6 +2338,92 @@ class Dataset:
             logical_plan = LogicalPlan(op)
         return Dataset(plan, self._epoch, self._lazy, logical_plan)
 
+    def join(
+        self,
+        other: "Dataset",
+        on: Union[str, List[str]],
+        how: str = "inner",
+        *,
+        suffixes: Tuple[str, str] = ("", "_right"),
+        num_blocks: Optional[int] = None,
+        broadcast: Optional[bool] = None,
+    ) -> "Dataset":
+        """Join the rows of this dataset with the rows of another on key columns.
+
+        By default, both datasets are hash partitioned on the key columns with a
+        distributed shuffle, and the partitions holding the same keys are joined
+        with Arrow. If the other dataset is small, it's broadcast to the tasks
+        joining each block of this dataset instead, which avoids the shuffle.
+
+        .. note::
+            Joined datasets aren't lineage-serializable. As a result, they can't be
+            used as a tunable hyperparameter in Ray Tune.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items(
+            ...     [{"id": 1, "name": "alice"}, {"id": 2, "name": "bob"}]
+            ... )
+            >>> orders = ray.data.from_items(
+            ...     [{"id": 1, "item": "book"}, {"id": 1, "item": "pen"}]
+            ... )
+            >>> users.join(orders, on="id").sort("item").take_all()
+            [{'id': 1, 'name': 'alice', 'item': 'book'}, {'id': 1, 'name': 'alice', 'item': 'pen'}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the key column, or a list of key column names. The key
+                columns must exist in both datasets.
+            how: The type of join, one of ``"inner"``, ``"left"``, ``"right"`` and
+                ``"outer"``.
+            suffixes: The suffixes to add to the names of the non-key columns that
+                exist in both datasets, for this and the other dataset.
+            num_blocks: The number of output blocks when the datasets are shuffled.
+                Defaults to the larger number of blocks of the two datasets.
+            broadcast: Whether to broadcast the other dataset instead of shuffling
+                both datasets. Only supported for inner and left joins. If None, the
+                other dataset is broadcast if it's smaller than
+                ``DataContext.join_broadcast_threshold``.
+
+        Returns:
+            A :class:`Dataset` containing the columns of both datasets for each pair
+            of rows with equal keys, as well as the unmatched rows of the outer sides
+            of the join.
+        """  # noqa: E501
+        key_columns = [on] if isinstance(on, str) else list(on)
+        if not key_columns:
+            raise ValueError("At least one key column must be specified for join.")
+        if how not in JOIN_TYPES:
+            raise ValueError(
+                f"Unsupported join type {how!r}, expected one of {list(JOIN_TYPES)}."
+            )
+        if broadcast and how not in BROADCAST_JOIN_TYPES:
+            raise ValueError(
+                f"Broadcast join is only supported for {list(BROADCAST_JOIN_TYPES)} "
+                f"joins, got {how!r}."
+            )
+
+        plan = self._plan.with_stage(
+            JoinStage(other, key_columns, how, suffixes, num_blocks, broadcast)
+        )
+
+        logical_plan = self._logical_plan
+        other_logical_plan = other._logical_plan
+        if logical_plan is not None and other_logical_plan is not None:
+            op = Join(
+                logical_plan.dag,
+                other_logical_plan.dag,
+                key_columns,
+                how,
+                suffixes,
+                num_outputs=num_blocks,
+                broadcast=broadcast,
+            )
+            logical_plan = LogicalPlan(op)
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     @ConsumptionAPI
     def limit(self, limit: int) -> "Dataset":
         """Truncate the dataset to the first ``limit`` rows.
@@ -2612,6 +2810,9 @@ class Dataset:
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        partition_cols: Optional[List[str]] = None,
+        max_file_size: Optional[int] = None,
+        max_open_files: int = 64,
         ray_remote_args: Dict[str, Any] = None,
         **arrow_parquet_args,
     ) -> None:
@@ -2629,11 +2830,24 @@ class Dataset:
         :class:`~ray.data.datasource.BlockWritePathProvider`
         and pass it in as the ``block_path_provider`` argument.
 
+        If ``partition_cols`` is specified, the rows are written to Hive-style
+        partition directories of the form ``{col1}={value1}/{col2}={value2}/``
+        instead, without shuffling the dataset first. Each write task streams its
+        blocks into one file per partition, buffering the rows of each partition to
+        write them out in large row groups. If ``max_file_size`` is specified, the
+        files are rolled over once they reach that size. In both cases, the format
+        of the output files is ``{uuid}_{task_idx}_{file_idx}.parquet``.
+
         Examples:
             >>> import ray
             >>> ds = ray.data.range(100)
             >>> ds.write_parquet("local:///tmp/data/")
 
+            Write the rows to a directory per value of a column.
+
+            >>> ds = ds.add_column("group", lambda df: df["id"] % 3)
+            >>> ds.write_parquet("local:///tmp/partitioned/", partition_cols=["group"])
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
@@ -2670,6 +2884,17 @@ class Dataset:
                 instead of ``arrow_parquet_args`` if any of your write arguments
                 can't pickled, or if you'd like to lazily resolve the write
                 arguments for each dataset block.
+            partition_cols: The columns to partition the output files by. These
+                columns aren't written to the files, since their values are encoded
+                in the paths. ``block_path_provider`` is ignored if this is set.
+            max_file_size: The size in bytes above which the output files are rolled
+                over to new files. The files are rolled over after writing a row
+                group, so they can exceed this size. ``block_path_provider`` is
+                ignored if this is set.
+            max_open_files: The maximum number of files that each write task keeps
+                open at once when writing partitioned or size-limited files. If a
+                task writes to more partitions, the least recently used file is
+                closed, and the next rows of its partition go to a new file.
             ray_remote_args: Kwargs passed to :meth:`~ray.remote` in the write tasks.
             arrow_parquet_args: Options to pass to
                 `pyarrow.parquet.write_table() <https://arrow.apache.org/docs/python\
@@ -2687,9 +2912,103 @@ class Dataset:
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
             write_args_fn=arrow_parquet_args_fn,
+            partition_cols=partition_cols,
+            max_file_size=max_file_size,
+            max_open_files=max_open_files,
             **arrow_parquet_args,
         )
 
+    @ConsumptionAPI
+    def write_arrow_ipc(
+        self,
+        path: str,
+        *,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+        try_create_dir: bool = True,
+        arrow_open_stream_args: Optional[Dict[str, Any]] = None,
+        block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        arrow_ipc_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        ray_remote_args: Dict[str, Any] = None,
+        **arrow_ipc_args,
+    ) -> None:
+        """Writes the :class:`~ray.data.Dataset` to Arrow IPC (Feather V2) files under
+        the provided ``path``.
+
+        Arrow IPC files store the blocks in the Arrow in-memory format, so that
+        :meth:`~ray.data.read_arrow_ipc` can memory-map local files instead of decoding
+        them. Use this format for intermediate datasets that are reread from local
+        disks, and Parquet for long-term storage.
+
+        The number of files is determined by the number of blocks in the dataset.
+        To control the number of number of blocks, call
+        :meth:`~ray.data.Dataset.repartition`.
+
+        By default, the format of the output files is ``{uuid}_{block_idx}.arrow``,
+        where ``uuid`` is a unique id for the dataset. To modify this behavior,
+        implement a custom :class:`~ray.data.datasource.BlockWritePathProvider`
+        and pass it in as the ``block_path_provider`` argument.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100)
+            >>> ds.write_arrow_ipc("local:///tmp/data/")
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            path: The path to the destination root directory, where
+                Arrow IPC files are written to.
+            filesystem: The pyarrow filesystem implementation to write to.
+                These filesystems are specified in the
+                `pyarrow docs <https://arrow.apache.org/docs\
+                /python/api/filesystems.html#filesystem-implementations>`_.
+                Specify this if you need to provide specific configurations to the
+                filesystem. By default, the filesystem is automatically selected based
+                on the scheme of the paths. For example, if the path begins with
+                ``s3://``, the ``S3FileSystem`` is used.
+            try_create_dir: If ``True``, attempts to create all directories in the
+                destination path. Does nothing if all directories already
+                exist. Defaults to ``True``.
+            arrow_open_stream_args: kwargs passed to
+                `pyarrow.fs.FileSystem.open_output_stream <https://arrow.apache.org\
+                /docs/python/generated/pyarrow.fs.FileSystem.html\
+                #pyarrow.fs.FileSystem.open_output_stream>`_, which is used when
+                opening the file to write to.
+            block_path_provider: A
+                :class:`~ray.data.datasource.BlockWritePathProvider`
+                implementation specifying the filename structure for each output
+                Arrow IPC file. By default, the format of the output files is
+                ``{uuid}_{block_idx}.arrow``, where ``uuid`` is a unique id for the
+                dataset.
+            arrow_ipc_args_fn: Callable that returns a dictionary of write
+                arguments that are provided to `pyarrow.ipc.IpcWriteOptions <https:/\
+                    /arrow.apache.org/docs/python/generated/\
+                        pyarrow.ipc.IpcWriteOptions.html>`_
+                when writing each block to a file. Overrides
+                any duplicate keys from ``arrow_ipc_args``. Use this argument
+                instead of ``arrow_ipc_args`` if any of your write arguments
+                can't pickled, or if you'd like to lazily resolve the write
+                arguments for each dataset block.
+            ray_remote_args: Kwargs passed to :meth:`~ray.remote` in the write tasks.
+            arrow_ipc_args: Options to pass to
+                `pyarrow.ipc.IpcWriteOptions <https://arrow.apache.org/docs/python\
+                    /generated/pyarrow.ipc.IpcWriteOptions.html>`_, for example
+                ``compression="zstd"``. Compressed buffers can't be memory-mapped
+                without decompressing them.
+        """
+        self.write_datasource(
+            ArrowIPCDatasource(),
+            ray_remote_args=ray_remote_args,
+            path=path,
+            dataset_uuid=self._uuid,
+            filesystem=filesystem,
+            try_create_dir=try_create_dir,
+            open_stream_args=arrow_open_stream_args,
+            block_path_provider=block_path_provider,
+            write_args_fn=arrow_ipc_args_fn,
+            **arrow_ipc_args,
+        )
+
     @ConsumptionAPI
     def write_json(
         self,
@@ -3389,6 +3708,8 @@ class Dataset:
                 minimum number of rows that must be in the local in-memory shuffle
                 buffer in order to yield a batch. When there are no more rows to add to
                 the buffer, the remaining rows in the buffer are drained.
+                See ``DataContext.local_shuffle_strategy`` for how the buffer is
+                shuffled.
             local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
@@ -3477,7 +3798,9 @@ class Dataset:
                 "auto" which moves the tensors to the appropriate device when the
                 Dataset is passed to Ray Train and ``collate_fn`` is not provided.
                 Otherwise, defaults to CPU. You can't use this parameter with
-                ``collate_fn``.
+                ``collate_fn``. If ``DataContext.torch_host_buffers_enabled`` is
+                set, the batches are collated into reusable (pinned) host tensors
+                before being transferred to the device, instead of new tensors.
             collate_fn: A function to convert a Numpy batch to a PyTorch tensor batch.
                 When this parameter is specified, the user should manually handle the
                 host to device data transfer outside of collate_fn.
@@ -4199,6 +4522,10 @@ class Dataset:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        use_hash_index: bool = False,
+        max_replicas: int = 1,
+        max_cached_blocks: Optional[int] = None,
     ) -> RandomAccessDataset:
         """Convert this dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -4219,10 +4546,26 @@ class Dataset:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            use_hash_index: Whether the workers find the records of the keys in their
+                blocks with hash tables instead of binary searches. This takes more
+                memory, but speeds up the lookups in large blocks.
+            max_replicas: The maximum number of workers that serve the same block.
+                Blocks that are accessed much more often than the others are
+                replicated to more workers, up to this number, to spread their load.
+            max_cached_blocks: The maximum number of indexed blocks that each
+                worker keeps in memory. The least recently used blocks are evicted
+                first. By default, all the blocks are kept in memory.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self,
+            key,
+            num_workers=num_workers,
+            use_hash_index=use_hash_index,
+            max_replicas=max_replicas,
+            max_cached_blocks=max_cached_blocks,
+        )
 
     @Deprecated
     @ConsumptionAPI
@@ -4579,6 +4922,44 @@ class Dataset:
         output._plan._in_stats.dataset_uuid = self._get_uuid()
         return output
 
+    @ConsumptionAPI
+    def cache(
+        self,
+        path: str,
+        *,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "MaterializedDataset":
+        """Execute and materialize this dataset into object store memory, and
+        persist it in a cache directory for later jobs.
+
+        The cached data is keyed on a fingerprint of the definition of this dataset,
+        which covers the paths, sizes and modification times of the files it reads,
+        the arguments of its transformations and the code of its UDFs. If a dataset
+        with the same fingerprint was cached in ``path`` before, its blocks are read
+        from the cache instead of executing this dataset. Otherwise, this dataset is
+        executed and its blocks are written to the cache in Arrow IPC format.
+
+        Datasets whose data isn't determined by their definition, e.g. datasets
+        created from in-memory data or shuffled without a seed, are materialized
+        without caching.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(10).map_batches(lambda batch: batch)
+            >>> ds.cache("/tmp/ray_data_cache")  # doctest: +SKIP
+            MaterializedDataset(num_blocks=..., num_rows=10, schema={id: int64})
+
+        Args:
+            path: The directory of the cache. It can be on a local or shared
+                filesystem, and can be shared by multiple datasets.
+            filesystem: The pyarrow filesystem of the cache directory. By default,
+                it's inferred from the scheme of ``path``.
+
+        Returns:
+            A MaterializedDataset holding the materialized data blocks.
+        """
+        return cache_dataset(self, path, filesystem)
+
     @ConsumptionAPI(pattern="timing information.", insert_after=True)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
@@ -4586,6 +4967,11 @@ class Dataset:
         Note that this does not trigger execution, so if the dataset has not yet
         executed, an empty string is returned.
 
+        If ``DataContext.task_profiling_enabled`` is set, the stats also break down
+        the time of the tasks of each stage into reading, UDFs, format conversions,
+        serialization, waiting to be scheduled, and the time spent in the operators
+        themselves. See also :meth:`~Dataset.export_trace`.
+
         Examples:
 
         .. testcode::
@@ -4615,6 +5001,44 @@ class Dataset:
     def _get_stats_summary(self) -> DatasetStatsSummary:
         return self._plan.stats_summary()
 
+    @DeveloperAPI
+    def export_trace(self, path: str) -> None:
+        """Write the timelines of the profiled tasks of this dataset as a Chrome trace
+        JSON file.
+
+        The tasks are only profiled if ``DataContext.task_profiling_enabled`` is set
+        when the dataset is executed. In the trace, each operator is shown as a
+        process, and each of its tasks as a thread, with nested spans for the time
+        spent reading, in UDFs, converting formats, and serializing the outputs.
+        Load the file in ``chrome://tracing`` or https://ui.perfetto.dev to view it.
+
+        Note that this does not trigger execution.
+
+        Examples:
+
+        .. testcode::
+
+            import ray
+
+            ctx = ray.data.DataContext.get_current()
+            ctx.task_profiling_enabled = True
+
+            ds = ray.data.range(10).map_batches(lambda batch: batch).materialize()
+            ds.export_trace("/tmp/trace.json")
+
+        Args:
+            path: The path of the local file to write the trace to.
+        """
+        events = self._plan.stats().to_chrome_trace()
+        if not events:
+            logger.warning(
+                "No task of the dataset was profiled, so the trace is empty. Set "
+                "`DataContext.task_profiling_enabled` before executing the dataset "
+                "to profile its tasks."
+            )
+        with open(path, "w") as f:
+            json.dump(events, f)
+
     @ConsumptionAPI(pattern="Time complexity:")
     @DeveloperAPI
     def get_internal_block_refs(self) -> List[ObjectRef[Block]]:
@@ -4858,6 +5282,80 @@ class Dataset:
         aggs = self._build_multicolumn_aggs(agg_cls, on, *args, **kwargs)
         return self.aggregate(*aggs)
 
+    def _aggregate_from_column_statistics(
+        self,
+        agg_cls: type,
+        stat: str,
+        on: Optional[Union[str, List[str]]],
+        ignore_nulls: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Compute the min or max of the columns from the column statistics of the
+        read tasks, without reading the columns that the statistics answer.
+
+        The columns without usable statistics are aggregated with ``agg_cls``.
+
+        Returns:
+            The aggregation result in the same format as ``_aggregate_on()``, or None
+            if the statistics are unknown for all of the columns.
+        """
+        import pyarrow as pa
+
+        column_statistics = self._plan.meta_column_statistics()
+        if column_statistics is None:
+            return None
+        schema = self.schema(fetch_if_missing=False)
+        if schema is None or not isinstance(schema.base_schema, pa.Schema):
+            return None
+        if on is None:
+            on = schema.names
+        elif isinstance(on, str):
+            on = [on]
+        if not isinstance(on, list) or not on:
+            return None
+
+        result = {}
+        # The columns whose statistics are unknown or unusable.
+        remaining = []
+        for col in on:
+            # Keep the results in the order of the columns.
+            result[f"{stat}({col})"] = None
+            stats = column_statistics.get(col)
+            if stats is None or stats.min is None or stats.max is None:
+                remaining.append(col)
+                continue
+            col_type = schema.base_schema.field(col).type
+            # Only use the statistics of the types for which they're exact and
+            # converted to the same Python values as the aggregations return. E.g.
+            # NaNs are ignored by the statistics of floats, but not by Min and Max.
+            if not (
+                pa.types.is_integer(col_type)
+                or pa.types.is_boolean(col_type)
+                or pa.types.is_string(col_type)
+                or pa.types.is_large_string(col_type)
+                or pa.types.is_date(col_type)
+            ):
+                remaining.append(col)
+                continue
+            if ignore_nulls:
+                value = stats.min if stat == "min" else stats.max
+            elif stats.null_count is None:
+                remaining.append(col)
+                continue
+            elif stats.null_count > 0:
+                value = None
+            else:
+                value = stats.min if stat == "min" else stats.max
+            result[f"{stat}({col})"] = value
+
+        if len(remaining) == len(on):
+            return None
+        if remaining:
+            rest = self._aggregate_on(agg_cls, remaining, ignore_nulls)
+            if rest is None:
+                return None
+            result.update(rest)
+        return result
+
     def _build_multicolumn_aggs(
         self,
         agg_cls: type,
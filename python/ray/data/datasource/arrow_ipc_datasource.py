@@ -0,0 +1,95 @@
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+from ray.data.block import Block, BlockAccessor
+from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
+    _resolve_kwargs,
+)
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+@PublicAPI(stability="alpha")
+class ArrowIPCDatasource(FileBasedDatasource):
+    """Arrow IPC datasource, for reading and writing Arrow IPC (Feather V2) files.
+
+    Local files are memory-mapped, so that the blocks are read from the files without
+    decoding or copying them, unless the files are compressed.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.datasource import ArrowIPCDatasource
+        >>> source = ArrowIPCDatasource() # doctest: +SKIP
+        >>> ray.data.read_datasource( # doctest: +SKIP
+        ...     source, paths="/path/to/dir").take()
+        [{"a": 1, "b": "foo"}, ...]
+    """
+
+    _FILE_EXTENSION = ["arrow", "feather", "ipc"]
+
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        import pyarrow as pa
+        from pyarrow.fs import LocalFileSystem
+
+        # Reading the IPC file format requires random access.
+        if "compression" in open_args:
+            with filesystem.open_input_stream(path, **open_args) as f:
+                return pa.BufferReader(f.read_buffer())
+        if isinstance(filesystem, LocalFileSystem):
+            return pa.memory_map(path)
+        return filesystem.open_input_file(path, **open_args)
+
+    def _read_stream(
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        columns: Optional[List[str]] = None,
+        **reader_args,
+    ) -> Iterator[Block]:
+        import pyarrow as pa
+        from pyarrow.fs import HadoopFileSystem
+
+        compression = reader_args.pop("compression", None)
+        filesystem = reader_args.pop("filesystem", None)
+        if compression == "snappy":
+            import snappy
+
+            rawbytes = BytesIO()
+            if isinstance(filesystem, HadoopFileSystem):
+                snappy.hadoop_snappy.stream_decompress(src=f, dst=rawbytes)
+            else:
+                snappy.stream_decompress(src=f, dst=rawbytes)
+            f = pa.BufferReader(rawbytes.getvalue())
+
+        reader = pa.ipc.open_file(f, **reader_args)
+        for i in range(reader.num_record_batches):
+            table = pa.Table.from_batches([reader.get_batch(i)])
+            if columns is not None:
+                table = table.select(columns)
+            yield table
+
+    def _prune_reader_args(self, columns: List[str], **reader_args) -> Dict[str, Any]:
+        return {**reader_args, "columns": columns}
+
+    def _write_block(
+        self,
+        f: "pyarrow.NativeFile",
+        block: BlockAccessor,
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ):
+        import pyarrow as pa
+
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        table = block.to_arrow()
+        options = pa.ipc.IpcWriteOptions(**writer_args)
+        with pa.ipc.new_file(f, table.schema, options=options) as writer:
+            writer.write_table(table)
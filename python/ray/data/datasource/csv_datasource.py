@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
+import copy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List
 
 from ray.data.block import Block, BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _read_first_line,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -62,6 +64,38 @@ class CSVDatasource(FileBasedDatasource):
                 "more details."
             ) from e
 
+    def _prune_reader_args(self, columns: List[str], **reader_args) -> Dict[str, Any]:
+        from pyarrow import csv
+
+        # Only convert the needed columns, other columns are skipped by the parser.
+        convert_options = copy.copy(
+            reader_args.get("convert_options") or csv.ConvertOptions()
+        )
+        convert_options.include_columns = columns
+        return {**reader_args, "convert_options": convert_options}
+
+    def _supports_line_splitting(self, **reader_args) -> bool:
+        read_options = reader_args.get("read_options")
+        parse_options = reader_args.get("parse_options")
+        # The skipped rows would be skipped in every byte range, and the values with
+        # line breaks could span byte ranges.
+        return (
+            read_options is None
+            or (
+                read_options.skip_rows == 0
+                and getattr(read_options, "skip_rows_after_names", 0) == 0
+            )
+        ) and (parse_options is None or not parse_options.newlines_in_values)
+
+    def _read_split_header(self, f: "pyarrow.NativeFile", **reader_args) -> bytes:
+        read_options = reader_args.get("read_options")
+        if read_options is not None and (
+            read_options.column_names or read_options.autogenerate_column_names
+        ):
+            # The first line isn't a header.
+            return b""
+        return _read_first_line(f)
+
     def _write_block(
         self,
         f: "pyarrow.NativeFile",
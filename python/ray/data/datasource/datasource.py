@@ -1,6 +1,7 @@
 import builtins
 from copy import copy
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -13,6 +14,9 @@ from ray.data.context import DataContext
 from ray.types import ObjectRef
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
 WriteResult = Any
 
 
@@ -199,13 +203,19 @@ class ReadTask(Callable[[], Iterable[Block]]):
         self._metadata = metadata
         self._read_fn = read_fn
         self._additional_output_splits = 1
+        self._read_columns: Optional[List[str]] = None
+        self._read_filter: Optional["Expr"] = None
+        self._column_statistics: Optional[Dict[str, Any]] = None
 
     def get_metadata(self) -> BlockMetadata:
         return self._metadata
 
     def __call__(self) -> Iterable[Block]:
         context = DataContext.get_current()
-        result = self._read_fn()
+        if isinstance(self._read_fn, _PushdownReadFn):
+            result = self._read_fn(self._read_columns, self._read_filter)
+        else:
+            result = self._read_fn()
         if not hasattr(result, "__iter__"):
             DeprecationWarning(
                 "Read function must return Iterable[Block], got {}. "
@@ -225,6 +235,75 @@ class ReadTask(Callable[[], Iterable[Block]]):
     def _set_additional_split_factor(self, k: int) -> None:
         self._additional_output_splits = k
 
+    def _supports_column_pruning(self) -> bool:
+        """Whether the columns read by this task can be narrowed with
+        ``_set_read_columns()``."""
+        return isinstance(self._read_fn, _PushdownReadFn)
+
+    def _supports_filter_pushdown(self) -> bool:
+        """Whether rows can be filtered during the read with
+        ``_set_read_filter()``."""
+        return (
+            isinstance(self._read_fn, _PushdownReadFn) and self._read_fn.supports_filter
+        )
+
+    def _set_read_columns(self, columns: List[str]) -> None:
+        """Only read the given columns, in the given order.
+
+        This is used by the projection pushdown optimization, so that columns that
+        are dropped downstream are never read or decoded.
+        """
+        assert self._supports_column_pruning()
+        self._read_columns = list(columns)
+
+        metadata = copy(self._metadata)
+        schema = metadata.schema
+        names = getattr(schema, "names", None)
+        if names and all(col in names for col in columns):
+            import pyarrow as pa
+
+            if isinstance(schema, pa.Schema):
+                metadata.schema = pa.schema(
+                    [schema.field(col) for col in columns], schema.metadata
+                )
+            if metadata.size_bytes is not None:
+                # Assume the columns are of similar size.
+                metadata.size_bytes = int(
+                    metadata.size_bytes * len(columns) / len(names)
+                )
+        self._metadata = metadata
+
+    def _set_read_filter(self, predicate: "Expr") -> None:
+        """Only read the rows satisfying the given predicate.
+
+        This is used by the predicate pushdown optimization, so that the datasource
+        can skip data that doesn't match using its statistics.
+        """
+        assert self._supports_filter_pushdown()
+        if self._read_filter is not None:
+            predicate = self._read_filter & predicate
+        self._read_filter = predicate
+        # The number of rows is unknown until the read is executed.
+        metadata = copy(self._metadata)
+        metadata.num_rows = None
+        self._metadata = metadata
+
+    def _set_column_statistics(self, column_statistics: Dict[str, Any]) -> None:
+        """Set the statistics of the columns read by this task.
+
+        Args:
+            column_statistics: Mapping from column name to its statistics, with
+                ``min``, ``max`` and ``null_count`` attributes.
+        """
+        self._column_statistics = column_statistics
+
+    def _could_match(self, predicate: "Expr") -> bool:
+        """Return False if the column statistics of this task guarantee that no row
+        satisfies the predicate."""
+        if self._column_statistics is None:
+            return True
+        return predicate._could_match(self._column_statistics)
+
     def _do_additional_splits(self, block: Block) -> Iterable[Block]:
         if self._additional_output_splits > 1:
             block = BlockAccessor.for_block(block)
@@ -237,6 +316,74 @@ class ReadTask(Callable[[], Iterable[Block]]):
             yield block
 
 
+@dataclass
+class _ColumnStatistics:
+    """Statistics of a column, e.g. aggregated from Parquet file metadata.
+
+    Each statistic is None if it's unknown for any part of the data.
+    """
+
+    min: Any = None
+    max: Any = None
+    null_count: Optional[int] = None
+
+
+def _merge_column_statistics(
+    column_statistics: List[Dict[str, _ColumnStatistics]]
+) -> Dict[str, _ColumnStatistics]:
+    """Aggregate the column statistics of multiple read tasks.
+
+    Only the columns with statistics for all the tasks are returned.
+    """
+    merged = {}
+    if not column_statistics:
+        return merged
+    for name in column_statistics[0]:
+        stats = [task_stats.get(name) for task_stats in column_statistics]
+        if any(s is None for s in stats):
+            continue
+        merged_stats = _ColumnStatistics()
+        if all(s.min is not None and s.max is not None for s in stats):
+            try:
+                merged_stats.min = min(s.min for s in stats)
+                merged_stats.max = max(s.max for s in stats)
+            except TypeError:
+                merged_stats.min = merged_stats.max = None
+        if all(s.null_count is not None for s in stats):
+            merged_stats.null_count = sum(s.null_count for s in stats)
+        merged[name] = merged_stats
+    return merged
+
+
+class _PushdownReadFn:
+    """A read function that operations can be pushed down into.
+
+    Datasources that are able to skip reading unused columns wrap their read
+    function with this class. The wrapped function is called with the list of
+    columns to read, or ``None`` to read all columns. If ``supports_filter`` is
+    True, it's also called with the predicate of the rows to read, or ``None`` to
+    read all rows.
+    """
+
+    def __init__(
+        self,
+        read_fn: Callable[..., Iterable[Block]],
+        supports_filter: bool = False,
+    ):
+        self._read_fn = read_fn
+        self.supports_filter = supports_filter
+
+    def __call__(
+        self,
+        columns: Optional[List[str]] = None,
+        predicate: Optional["Expr"] = None,
+    ) -> Iterable[Block]:
+        if self.supports_filter:
+            return self._read_fn(columns, predicate)
+        assert predicate is None, predicate
+        return self._read_fn(columns)
+
+
 @PublicAPI
 class RangeDatasource(Datasource):
     """An example datasource that generates ranges of numbers from [0..n).
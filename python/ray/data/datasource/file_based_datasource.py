@@ -1,8 +1,10 @@
 import itertools
+import math
 import pathlib
 import posixpath
 import sys
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,7 +32,13 @@ from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import _check_pyarrow_version, _resolve_custom_scheme
 from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext
-from ray.data.datasource.datasource import Datasource, Reader, ReadTask, WriteResult
+from ray.data.datasource.datasource import (
+    Datasource,
+    Reader,
+    ReadTask,
+    WriteResult,
+    _PushdownReadFn,
+)
 from ray.data.datasource.file_meta_provider import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -54,8 +62,18 @@ logger = DatasetLogger(__name__)
 # We should parallelize file size fetch operations beyond this threshold.
 FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD = 16
 
-# 16 file size fetches from S3 takes ~1.5 seconds with Arrow's S3FileSystem.
-PATHS_PER_FILE_SIZE_FETCH_TASK = 16
+# 16 file size fetches from S3 takes ~1.5 seconds with Arrow's S3FileSystem, so each
+# task fetches 16 rounds of METADATA_FETCH_NUM_THREADS file sizes.
+PATHS_PER_FILE_SIZE_FETCH_TASK = 256
+
+# The size of the chunks read when looking for the line breaks at the boundaries of the
+# byte ranges of split files.
+LINE_SEARCH_CHUNK_SIZE = 64 * 1024
+
+# The number of threads that each metadata fetch task uses to fetch the metadata of
+# its files concurrently. The fetches are dominated by the latency of the requests to
+# the storage service rather than by CPU time.
+METADATA_FETCH_NUM_THREADS = 16
 
 
 @DeveloperAPI
@@ -250,6 +268,34 @@ class FileBasedDatasource(Datasource):
             "Subclasses of FileBasedDatasource must implement _read_file()."
         )
 
+    def _prune_reader_args(self, columns: List[str], **reader_args) -> Dict[str, Any]:
+        """Returns the reader args for reading only the given columns of a file.
+
+        Subclasses whose readers can skip decoding unused columns should override
+        this method. The default implementation returns the reader args unchanged,
+        and the unused columns are dropped after reading each block.
+        """
+        return reader_args
+
+    def _supports_line_splitting(self, **reader_args) -> bool:
+        """Returns whether the files can be split at line boundaries into byte
+        ranges that are read independently, with the given reader args.
+
+        If ``DataContext.read_file_splitting_enabled`` is set, the large uncompressed
+        files of the datasources that support it are split into multiple read tasks.
+        Each byte range is read by ``_read_stream()`` like a whole file, prefixed by
+        the header returned by ``_read_split_header()``.
+        """
+        return False
+
+    def _read_split_header(self, f: "pyarrow.NativeFile", **reader_args) -> bytes:
+        """Returns the header to prefix the byte ranges of a split file with, except
+        the first one, e.g. the column names of a CSV file.
+
+        ``f`` is opened for random access.
+        """
+        return b""
+
     def write(
         self,
         blocks: Iterable[Block],
@@ -428,10 +474,14 @@ class _FileBasedDatasourceReader(Reader):
             open_stream_args = {}
 
         open_input_source = self._delegate._open_input_source
+        prune_reader_args = self._delegate._prune_reader_args
+        read_split_header = self._delegate._read_split_header
 
         def read_files(
             read_paths: List[str],
             fs: Union["pyarrow.fs.FileSystem", _S3FileSystemWrapper],
+            read_columns: Optional[List[str]] = None,
+            read_ranges: Optional[List[Optional[Tuple[int, int]]]] = None,
         ) -> Iterable[Block]:
             DataContext._set_current(ctx)
             logger.get_logger().debug(f"Reading {len(read_paths)} files.")
@@ -439,7 +489,9 @@ class _FileBasedDatasourceReader(Reader):
             output_buffer = BlockOutputBuffer(
                 block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
             )
-            for read_path in read_paths:
+            if read_ranges is None:
+                read_ranges = [None] * len(read_paths)
+            for read_path, read_range in zip(read_paths, read_ranges):
                 compression = open_stream_args.pop("compression", None)
                 if compression is None:
                     import pyarrow as pa
@@ -474,10 +526,29 @@ class _FileBasedDatasourceReader(Reader):
                     parse = PathPartitionParser(partitioning)
                     partitions = parse(read_path)
 
-                with open_input_source(fs, read_path, **open_stream_args) as f:
-                    for data in read_stream(f, read_path, **reader_args):
+                stream_args = reader_args
+                if read_columns is not None:
+                    stream_args = prune_reader_args(
+                        [col for col in read_columns if col not in partitions],
+                        **reader_args,
+                    )
+
+                if read_range is None:
+                    f = open_input_source(fs, read_path, **open_stream_args)
+                else:
+                    f = _open_byte_range(
+                        read_split_header, fs, read_path, *read_range, **stream_args
+                    )
+                    if f is None:
+                        # No line starts in the byte range.
+                        continue
+
+                with f:
+                    for data in read_stream(f, read_path, **stream_args):
                         if partitions:
                             data = _add_partitions(data, partitions)
+                        if read_columns is not None:
+                            data = BlockAccessor.for_block(data).select(read_columns)
 
                         output_buffer.add_block(data)
                         if output_buffer.has_next():
@@ -486,29 +557,165 @@ class _FileBasedDatasourceReader(Reader):
             if output_buffer.has_next():
                 yield output_buffer.next()
 
-        # fix https://github.com/ray-project/ray/issues/24296
-        parallelism = min(parallelism, len(paths))
+        if (
+            ctx.read_file_splitting_enabled
+            and None not in file_sizes
+            and self._delegate._supports_line_splitting(**reader_args)
+        ):
+            task_inputs = self._split_files(parallelism)
+        else:
+            # fix https://github.com/ray-project/ray/issues/24296
+            parallelism = min(parallelism, len(paths))
+            task_inputs = [
+                (read_paths, [None] * len(read_paths), file_sizes)
+                for read_paths, file_sizes in zip(
+                    np.array_split(paths, parallelism),
+                    np.array_split(file_sizes, parallelism),
+                )
+            ]
 
         read_tasks = []
-        for read_paths, file_sizes in zip(
-            np.array_split(paths, parallelism), np.array_split(file_sizes, parallelism)
-        ):
+        for read_paths, read_ranges, file_sizes in task_inputs:
             if len(read_paths) <= 0:
                 continue
 
+            rows_per_file = self._delegate._rows_per_file()
+            if any(read_range is not None for read_range in read_ranges):
+                # The byte ranges don't hold whole files.
+                rows_per_file = None
+            else:
+                read_ranges = None
             meta = self._meta_provider(
                 read_paths,
                 self._schema,
-                rows_per_file=self._delegate._rows_per_file(),
+                rows_per_file=rows_per_file,
                 file_sizes=file_sizes,
             )
-            read_task = ReadTask(
-                lambda read_paths=read_paths: read_files(read_paths, filesystem), meta
-            )
+            if _block_udf is None:
+                read_fn = _PushdownReadFn(
+                    lambda read_columns, p=read_paths, r=read_ranges: read_files(
+                        p, filesystem, read_columns, r
+                    )
+                )
+            else:
+                read_fn = lambda p=read_paths, r=read_ranges: read_files(  # noqa: E731
+                    p, filesystem, read_ranges=r
+                )
+            read_task = ReadTask(read_fn, meta)
             read_tasks.append(read_task)
 
         return read_tasks
 
+    def _split_files(
+        self, parallelism: int
+    ) -> List[Tuple[List[str], List[Optional[Tuple[int, int]]], List[int]]]:
+        """Return the paths, byte ranges and sizes of the inputs of each read task.
+
+        The uncompressed files that are larger than the target size of the read tasks
+        are split into byte ranges, and consecutive inputs are grouped so that each
+        task reads about the target size. The byte ranges are aligned to line
+        boundaries when they're read.
+        """
+        ctx = DataContext.get_current()
+        total_size = sum(self._file_sizes)
+        target_size = max(total_size / parallelism, ctx.target_min_block_size, 1)
+        inputs, input_sizes = [], []
+        for path, size in zip(self._paths, self._file_sizes):
+            if size <= target_size or _is_compressed(path, self._open_stream_args):
+                inputs.append((path, None, size))
+                input_sizes.append(size)
+                continue
+            num_splits = math.ceil(size / target_size)
+            split_size = math.ceil(size / num_splits)
+            for start in range(0, size, split_size):
+                end = min(start + split_size, size)
+                inputs.append((path, (start, end), end - start))
+                input_sizes.append(end - start)
+        return [
+            tuple(map(list, zip(*group)))
+            for group in _group_by_size(inputs, input_sizes, target_size)
+        ]
+
+
+def _is_compressed(path: str, open_stream_args: Optional[Dict[str, Any]]) -> bool:
+    """Whether the file is read with a compression codec, given explicitly or
+    detected from its extension."""
+    import pyarrow as pa
+
+    if open_stream_args and open_stream_args.get("compression") is not None:
+        return True
+    try:
+        pa.Codec.detect(path)
+        return True
+    except (ValueError, TypeError):
+        return pathlib.Path(path).suffix == ".snappy"
+
+
+def _open_byte_range(
+    read_split_header: Callable[..., bytes],
+    filesystem: "pyarrow.fs.FileSystem",
+    path: str,
+    start: int,
+    end: int,
+    **reader_args,
+) -> Optional["pyarrow.BufferReader"]:
+    """Open the lines of the file that start within the byte range ``[start, end)``,
+    prefixed by the header of the file if the range doesn't start at the beginning of
+    the file.
+
+    Returns None if no line starts within the byte range.
+    """
+    import pyarrow as pa
+
+    with filesystem.open_input_file(path) as f:
+        begin = _find_line_start(f, start)
+        stop = _find_line_start(f, end)
+        if begin >= stop:
+            return None
+        data = f.read_at(stop - begin, begin)
+        if begin > 0:
+            data = read_split_header(f, **reader_args) + data
+    return pa.BufferReader(data)
+
+
+def _find_line_start(f: "pyarrow.NativeFile", offset: int) -> int:
+    """Return the position of the first line of the file that starts at or after the
+    offset, or the size of the file if there is none."""
+    if offset == 0:
+        return 0
+    size = f.size()
+    # The line starts at the offset if the previous byte is a line break.
+    position = offset - 1
+    while position < size:
+        chunk = f.read_at(min(LINE_SEARCH_CHUNK_SIZE, size - position), position)
+        index = chunk.find(b"\n")
+        if index >= 0:
+            return position + index + 1
+        position += len(chunk)
+    return size
+
+
+def _read_first_line(f: "pyarrow.NativeFile") -> bytes:
+    """Return the first line of the file, including its line break."""
+    end = _find_line_start(f, 1)
+    return f.read_at(end, 0)
+
+
+def _group_by_size(items: List[Any], sizes: List[float], target_size: float):
+    """Group consecutive items, so that the total size of each group but the last
+    one is at least the target size, and less than the target size plus the size of
+    its last item."""
+    groups, group, group_size = [], [], 0
+    for item, size in zip(items, sizes):
+        group.append(item)
+        group_size += size
+        if group_size >= target_size:
+            groups.append(group)
+            group, group_size = [], 0
+    if group:
+        groups.append(group)
+    return groups
+
 
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
@@ -799,11 +1006,17 @@ Meta = TypeVar("Meta")
 
 def _fetch_metadata_parallel(
     uris: List[Uri],
-    fetch_func: Callable[[List[Uri]], List[Meta]],
+    fetch_func: Callable[..., List[Meta]],
     desired_uris_per_task: int,
+    fetch_args: Tuple[Any, ...] = (),
     **ray_remote_args,
 ) -> Iterator[Meta]:
-    """Fetch file metadata in parallel using Ray tasks."""
+    """Fetch file metadata in parallel using Ray tasks.
+
+    ``fetch_func`` is called with each chunk of URIs, followed by ``fetch_args``.
+    It must be a module-level function, since the remote function is cached by
+    ``fetch_func``.
+    """
     remote_fetch_func = cached_remote_fn(fetch_func, num_cpus=0.5)
     if ray_remote_args:
         remote_fetch_func = remote_fetch_func.options(**ray_remote_args)
@@ -816,6 +1029,20 @@ def _fetch_metadata_parallel(
     for uri_chunk in np.array_split(uris, parallelism):
         if len(uri_chunk) == 0:
             continue
-        fetch_tasks.append(remote_fetch_func.remote(uri_chunk))
+        fetch_tasks.append(remote_fetch_func.remote(uri_chunk, *fetch_args))
     results = metadata_fetch_bar.fetch_until_complete(fetch_tasks)
     yield from itertools.chain.from_iterable(results)
+
+
+def _fetch_metadata_threaded(
+    uris: List[Uri], fetch_func: Callable[[Uri], Meta]
+) -> List[Meta]:
+    """Fetch the metadata of each URI concurrently using a pool of threads.
+
+    The metadata is returned in the order of the URIs. The first exception raised by
+    ``fetch_func``, in the order of the URIs, is re-raised.
+    """
+    if len(uris) <= 1:
+        return [fetch_func(uri) for uri in uris]
+    with ThreadPoolExecutor(min(len(uris), METADATA_FETCH_NUM_THREADS)) as pool:
+        return list(pool.map(fetch_func, uris))
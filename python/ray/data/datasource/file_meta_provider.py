@@ -6,6 +6,7 @@ import re
 from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
 
 from ray.data.block import BlockMetadata
+from ray.data.context import DataContext
 from ray.data.datasource.partitioning import Partitioning
 from ray.util.annotations import DeveloperAPI
 
@@ -319,6 +320,7 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
             _SerializedPiece,
         )
 
+        metadata_cache_dir = DataContext.get_current().parquet_metadata_cache_dir
         if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
             # Wrap Parquet fragments in serialization workaround.
             pieces = [_SerializedPiece(piece) for piece in pieces]
@@ -328,11 +330,12 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
                     pieces,
                     _fetch_metadata_serialization_wrapper,
                     PIECES_PER_META_FETCH,
+                    fetch_args=(metadata_cache_dir,),
                     **ray_remote_args,
                 )
             )
         else:
-            return _fetch_metadata(pieces)
+            return _fetch_metadata(pieces, metadata_cache_dir)
 
 
 def _handle_read_os_error(error: OSError, paths: Union[str, List[str]]) -> str:
@@ -462,6 +465,7 @@ def _get_file_infos_parallel(
     from ray.data.datasource.file_based_datasource import (
         PATHS_PER_FILE_SIZE_FETCH_TASK,
         _fetch_metadata_parallel,
+        _fetch_metadata_threaded,
         _unwrap_s3_serialization_workaround,
         _wrap_s3_serialization_workaround,
     )
@@ -474,7 +478,9 @@ def _get_file_infos_parallel(
         fs = _unwrap_s3_serialization_workaround(filesystem)
         return list(
             itertools.chain.from_iterable(
-                _get_file_infos(path, fs, ignore_missing_paths) for path in paths
+                _fetch_metadata_threaded(
+                    paths, lambda path: _get_file_infos(path, fs, ignore_missing_paths)
+                )
             )
         )
 
@@ -35,6 +35,11 @@ class JSONDatasource(FileBasedDatasource):
         )
         return json.read_json(f, read_options=read_options, **reader_args)
 
+    def _supports_line_splitting(self, **reader_args) -> bool:
+        # Each line holds a JSON object, unless the values can contain line breaks.
+        parse_options = reader_args.get("parse_options")
+        return parse_options is None or not parse_options.newlines_in_values
+
     def _write_block(
         self,
         f: "pyarrow.NativeFile",
@@ -1,10 +1,31 @@
+import collections
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict
+import posixpath
+import urllib.parse
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict,
+    Tuple,
+)
+
+import numpy as np
 
-from ray.data.block import BlockAccessor
+from ray._private.utils import _add_creatable_buckets_param_if_s3_uri
+from ray.data._internal.execution.interfaces import TaskContext
+from ray.data.block import Block, BlockAccessor
+from ray.data.datasource.datasource import WriteResult
 from ray.data.datasource.file_based_datasource import (
+    BlockWritePathProvider,
+    DefaultBlockWritePathProvider,
     FileBasedDatasource,
     _resolve_kwargs,
+    _resolve_paths_and_filesystem,
 )
 from ray.util.annotations import PublicAPI
 
@@ -14,6 +35,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The default maximum number of files that each write task keeps open at once, when
+# writing partitioned or size-limited files.
+DEFAULT_MAX_OPEN_FILES = 64
+
+# The size in bytes of the rows buffered for a partition before they're written out
+# as a row group, when writing partitioned or size-limited files.
+PARTITION_BUFFER_SIZE = 64 * 1024 * 1024
+
+# The maximum total size in bytes of the rows buffered by each write task, when
+# writing partitioned or size-limited files. The largest buffers are written out
+# first when it's exceeded.
+MAX_BUFFERED_SIZE = 256 * 1024 * 1024
+
+# The directory name of the rows with null partition values, as in Hive.
+NULL_PARTITION_VALUE = "__HIVE_DEFAULT_PARTITION__"
+
 
 @PublicAPI
 class ParquetBaseDatasource(FileBasedDatasource):
@@ -34,6 +71,9 @@ class ParquetBaseDatasource(FileBasedDatasource):
         use_threads = reader_args.pop("use_threads", False)
         return pq.read_table(f, use_threads=use_threads, **reader_args)
 
+    def _prune_reader_args(self, columns: List[str], **reader_args) -> Dict[str, Any]:
+        return {**reader_args, "columns": columns}
+
     def _open_input_source(
         self,
         filesystem: "pyarrow.fs.FileSystem",
@@ -43,6 +83,77 @@ class ParquetBaseDatasource(FileBasedDatasource):
         # Parquet requires `open_input_file` due to random access reads
         return filesystem.open_input_file(path, **open_args)
 
+    def write(
+        self,
+        blocks: Iterable[Block],
+        ctx: TaskContext,
+        path: str,
+        dataset_uuid: str,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+        try_create_dir: bool = True,
+        open_stream_args: Optional[Dict[str, Any]] = None,
+        block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        _block_udf: Optional[Callable[[Block], Block]] = None,
+        partition_cols: Optional[List[str]] = None,
+        max_file_size: Optional[int] = None,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+        **write_args,
+    ) -> WriteResult:
+        """Write blocks to Parquet files.
+
+        If ``partition_cols`` or ``max_file_size`` is set, the blocks are streamed
+        into Hive-partitioned and/or size-limited files, see ``_PartitionedWriter``.
+        Otherwise, each write task writes a single file.
+        """
+        if partition_cols is None and max_file_size is None:
+            return super().write(
+                blocks,
+                ctx,
+                path,
+                dataset_uuid,
+                filesystem=filesystem,
+                try_create_dir=try_create_dir,
+                open_stream_args=open_stream_args,
+                block_path_provider=block_path_provider,
+                write_args_fn=write_args_fn,
+                _block_udf=_block_udf,
+                **write_args,
+            )
+
+        path, filesystem = _resolve_paths_and_filesystem(path, filesystem)
+        path = path[0]
+        if try_create_dir:
+            # Arrow's S3FileSystem doesn't allow creating buckets by default, so we add
+            # a query arg enabling bucket creation if an S3 URI is provided.
+            tmp = _add_creatable_buckets_param_if_s3_uri(path)
+            filesystem.create_dir(tmp, recursive=True)
+
+        writer = _PartitionedWriter(
+            filesystem,
+            path,
+            f"{dataset_uuid}_{ctx.task_idx:06}",
+            partition_cols or [],
+            max_file_size,
+            max_open_files,
+            open_stream_args or {},
+            _resolve_kwargs(write_args_fn, **write_args),
+        )
+        try:
+            for block in blocks:
+                if _block_udf is not None:
+                    block = _block_udf(block)
+                writer.write(BlockAccessor.for_block(block).to_arrow())
+        finally:
+            writer.close()
+
+        if writer.num_files_written == 0:
+            logger.warning(
+                f"Skipping writing empty dataset with UUID {dataset_uuid} at {path}",
+            )
+            return "skip"
+        return "ok"
+
     def _write_block(
         self,
         f: "pyarrow.NativeFile",
@@ -54,3 +165,175 @@ class ParquetBaseDatasource(FileBasedDatasource):
 
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         pq.write_table(block.to_arrow(), f, **writer_args)
+
+
+class _PartitionedWriter:
+    """Streams tables into Parquet files, partitioned by the values of some columns
+    and rolled over at a maximum size.
+
+    The rows of each partition are buffered until they're large enough to be written
+    out as a row group to the open file of the partition, in the Hive-style
+    directory ``{col1}={value1}/{col2}={value2}/`` under the base path. The
+    partition columns are dropped from the files, since they're encoded in the
+    paths. Once a file reaches the maximum size, it's closed, and the next rows of
+    the partition are written to a new file.
+
+    The number of open files is capped, by closing the least recently used file
+    when a file is opened for another partition. The total size of the buffered
+    rows is also capped, by writing out the largest buffers.
+    """
+
+    def __init__(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        base_path: str,
+        file_prefix: str,
+        partition_cols: List[str],
+        max_file_size: Optional[int],
+        max_open_files: int,
+        open_stream_args: Dict[str, Any],
+        writer_args: Dict[str, Any],
+    ):
+        if max_open_files < 1:
+            raise ValueError(
+                f"max_open_files must be at least 1, but got {max_open_files}."
+            )
+        self._filesystem = filesystem
+        self._base_path = base_path
+        self._file_prefix = file_prefix
+        self._partition_cols = partition_cols
+        self._max_file_size = max_file_size
+        self._max_open_files = max_open_files
+        self._open_stream_args = open_stream_args
+        # `row_group_size` is an argument of `pq.write_table()` rather than of the
+        # writer, so the row groups are split here.
+        self._row_group_size = writer_args.pop("row_group_size", None)
+        self._writer_args = writer_args
+        # The buffered tables and their total size, by partition directory.
+        self._buffers: Dict[str, List["pyarrow.Table"]] = collections.defaultdict(list)
+        self._buffer_sizes: Dict[str, int] = collections.defaultdict(int)
+        self._buffered_size = 0
+        # The open files and their writers by partition directory, least recently
+        # used first.
+        self._writers: OrderedDict[
+            str, Tuple["pyarrow.NativeFile", "pyarrow.parquet.ParquetWriter"]
+        ] = collections.OrderedDict()
+        self.num_files_written = 0
+
+    def write(self, table: "pyarrow.Table") -> None:
+        """Buffer the rows of the table, and write out the full buffers."""
+        for partition_dir, partition in self._split_by_partition(table):
+            size = partition.nbytes
+            self._buffers[partition_dir].append(partition)
+            self._buffer_sizes[partition_dir] += size
+            self._buffered_size += size
+            if self._buffer_sizes[partition_dir] >= PARTITION_BUFFER_SIZE:
+                self._flush(partition_dir)
+        while self._buffered_size > MAX_BUFFERED_SIZE:
+            self._flush(max(self._buffer_sizes, key=self._buffer_sizes.get))
+
+    def close(self) -> None:
+        """Write out all the buffers, and close all the files."""
+        for partition_dir in list(self._buffers):
+            self._flush(partition_dir)
+        while self._writers:
+            self._close_file(next(iter(self._writers)))
+
+    def _split_by_partition(
+        self, table: "pyarrow.Table"
+    ) -> Iterable[Tuple[str, "pyarrow.Table"]]:
+        """Split the table into the slices of rows with the same partition values,
+        with the partition columns dropped."""
+        import pyarrow.compute as pc
+
+        if table.num_rows == 0:
+            return
+        if not self._partition_cols:
+            yield "", table
+            return
+
+        indices = pc.sort_indices(
+            table, sort_keys=[(col, "ascending") for col in self._partition_cols]
+        )
+        table = table.take(indices)
+        # The indices of the rows where the partition values change. The values are
+        # compared as Arrow arrays, so that the nulls (which are sorted together)
+        # compare equal to each other.
+        is_boundary = np.zeros(table.num_rows - 1, dtype=bool)
+        for col in self._partition_cols:
+            values = table.column(col).combine_chunks()
+            prev, cur = values[:-1], values[1:]
+            changed = pc.or_(
+                pc.fill_null(pc.not_equal(cur, prev), False),
+                pc.xor(pc.is_null(cur), pc.is_null(prev)),
+            )
+            is_boundary |= changed.to_numpy(zero_copy_only=False)
+        starts = [0] + list(np.flatnonzero(is_boundary) + 1)
+        ends = starts[1:] + [table.num_rows]
+
+        data = table.drop(self._partition_cols)
+        for start, end in zip(starts, ends):
+            partition_dir = "/".join(
+                f"{col}={_encode_partition_value(table.column(col)[start].as_py())}"
+                for col in self._partition_cols
+            )
+            yield partition_dir, data.slice(start, end - start)
+
+    def _flush(self, partition_dir: str) -> None:
+        """Write out the buffered rows of the partition."""
+        from ray.data._internal.arrow_ops import transform_pyarrow
+
+        tables = self._buffers.pop(partition_dir, None)
+        if not tables:
+            return
+        self._buffered_size -= self._buffer_sizes.pop(partition_dir)
+        table = transform_pyarrow.concat(tables)
+
+        # Write the row groups one at a time, so that the file can be rolled over
+        # between them.
+        row_group_size = self._row_group_size or table.num_rows
+        for start in range(0, table.num_rows, row_group_size):
+            f, writer = self._open_file(partition_dir, table.schema)
+            writer.write_table(table.slice(start, row_group_size))
+            if self._max_file_size is not None and f.tell() >= self._max_file_size:
+                self._close_file(partition_dir)
+
+    def _open_file(
+        self, partition_dir: str, schema: "pyarrow.Schema"
+    ) -> Tuple["pyarrow.NativeFile", "pyarrow.parquet.ParquetWriter"]:
+        """Return the open file of the partition, opening a new one if needed."""
+        import pyarrow.parquet as pq
+
+        if partition_dir in self._writers:
+            self._writers.move_to_end(partition_dir)
+            return self._writers[partition_dir]
+
+        if len(self._writers) >= self._max_open_files:
+            self._close_file(next(iter(self._writers)))
+        dir_path = posixpath.join(self._base_path, partition_dir)
+        if partition_dir:
+            self._filesystem.create_dir(dir_path, recursive=True)
+        # Uses POSIX path for cross-filesystem compatibility, since PyArrow
+        # FileSystem paths are always forward slash separated.
+        path = posixpath.join(
+            dir_path, f"{self._file_prefix}_{self.num_files_written:06}.parquet"
+        )
+        logger.debug(f"Writing {path} file.")
+        f = self._filesystem.open_output_stream(path, **self._open_stream_args)
+        writer = pq.ParquetWriter(f, schema, **self._writer_args)
+        self._writers[partition_dir] = (f, writer)
+        self.num_files_written += 1
+        return f, writer
+
+    def _close_file(self, partition_dir: str) -> None:
+        f, writer = self._writers.pop(partition_dir)
+        writer.close()
+        f.close()
+
+
+def _encode_partition_value(value: Any) -> str:
+    """Return the directory name of a partition value, percent-encoded like in
+    ``pyarrow.parquet.write_to_dataset()``."""
+    if value is None:
+        return NULL_PARTITION_VALUE
+    return urllib.parse.quote(str(value), safe="")
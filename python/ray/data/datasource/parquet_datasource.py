@@ -1,5 +1,19 @@
+import hashlib
 import logging
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+import math
+import posixpath
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
@@ -10,8 +24,17 @@ from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import _check_pyarrow_version
 from ray.data.block import Block
 from ray.data.context import DataContext
-from ray.data.datasource.datasource import Reader, ReadTask
-from ray.data.datasource.file_based_datasource import _resolve_paths_and_filesystem
+from ray.data.datasource.datasource import (
+    Reader,
+    ReadTask,
+    _ColumnStatistics,
+    _PushdownReadFn,
+)
+from ray.data.datasource.file_based_datasource import (
+    _fetch_metadata_threaded,
+    _group_by_size,
+    _resolve_paths_and_filesystem,
+)
 from ray.data.datasource.file_meta_provider import (
     DefaultParquetMetadataProvider,
     ParquetMetadataProvider,
@@ -24,10 +47,13 @@ if TYPE_CHECKING:
     import pyarrow
     from pyarrow.dataset import ParquetFileFragment
 
+    from ray.data.expressions import Expr
+
 
 logger = logging.getLogger(__name__)
 
-PIECES_PER_META_FETCH = 6
+# Each metadata fetch task fetches 6 rounds of METADATA_FETCH_NUM_THREADS footers.
+PIECES_PER_META_FETCH = 96
 PARALLELIZE_META_FETCH_THRESHOLD = 24
 
 # The number of rows to read per batch. This is sized to generate 10MiB batches
@@ -68,9 +94,19 @@ PARQUET_ENCODING_RATIO_ESTIMATE_NUM_ROWS = 1024
 # TODO(ekl) this is a workaround for a pyarrow serialization bug, where serializing a
 # raw pyarrow file fragment causes S3 network calls.
 class _SerializedPiece:
-    def __init__(self, frag: "ParquetFileFragment"):
+    def __init__(
+        self, frag: "ParquetFileFragment", row_group_ids: Optional[List[int]] = None
+    ):
+        # The row groups of the fragment are passed explicitly, since getting them
+        # from the fragment reads the file metadata.
         self._data = cloudpickle.dumps(
-            (frag.format, frag.path, frag.filesystem, frag.partition_expression)
+            (
+                frag.format,
+                frag.path,
+                frag.filesystem,
+                frag.partition_expression,
+                row_group_ids,
+            )
         )
 
     def deserialize(self) -> "ParquetFileFragment":
@@ -78,10 +114,16 @@ class _SerializedPiece:
         # pyarrow.fs.
         import pyarrow.fs  # noqa: F401
 
-        (file_format, path, filesystem, partition_expression) = cloudpickle.loads(
-            self._data
+        (
+            file_format,
+            path,
+            filesystem,
+            partition_expression,
+            row_group_ids,
+        ) = cloudpickle.loads(self._data)
+        return file_format.make_fragment(
+            path, filesystem, partition_expression, row_groups=row_group_ids
         )
-        return file_format.make_fragment(path, filesystem, partition_expression)
 
 
 # Visible for test mocking.
@@ -267,13 +309,9 @@ class _ParquetDatasourceReader(Reader):
         # which simplifies partitioning logic. We still use
         # FileBasedDatasource's write side (do_write), however.
         read_tasks = []
-        for pieces, metadata in zip(
-            np.array_split(self._pq_ds.pieces, parallelism),
-            np.array_split(self._metadata, parallelism),
-        ):
+        for pieces, metadata, serialized_pieces in self._split_pieces(parallelism):
             if len(pieces) <= 0:
                 continue
-            serialized_pieces = [_SerializedPiece(p) for p in pieces]
             input_files = [p.path for p in pieces]
             meta = self._meta_provider(
                 input_files,
@@ -313,22 +351,116 @@ class _ParquetDatasourceReader(Reader):
                 self._columns,
                 self._schema,
             )
-            read_tasks.append(
-                ReadTask(
-                    lambda p=serialized_pieces: _read_pieces(
+            if block_udf is None:
+                # Without a block UDF, the output rows are the Parquet rows, so we
+                # can let the optimizer prune the columns and rows to read.
+                read_fn = _PushdownReadFn(
+                    lambda read_columns, predicate, p=serialized_pieces: _read_pieces(
                         block_udf,
                         reader_args,
                         default_read_batch_size,
-                        columns,
+                        read_columns if read_columns is not None else columns,
                         schema,
                         p,
+                        predicate=predicate,
                     ),
-                    meta,
+                    supports_filter=True,
                 )
-            )
+            else:
+                read_fn = lambda p=serialized_pieces: _read_pieces(  # noqa: E731
+                    block_udf,
+                    reader_args,
+                    default_read_batch_size,
+                    columns,
+                    schema,
+                    p,
+                )
+            read_task = ReadTask(read_fn, meta)
+            # The statistics only describe the output rows if they're the Parquet
+            # rows, i.e. without a block UDF.
+            if (
+                DataContext.get_current().parquet_column_statistics_enabled
+                and block_udf is None
+                and len(metadata) == len(pieces)
+            ):
+                read_task._set_column_statistics(
+                    _get_column_statistics(metadata, schema)
+                )
+            read_tasks.append(read_task)
 
         return read_tasks
 
+    def _split_pieces(
+        self, parallelism: int
+    ) -> List[Tuple[List["ParquetFileFragment"], List[Any], List[_SerializedPiece]]]:
+        """Return the pieces, their metadata and their serialized form for each read
+        task."""
+        pieces = self._pq_ds.pieces
+        if (
+            DataContext.get_current().read_file_splitting_enabled
+            and len(pieces) > 0
+            and len(self._metadata) == len(pieces)
+        ):
+            return self._split_pieces_by_row_groups(parallelism)
+        return [
+            (pieces, metadata, [_SerializedPiece(p) for p in pieces])
+            for pieces, metadata in zip(
+                np.array_split(pieces, parallelism),
+                np.array_split(self._metadata, parallelism),
+            )
+        ]
+
+    def _split_pieces_by_row_groups(
+        self, parallelism: int
+    ) -> List[Tuple[List["ParquetFileFragment"], List[Any], List[_SerializedPiece]]]:
+        """Split the files that are larger than the target size of the read tasks into
+        subsets of their row groups, and group consecutive pieces so that each task
+        reads about the target size, according to the estimated in-memory sizes."""
+        row_group_sizes = [
+            [
+                metadata.row_group(i).total_byte_size * self._encoding_ratio
+                for i in range(metadata.num_row_groups)
+            ]
+            for metadata in self._metadata
+        ]
+        total_size = sum(sum(sizes) for sizes in row_group_sizes)
+        target_size = max(
+            total_size / parallelism,
+            DataContext.get_current().target_min_block_size,
+            1,
+        )
+        inputs, input_sizes = [], []
+        for piece, metadata, sizes in zip(
+            self._pq_ds.pieces, self._metadata, row_group_sizes
+        ):
+            size = sum(sizes)
+            if size <= target_size or len(sizes) <= 1:
+                inputs.append((piece, metadata, _SerializedPiece(piece)))
+                input_sizes.append(size)
+                continue
+            num_splits = math.ceil(size / target_size)
+            for row_group_ids in _group_by_size(
+                list(range(len(sizes))), sizes, size / num_splits
+            ):
+                subset = piece.format.make_fragment(
+                    piece.path,
+                    piece.filesystem,
+                    piece.partition_expression,
+                    row_groups=row_group_ids,
+                )
+                inputs.append(
+                    (
+                        subset,
+                        _RowGroupsMetadata(metadata, row_group_ids),
+                        _SerializedPiece(subset, row_group_ids),
+                    )
+                )
+                input_sizes.append(sum(sizes[i] for i in row_group_ids))
+        return [
+            tuple(map(list, zip(*group)))
+            for group in _group_by_size(inputs, input_sizes, target_size)
+        ]
+
     def _estimate_files_encoding_ratio(self) -> float:
         """Return an estimate of the Parquet files encoding ratio.
 
@@ -389,6 +521,7 @@ def _read_pieces(
     columns,
     schema,
     serialized_pieces: List[_SerializedPiece],
+    predicate: Optional["Expr"] = None,
 ) -> Iterator["pyarrow.Table"]:
     # This import is necessary to load the tensor extension type.
     from ray.data.extensions.tensor_extension import ArrowTensorType  # noqa
@@ -413,24 +546,58 @@ def _read_pieces(
     logger.debug(f"Reading {len(pieces)} parquet pieces")
     use_threads = reader_args.pop("use_threads", False)
     batch_size = reader_args.pop("batch_size", default_read_batch_size)
+    output_schema = _project_schema(schema, columns)
     for piece in pieces:
         part = _get_partition_keys(piece.partition_expression)
+        piece_args = reader_args
+        piece_columns = columns
+        # Predicates on partition columns can't be evaluated by the Arrow scanner,
+        # since the partition values are only filled in below.
+        post_filter = (
+            predicate
+            if predicate is not None and predicate._columns() & part.keys()
+            else None
+        )
+        if predicate is not None and post_filter is None:
+            # Let Arrow skip the row groups that can't match using the column
+            # statistics, and filter the remaining rows while decoding.
+            piece_args = dict(reader_args)
+            pushed_filter = predicate._to_pyarrow()
+            if piece_args.get("filter") is not None:
+                pushed_filter = piece_args["filter"] & pushed_filter
+            piece_args["filter"] = pushed_filter
+        elif post_filter is not None and columns is not None:
+            piece_columns = list(columns) + sorted(
+                c for c in post_filter._columns() if c not in columns
+            )
         batches = piece.to_batches(
             use_threads=use_threads,
-            columns=columns,
+            columns=piece_columns,
             schema=schema,
             batch_size=batch_size,
-            **reader_args,
+            **piece_args,
         )
         for batch in batches:
-            table = pa.Table.from_batches([batch], schema=schema)
+            table = pa.Table.from_batches(
+                [batch],
+                schema=output_schema
+                if piece_columns is columns
+                else _project_schema(schema, piece_columns),
+            )
             if part:
                 for col, value in part.items():
+                    if col not in table.column_names:
+                        # The partition column was pruned from the read.
+                        continue
                     table = table.set_column(
                         table.schema.get_field_index(col),
                         col,
                         pa.array([value] * len(table)),
                     )
+            if post_filter is not None:
+                table = post_filter._filter(table)
+                if piece_columns is not columns:
+                    table = table.select(columns)
             # If the table is empty, drop it.
             if table.num_rows > 0:
                 output_buffer.add_block(table)
@@ -441,28 +608,181 @@ def _read_pieces(
         yield output_buffer.next()
 
 
+def _project_schema(
+    schema: Optional["pyarrow.lib.Schema"], columns: Optional[List[str]]
+) -> Optional["pyarrow.lib.Schema"]:
+    """Return the subset of ``schema`` for the given columns."""
+    if schema is None or columns is None:
+        return schema
+
+    import pyarrow as pa
+
+    return pa.schema([schema.field(column) for column in columns], schema.metadata)
+
+
+class _RowGroupsMetadata:
+    """The metadata of a subset of the row groups of a Parquet file.
+
+    This implements the part of the ``pyarrow.parquet.FileMetaData`` interface that
+    is used by the metadata providers.
+    """
+
+    def __init__(
+        self, metadata: "pyarrow.parquet.FileMetaData", row_group_ids: List[int]
+    ):
+        self._metadata = metadata
+        self._row_group_ids = row_group_ids
+        self.num_rows = sum(metadata.row_group(i).num_rows for i in row_group_ids)
+        self.num_row_groups = len(row_group_ids)
+
+    def row_group(self, i: int) -> "pyarrow.parquet.RowGroupMetaData":
+        return self._metadata.row_group(self._row_group_ids[i])
+
+
+def _get_column_statistics(
+    file_metadata: List["pyarrow.parquet.FileMetaData"],
+    schema: Optional["pyarrow.lib.Schema"],
+) -> Dict[str, _ColumnStatistics]:
+    """Aggregate the statistics of the top-level columns of ``schema`` over all
+    the row groups of the given files."""
+    names = set(getattr(schema, "names", None) or [])
+    column_stats = {}
+    unknown_min_max, unknown_null_count = set(), set()
+    for metadata in file_metadata:
+        for row_group_idx in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_idx)
+            seen = set()
+            for column_idx in range(row_group.num_columns):
+                column = row_group.column(column_idx)
+                name = column.path_in_schema
+                if name not in names:
+                    continue
+                seen.add(name)
+                stats = column_stats.setdefault(name, _ColumnStatistics())
+                statistics = column.statistics
+                if statistics is None or not statistics.has_min_max:
+                    unknown_min_max.add(name)
+                elif name not in unknown_min_max:
+                    try:
+                        if stats.min is None or statistics.min < stats.min:
+                            stats.min = statistics.min
+                        if stats.max is None or statistics.max > stats.max:
+                            stats.max = statistics.max
+                    except TypeError:
+                        unknown_min_max.add(name)
+                if statistics is None or not getattr(
+                    statistics, "has_null_count", True
+                ):
+                    unknown_null_count.add(name)
+                elif name not in unknown_null_count:
+                    stats.null_count = (stats.null_count or 0) + statistics.null_count
+            # Columns that are missing from a row group have unknown statistics.
+            unknown_min_max |= names - seen
+            unknown_null_count |= names - seen
+
+    for name, stats in column_stats.items():
+        if name in unknown_min_max:
+            stats.min = stats.max = None
+        if name in unknown_null_count:
+            stats.null_count = None
+    return column_stats
+
+
 def _fetch_metadata_serialization_wrapper(
     pieces: _SerializedPiece,
+    metadata_cache_dir: Optional[str] = None,
 ) -> List["pyarrow.parquet.FileMetaData"]:
     pieces: List[
         "pyarrow._dataset.ParquetFileFragment"
     ] = _deserialize_pieces_with_retry(pieces)
 
-    return _fetch_metadata(pieces)
+    return _fetch_metadata(pieces, metadata_cache_dir)
 
 
 def _fetch_metadata(
     pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    metadata_cache_dir: Optional[str] = None,
 ) -> List["pyarrow.parquet.FileMetaData"]:
-    piece_metadata = []
-    for p in pieces:
+    cache = None
+    if metadata_cache_dir is not None:
+        cache = _ParquetMetadataCache(metadata_cache_dir)
+
+    def fetch(p: "pyarrow.dataset.ParquetFileFragment"):
         try:
-            piece_metadata.append(p.metadata)
+            if cache is not None:
+                return cache.get_or_fetch(p)
+            return p.metadata
         except AttributeError:
+            return None
+
+    piece_metadata = []
+    for metadata in _fetch_metadata_threaded(pieces, fetch):
+        if metadata is None:
             break
+        piece_metadata.append(metadata)
     return piece_metadata
 
 
+class _ParquetMetadataCache:
+    """A persistent cache of the metadata (footers) of Parquet files.
+
+    The entries are keyed by the path, size and modification time of the files, so
+    that the metadata of modified files is fetched again. Each entry is written to a
+    temporary file that is then moved, so that partially written entries are never
+    read.
+    """
+
+    def __init__(self, cache_dir: str):
+        paths, self._filesystem = _resolve_paths_and_filesystem(cache_dir)
+        self._cache_dir = paths[0]
+        self._filesystem.create_dir(self._cache_dir, recursive=True)
+
+    def get_or_fetch(
+        self, piece: "pyarrow.dataset.ParquetFileFragment"
+    ) -> "pyarrow.parquet.FileMetaData":
+        """Return the cached metadata of the file, fetching and caching it on a
+        miss."""
+        entry_path = self._entry_path(piece.filesystem.get_file_info(piece.path))
+        if entry_path is None:
+            return piece.metadata
+        metadata = self._get(entry_path)
+        if metadata is None:
+            metadata = piece.metadata
+            self._put(entry_path, metadata)
+        return metadata
+
+    def _entry_path(self, file_info: "pyarrow.fs.FileInfo") -> Optional[str]:
+        if file_info.mtime_ns is None:
+            # Changes to the file can't be detected.
+            return None
+        key = f"{file_info.path}:{file_info.size}:{file_info.mtime_ns}"
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return posixpath.join(self._cache_dir, f"{name}.parquet")
+
+    def _get(self, entry_path: str) -> Optional["pyarrow.parquet.FileMetaData"]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            with self._filesystem.open_input_file(entry_path) as f:
+                return pq.read_metadata(f)
+        except (OSError, pa.ArrowInvalid):
+            return None
+
+    def _put(self, entry_path: str, metadata: "pyarrow.parquet.FileMetaData"):
+        tmp_path = f"{entry_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with self._filesystem.open_output_stream(tmp_path) as f:
+                metadata.write_metadata_file(f)
+            self._filesystem.move(tmp_path, entry_path)
+        except OSError:
+            # The cache is best-effort.
+            logger.debug(
+                f"Failed to cache the Parquet metadata in {entry_path}.",
+                exc_info=True,
+            )
+
+
 def _sample_piece(
     reader_args,
     columns,
@@ -0,0 +1,519 @@
+import operator
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Union
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.dataset
+
+
+# Comparison operators, mapped to the names of the corresponding `pyarrow.compute`
+# functions.
+_COMPARISON_OPS = {
+    "==": "equal",
+    "!=": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+
+# The comparison operator to use when the operands of a comparison are swapped.
+_FLIPPED_COMPARISON_OPS = {
+    "==": "==",
+    "!=": "!=",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+# Boolean operators, mapped to the names of the corresponding `pyarrow.compute`
+# functions. Kleene logic is used so that nulls behave like in SQL.
+_BOOLEAN_OPS = {
+    "&": "and_kleene",
+    "|": "or_kleene",
+}
+
+# Arithmetic operators, mapped to the names of the corresponding `pyarrow.compute`
+# functions. Division always casts its operands to float64, so that integers are
+# divided like in Python rather than truncated.
+_ARITHMETIC_OPS = {
+    "+": "add",
+    "-": "subtract",
+    "*": "multiply",
+    "/": "divide",
+}
+
+
+# Python operators, used to build the equivalent Arrow dataset expressions.
+_PYTHON_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "&": operator.and_,
+    "|": operator.or_,
+}
+
+
+@PublicAPI(stability="alpha")
+class Expr:
+    """An expression over the columns of a :class:`~ray.data.Dataset`.
+
+    Expressions are built from :func:`col` and :func:`lit` with Python comparison,
+    boolean and arithmetic operators. Unlike Python UDFs, expressions are evaluated
+    with vectorized Arrow kernels and can be inspected by the optimizer, e.g. to
+    push a filter down into the read.
+
+    Combine predicates with ``&``, ``|`` and ``~`` rather than ``and``, ``or`` and
+    ``not``.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range(10)
+        >>> ds.filter((col("id") >= 3) & (col("id") < 5)).take_all()
+        [{'id': 3}, {'id': 4}]
+        >>> ds.with_column("double_id", col("id") * 2).take(2)
+        [{'id': 0, 'double_id': 0}, {'id': 1, 'double_id': 2}]
+    """
+
+    def __eq__(self, other: Any) -> "Expr":
+        return _ComparisonExpr("==", self, _to_expr(other))
+
+    def __ne__(self, other: Any) -> "Expr":
+        return _ComparisonExpr("!=", self, _to_expr(other))
+
+    def __lt__(self, other: Any) -> "Expr":
+        return _ComparisonExpr("<", self, _to_expr(other))
+
+    def __le__(self, other: Any) -> "Expr":
+        return _ComparisonExpr("<=", self, _to_expr(other))
+
+    def __gt__(self, other: Any) -> "Expr":
+        return _ComparisonExpr(">", self, _to_expr(other))
+
+    def __ge__(self, other: Any) -> "Expr":
+        return _ComparisonExpr(">=", self, _to_expr(other))
+
+    def __and__(self, other: Any) -> "Expr":
+        return _BooleanExpr("&", self, _to_expr(other))
+
+    def __rand__(self, other: Any) -> "Expr":
+        return _BooleanExpr("&", _to_expr(other), self)
+
+    def __or__(self, other: Any) -> "Expr":
+        return _BooleanExpr("|", self, _to_expr(other))
+
+    def __ror__(self, other: Any) -> "Expr":
+        return _BooleanExpr("|", _to_expr(other), self)
+
+    def __invert__(self) -> "Expr":
+        return _NotExpr(self)
+
+    def __add__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("+", self, _to_expr(other))
+
+    def __radd__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("+", _to_expr(other), self)
+
+    def __sub__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("-", self, _to_expr(other))
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("-", _to_expr(other), self)
+
+    def __mul__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("*", self, _to_expr(other))
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("*", _to_expr(other), self)
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("/", self, _to_expr(other))
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return _ArithmeticExpr("/", _to_expr(other), self)
+
+    def __neg__(self) -> "Expr":
+        return _NegateExpr(self)
+
+    # Defining __eq__ would otherwise make expressions unhashable.
+    __hash__ = object.__hash__
+
+    def __bool__(self) -> bool:
+        raise TypeError(
+            "The truth value of an expression is ambiguous. Use `&`, `|` and `~` "
+            "instead of `and`, `or` and `not` to combine expressions."
+        )
+
+    def is_null(self) -> "Expr":
+        """Return a predicate that is true where this expression is null."""
+        return _IsNullExpr(self)
+
+    def is_in(self, values: List[Any]) -> "Expr":
+        """Return a predicate that is true where this expression is in ``values``."""
+        return _IsInExpr(self, list(values))
+
+    def _columns(self) -> Set[str]:
+        """Return the names of the columns referenced by this expression."""
+        raise NotImplementedError
+
+    def _eval(
+        self, table: "pyarrow.Table"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Scalar"]:
+        """Evaluate this expression on the given table."""
+        raise NotImplementedError
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        """Convert this expression to an Arrow dataset expression."""
+        raise NotImplementedError
+
+    def _filter(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        """Return the rows of the given table that satisfy this predicate."""
+        import pyarrow as pa
+
+        mask = self._eval(table)
+        if isinstance(mask, pa.Scalar):
+            # The predicate doesn't reference any column.
+            return table if mask.as_py() else table.slice(0, 0)
+        return table.filter(mask)
+
+    def _with_column(self, table: "pyarrow.Table", name: str) -> "pyarrow.Table":
+        """Return the given table with the column ``name`` set to the values of
+        this expression, replacing the existing column if there is one."""
+        import pyarrow as pa
+
+        values = self._eval(table)
+        if isinstance(values, pa.Scalar):
+            # The expression doesn't reference any column.
+            values = pa.array([values.as_py()] * table.num_rows, type=values.type)
+        if name in table.column_names:
+            return table.set_column(table.column_names.index(name), name, values)
+        return table.append_column(name, values)
+
+    def _could_match(self, column_stats: Dict[str, Any]) -> bool:
+        """Return False if no row can satisfy this predicate, given the statistics
+        of the columns (objects with ``min``, ``max`` and ``null_count`` attributes,
+        which may be None if unknown).
+
+        This is used to skip reading data that can't match a filter. It must be
+        conservative, i.e. return True whenever it can't rule out a match.
+        """
+        return True
+
+
+@PublicAPI(stability="alpha")
+class ColumnExpr(Expr):
+    """An expression referencing a column by name."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _columns(self) -> Set[str]:
+        return {self.name}
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        return table.column(self.name)
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pa_ds
+
+        return pa_ds.field(self.name)
+
+    def __repr__(self) -> str:
+        return f"col({self.name!r})"
+
+
+@PublicAPI(stability="alpha")
+class LiteralExpr(Expr):
+    """An expression for a constant value."""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def _columns(self) -> Set[str]:
+        return set()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.Scalar":
+        import pyarrow as pa
+
+        return pa.scalar(self.value)
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pa_ds
+
+        return pa_ds.scalar(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class _ComparisonExpr(Expr):
+    def __init__(self, op: str, left: Expr, right: Expr):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def _columns(self) -> Set[str]:
+        return self.left._columns() | self.right._columns()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        import pyarrow.compute as pc
+
+        fn = getattr(pc, _COMPARISON_OPS[self.op])
+        return fn(self.left._eval(table), self.right._eval(table))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        fn = _PYTHON_OPS[self.op]
+        return fn(self.left._to_pyarrow(), self.right._to_pyarrow())
+
+    def _could_match(self, column_stats: Dict[str, Any]) -> bool:
+        if isinstance(self.left, ColumnExpr) and isinstance(self.right, LiteralExpr):
+            name, op, value = self.left.name, self.op, self.right.value
+        elif isinstance(self.left, LiteralExpr) and isinstance(self.right, ColumnExpr):
+            name, value = self.right.name, self.left.value
+            op = _FLIPPED_COMPARISON_OPS[self.op]
+        else:
+            return True
+
+        stats = column_stats.get(name)
+        if stats is None or stats.min is None or stats.max is None or value is None:
+            return True
+        try:
+            if op == "==":
+                return stats.min <= value <= stats.max
+            elif op == "!=":
+                # The statistics of float columns leave out NaNs, which don't equal
+                # any value, so they can't rule out any row.
+                if isinstance(stats.min, float) or isinstance(value, float):
+                    return True
+                return not (stats.min == value and stats.max == value)
+            elif op == "<":
+                return stats.min < value
+            elif op == "<=":
+                return stats.min <= value
+            elif op == ">":
+                return stats.max > value
+            else:
+                return stats.max >= value
+        except TypeError:
+            # The statistics aren't comparable with the literal.
+            return True
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class _BooleanExpr(Expr):
+    def __init__(self, op: str, left: Expr, right: Expr):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def _columns(self) -> Set[str]:
+        return self.left._columns() | self.right._columns()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        import pyarrow.compute as pc
+
+        fn = getattr(pc, _BOOLEAN_OPS[self.op])
+        return fn(self.left._eval(table), self.right._eval(table))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        fn = _PYTHON_OPS[self.op]
+        return fn(self.left._to_pyarrow(), self.right._to_pyarrow())
+
+    def _could_match(self, column_stats: Dict[str, Any]) -> bool:
+        if self.op == "&":
+            return self.left._could_match(column_stats) and self.right._could_match(
+                column_stats
+            )
+        return self.left._could_match(column_stats) or self.right._could_match(
+            column_stats
+        )
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class _ArithmeticExpr(Expr):
+    def __init__(self, op: str, left: Expr, right: Expr):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def _columns(self) -> Set[str]:
+        return self.left._columns() | self.right._columns()
+
+    def _eval(
+        self, table: "pyarrow.Table"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Scalar"]:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        fn = getattr(pc, _ARITHMETIC_OPS[self.op])
+        left = self.left._eval(table)
+        right = self.right._eval(table)
+        if self.op == "/":
+            left = left.cast(pa.float64())
+            right = right.cast(pa.float64())
+        return fn(left, right)
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        left = self.left._to_pyarrow()
+        right = self.right._to_pyarrow()
+        if self.op == "/":
+            left = left.cast(pa.float64())
+            right = right.cast(pa.float64())
+        return pc.Expression._call(_ARITHMETIC_OPS[self.op], [left, right])
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class _NegateExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def _columns(self) -> Set[str]:
+        return self.operand._columns()
+
+    def _eval(
+        self, table: "pyarrow.Table"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Scalar"]:
+        import pyarrow.compute as pc
+
+        return pc.negate(self.operand._eval(table))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.compute as pc
+
+        return pc.Expression._call("negate", [self.operand._to_pyarrow()])
+
+    def __repr__(self) -> str:
+        return f"-{self.operand!r}"
+
+
+class _NotExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def _columns(self) -> Set[str]:
+        return self.operand._columns()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        import pyarrow.compute as pc
+
+        return pc.invert(self.operand._eval(table))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        return ~self.operand._to_pyarrow()
+
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+
+class _IsNullExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def _columns(self) -> Set[str]:
+        return self.operand._columns()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        import pyarrow.compute as pc
+
+        return pc.is_null(self.operand._eval(table))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        return self.operand._to_pyarrow().is_null()
+
+    def _could_match(self, column_stats: Dict[str, Any]) -> bool:
+        if not isinstance(self.operand, ColumnExpr):
+            return True
+        stats = column_stats.get(self.operand.name)
+        return stats is None or stats.null_count is None or stats.null_count > 0
+
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.is_null()"
+
+
+class _IsInExpr(Expr):
+    def __init__(self, operand: Expr, values: List[Any]):
+        self.operand = operand
+        self.values = values
+
+    def _columns(self) -> Set[str]:
+        return self.operand._columns()
+
+    def _eval(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        return pc.is_in(self.operand._eval(table), value_set=pa.array(self.values))
+
+    def _to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        return self.operand._to_pyarrow().isin(self.values)
+
+    def _could_match(self, column_stats: Dict[str, Any]) -> bool:
+        if not isinstance(self.operand, ColumnExpr):
+            return True
+        stats = column_stats.get(self.operand.name)
+        if stats is None or stats.min is None or stats.max is None:
+            return True
+        try:
+            return any(
+                v is not None and stats.min <= v <= stats.max for v in self.values
+            )
+        except TypeError:
+            return True
+
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.is_in({self.values!r})"
+
+
+def _to_expr(value: Any) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    return LiteralExpr(value)
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> ColumnExpr:
+    """Reference a column of a :class:`~ray.data.Dataset` in an expression.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range(5)
+        >>> ds.filter(col("id") > 2).take_all()
+        [{'id': 3}, {'id': 4}]
+
+    Args:
+        name: The name of the column.
+    """
+    return ColumnExpr(name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> LiteralExpr:
+    """Use a constant value in an expression.
+
+    Python values are converted to literals automatically when combined with other
+    expressions, so this is only needed when neither operand is an expression.
+
+    Args:
+        value: The constant value.
+    """
+    return LiteralExpr(value)
+
+
+__all__ = ["ColumnExpr", "Expr", "LiteralExpr", "col", "lit"]
@@ -288,10 +288,10 @@ class GroupedData:
             value is combined from results of all groups.
         """
         # Globally sort records by key.
-        # Note that sort() will ensure that records of the same key partitioned
-        # into the same block.
+        # Note that the sort doesn't split heavy keys, which ensures that records of
+        # the same key are partitioned into the same block.
         if self._key is not None:
-            sorted_ds = self._dataset.sort(self._key)
+            sorted_ds = self._dataset._sort(SortKey(self._key), split_heavy_keys=False)
         else:
             sorted_ds = self._dataset.repartition(1)
 
@@ -18,7 +18,12 @@ import numpy as np
 
 from ray.data._internal.block_batching import batch_block_refs
 from ray.data._internal.block_batching.iter_batches import iter_batches
+from ray.data._internal.block_batching.util import skip_rows
 from ray.data._internal.stats import DatasetStats
+from ray.data._internal.torch_host_buffers import (
+    HostBufferBatch,
+    TorchHostBufferPool,
+)
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -87,6 +92,13 @@ class DataIterator(abc.ABC):
         :class:`~ray.data.Preprocessor`, and a :class:`~ray.air.DatasetConfig`.
     """
 
+    # The position of the iteration, see state_dict().
+    _num_epochs_completed: int = 0
+    _num_rows_consumed: int = 0
+    # The number of rows to skip at the start of the next iteration, to resume from
+    # the position loaded by load_state_dict().
+    _num_rows_to_skip: int = 0
+
     @abc.abstractmethod
     def _to_block_iterator(
         self,
@@ -153,6 +165,8 @@ class DataIterator(abc.ABC):
                 minimum number of rows that must be in the local in-memory shuffle
                 buffer in order to yield a batch. When there are no more rows to add to
                 the buffer, the remaining rows in the buffer will be drained.
+                See ``DataContext.local_shuffle_strategy`` for how the buffer is
+                shuffled.
             local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
@@ -186,6 +200,16 @@ class DataIterator(abc.ABC):
             # needing to explicitly call `iter_batches()` multiple times.
             block_iterator, stats, blocks_owned_by_consumer = self._to_block_iterator()
 
+            # Resume from the position loaded by load_state_dict(), if any.
+            num_rows_to_skip = self._num_rows_to_skip
+            self._num_rows_to_skip = 0
+            self._num_rows_consumed = num_rows_to_skip
+            if num_rows_to_skip > 0:
+                block_iterator = skip_rows(block_iterator, num_rows_to_skip)
+
+            def on_batch_yielded(num_rows: int):
+                self._num_rows_consumed += num_rows
+
             if use_legacy:
                 # Legacy iter_batches does not use metadata.
                 def drop_metadata(block_iterator):
@@ -229,12 +253,16 @@ class DataIterator(abc.ABC):
                         shuffle_buffer_min_size=local_shuffle_buffer_size,
                         shuffle_seed=local_shuffle_seed,
                         prefetch_batches=prefetch_batches,
+                        on_batch_yielded=on_batch_yielded,
                     )
                 )
 
             for batch in iterator:
                 yield batch
 
+            self._num_epochs_completed += 1
+            self._num_rows_consumed = 0
+
             if stats:
                 stats.iter_total_s.add(time.perf_counter() - time_start)
 
@@ -281,6 +309,59 @@ class DataIterator(abc.ABC):
 
         return _IterableFromIterator(_wrapped_iterator)
 
+    def state_dict(self) -> Dict[str, int]:
+        """Return a snapshot of the position of the iteration, which can be saved
+        in a checkpoint and restored with :meth:`load_state_dict`.
+
+        The position consists of the number of epochs (i.e. complete iterations)
+        completed, and the number of rows yielded so far in the current epoch. A
+        batch is counted as soon as it's yielded, so a snapshot taken while
+        processing a batch resumes after it.
+
+        Examples:
+            >>> import ray
+            >>> it = ray.data.range(10).iterator()
+            >>> batches = iter(it.iter_batches(batch_size=4))
+            >>> next(batches)
+            {'id': array([0, 1, 2, 3])}
+            >>> state = it.state_dict()
+            >>> state
+            {'num_epochs_completed': 0, 'num_rows_consumed': 4}
+            >>> it = ray.data.range(10).iterator()
+            >>> it.load_state_dict(state)
+            >>> next(iter(it.iter_batches(batch_size=4)))
+            {'id': array([4, 5, 6, 7])}
+
+        With Ray Train, save the state of the dataset shard in the checkpoints, and
+        load it into the shard when the training is restored from a checkpoint, so
+        that the data that was already trained on isn't read again in the
+        interrupted epoch. Resuming is only exact if the dataset yields the same rows
+        in the same order to the iterator, e.g. if
+        ``DataContext.execution_options.preserve_order`` is set. The position isn't
+        tracked when ``DataContext.use_legacy_iter_batches`` is set.
+
+        Returns:
+            A dict with the ``num_epochs_completed`` and ``num_rows_consumed`` keys.
+        """
+        return {
+            "num_epochs_completed": self._num_epochs_completed,
+            "num_rows_consumed": self._num_rows_consumed,
+        }
+
+    def load_state_dict(self, state: Dict[str, int]) -> None:
+        """Restore the position of the iteration from a snapshot returned by
+        :meth:`state_dict`.
+
+        The next iteration skips the rows consumed in the interrupted epoch. The
+        blocks that are entirely consumed are skipped without being fetched.
+
+        Args:
+            state: The snapshot returned by :meth:`state_dict`.
+        """
+        self._num_epochs_completed = state["num_epochs_completed"]
+        self._num_rows_consumed = state["num_rows_consumed"]
+        self._num_rows_to_skip = state["num_rows_consumed"]
+
     @abc.abstractmethod
     def stats(self) -> str:
         """Returns a string containing execution timing information."""
@@ -360,7 +441,9 @@ class DataIterator(abc.ABC):
                 "auto" which moves the tensors to the appropriate device when the
                 Dataset is passed to Ray Train and ``collate_fn`` is not provided.
                 Otherwise, defaults to CPU. You can't use this parameter with
-                ``collate_fn``.
+                ``collate_fn``. If ``DataContext.torch_host_buffers_enabled`` is
+                set, the batches are collated into reusable (pinned) host tensors
+                before being transferred to the device, instead of new tensors.
             collate_fn: A function to convert a Numpy batch to a PyTorch tensor batch.
                 When this parameter is specified, the user should manually handle the
                 host to device data transfer outside of ``collate_fn``.
@@ -405,10 +488,16 @@ class DataIterator(abc.ABC):
             device = get_device()
 
         if collate_fn is None:
+            host_buffers = _get_torch_host_buffer_pool(dtypes, device)
+
             # The default collate_fn handles formatting and Tensor creation.
             # Here, we set device=None to defer host to device data transfer
             # to the subsequent finalize_fn.
             def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
+                if host_buffers is not None:
+                    collated = host_buffers.collate(batch)
+                    if collated is not None:
+                        return collated
                 return convert_ndarray_batch_to_torch_tensor_batch(
                     batch,
                     dtypes=dtypes,
@@ -419,6 +508,8 @@ class DataIterator(abc.ABC):
             # This is executed in a 1-thread pool separately from collate_fn
             # to allow independent parallelism of these steps.
             def finalize_fn(batch: Union["torch.Tensor", Dict[str, "torch.Tensor"]]):
+                if isinstance(batch, HostBufferBatch):
+                    return host_buffers.to_device(batch, device)
                 if device is not None:
                     if isinstance(batch, dict):
                         for k, t in batch.items():
@@ -910,5 +1001,32 @@ class DataIterator(abc.ABC):
         )
 
 
+def _get_torch_host_buffer_pool(
+    dtypes: Optional[Union["torch.dtype", Dict[str, "torch.dtype"]]],
+    device: Optional[Union[str, "torch.device"]],
+) -> Optional[TorchHostBufferPool]:
+    """Return a pool of host buffers to collate the batches into, if enabled by
+    `DataContext.torch_host_buffers_enabled`.
+
+    The buffers are only reused when the batches are transferred to another device,
+    since the batches on the CPU are the buffers themselves.
+    """
+    ctx = DataContext.get_current()
+    if not ctx.torch_host_buffers_enabled or device is None:
+        return None
+
+    import torch
+
+    device = torch.device(device)
+    if device.type == "cpu":
+        return None
+    pin_memory = (
+        ctx.torch_host_buffers_pin_memory
+        and device.type == "cuda"
+        and torch.cuda.is_available()
+    )
+    return TorchHostBufferPool(dtypes=dtypes, pin_memory=pin_memory)
+
+
 # Backwards compatibility alias.
 DatasetIterator = DataIterator
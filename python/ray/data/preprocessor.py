@@ -2,7 +2,7 @@ import abc
 import collections
 import warnings
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
@@ -10,9 +10,11 @@ from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import pyarrow
 
     from ray.air.data_batch_type import DataBatchType
     from ray.data import Dataset, DatasetPipeline
+    from ray.data.aggregate import AggregateFn
 
 
 @PublicAPI(stability="beta")
@@ -61,6 +63,10 @@ class Preprocessor(abc.ABC):
     # Preprocessors that do not need to be fitted must override this.
     _is_fittable = True
 
+    # Preprocessors fitted from aggregations whose transform adds new columns must
+    # override this. See `_get_fit_aggregates()`.
+    _transform_adds_columns = False
+
     def fit_status(self) -> "Preprocessor.FitStatus":
         if not self._is_fittable:
             return Preprocessor.FitStatus.NOT_FITTABLE
@@ -211,6 +217,22 @@ class Preprocessor(abc.ABC):
         """Sub-classes should override this instead of fit()."""
         raise NotImplementedError()
 
+    def _get_fit_aggregates(self) -> Optional[List["AggregateFn"]]:
+        """Return the aggregations that ``_fit`` computes, if fitting only requires
+        a single pass of aggregations on columns of the dataset.
+
+        Sub-classes that return aggregations must implement ``_fit_from_aggregates``,
+        and their transform must only modify or drop the columns that the
+        aggregations are on. This allows :class:`Chain` to fit the consecutive
+        preprocessors that use different columns with a single pass over the dataset.
+        """
+        return None
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        """Set the fitted state from the results of the aggregations returned by
+        ``_get_fit_aggregates``, keyed by aggregation name."""
+        raise NotImplementedError()
+
     def _determine_transform_to_use(self) -> BatchFormat:
         """Determine which batch format to use based on Preprocessor implementation.
 
@@ -240,6 +262,20 @@ class Preprocessor(abc.ABC):
                 "for Preprocessor transforms."
             )
 
+    def _use_arrow_transform(self) -> bool:
+        """Whether to transform datasets and Arrow batches with `_transform_arrow`.
+
+        This is the case if `_transform_arrow` is implemented and the preferred
+        batch format is Arrow. Batches in other formats are still transformed with
+        `_transform_pandas` or `_transform_numpy`.
+        """
+        has_transform_arrow = (
+            self.__class__._transform_arrow != Preprocessor._transform_arrow
+        )
+        return (
+            has_transform_arrow and self.preferred_batch_format() == BatchFormat.ARROW
+        )
+
     def _transform(
         self, ds: Union["Dataset", "DatasetPipeline"]
     ) -> Union["Dataset", "DatasetPipeline"]:
@@ -250,7 +286,11 @@ class Preprocessor(abc.ABC):
         # Our user-facing batch format should only be pandas or NumPy, other
         # formats {arrow, simple} are internal.
         kwargs = self._get_transform_config()
-        if transform_type == BatchFormat.PANDAS:
+        if self._use_arrow_transform():
+            # Transform the blocks in their native format, so that Arrow blocks are
+            # transformed by `_transform_arrow` without any conversion.
+            return ds.map_batches(self._transform_batch, batch_format=None, **kwargs)
+        elif transform_type == BatchFormat.PANDAS:
             return ds.map_batches(
                 self._transform_pandas, batch_format=BatchFormat.PANDAS, **kwargs
             )
@@ -295,6 +335,13 @@ class Preprocessor(abc.ABC):
                 f"ndarray. Got {type(data)}."
             )
 
+        if (
+            pyarrow is not None
+            and isinstance(data, pyarrow.Table)
+            and self._use_arrow_transform()
+        ):
+            return self._transform_arrow(data)
+
         transform_type = self._determine_transform_to_use()
 
         if transform_type == BatchFormat.PANDAS:
@@ -314,6 +361,15 @@ class Preprocessor(abc.ABC):
         """Run the transformation on a data batch in a NumPy ndarray format."""
         raise NotImplementedError()
 
+    @DeveloperAPI
+    def _transform_arrow(self, table: "pyarrow.Table") -> "DataBatchType":
+        """Run the transformation on a data batch in a PyArrow Table format.
+
+        This is optional, and only used if the preferred batch format is Arrow. It
+        must produce the same data as `_transform_pandas` or `_transform_numpy`.
+        """
+        raise NotImplementedError()
+
     @classmethod
     @DeveloperAPI
     def preferred_batch_format(cls) -> BatchFormat:
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Union
+import pickle
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset, DatasetPipeline
@@ -7,6 +8,7 @@ from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
     from ray.air.data_batch_type import DataBatchType
+    from ray.data.aggregate import AggregateFn
 
 
 @PublicAPI(stability="alpha")
@@ -14,7 +16,9 @@ class Chain(Preprocessor):
     """Combine multiple preprocessors into a single :py:class:`Preprocessor`.
 
     When you call ``fit``, each preprocessor is fit on the dataset produced by the
-    preceeding preprocessor's ``fit_transform``.
+    preceeding preprocessor's ``fit_transform``. Consecutive preprocessors that are
+    fit by aggregations on different columns, e.g. scalers and encoders, are fit
+    together in a single pass over the dataset.
 
     Example:
         >>> import pandas as pd
@@ -71,11 +75,65 @@ class Chain(Preprocessor):
         self.preprocessors = preprocessors
 
     def _fit(self, ds: Dataset) -> Preprocessor:
-        for preprocessor in self.preprocessors[:-1]:
-            ds = preprocessor.fit_transform(ds)
-        self.preprocessors[-1].fit(ds)
+        i = 0
+        while i < len(self.preprocessors):
+            fitted = self._fit_in_single_pass(ds, self._get_fusable_group(i))
+            if not fitted:
+                fitted = [self.preprocessors[i]]
+                fitted[0].fit(ds)
+            i += len(fitted)
+            if i < len(self.preprocessors):
+                for preprocessor in fitted:
+                    ds = preprocessor.transform(ds)
         return self
 
+    def _get_fusable_group(self, start: int) -> List[Preprocessor]:
+        """Return the consecutive preprocessors from ``start`` that can be fit in a
+        single pass over the same dataset.
+
+        This is the case if they are all fit by aggregations, and none of them is fit
+        on a column that a preceding preprocessor of the group transforms.
+        """
+        group = []
+        columns = set()
+        for preprocessor in self.preprocessors[start:]:
+            if preprocessor.fit_status() == Preprocessor.FitStatus.NOT_FITTABLE:
+                break
+            aggs = preprocessor._get_fit_aggregates()
+            if aggs is None or not all(isinstance(a._key_fn, str) for a in aggs):
+                break
+            agg_columns = {agg._key_fn for agg in aggs}
+            if agg_columns & columns:
+                break
+            group.append(preprocessor)
+            columns |= agg_columns
+            if preprocessor._transform_adds_columns:
+                # The added columns are unknown until the preprocessor is fitted.
+                break
+        return group
+
+    def _fit_in_single_pass(
+        self, ds: Dataset, group: List[Preprocessor]
+    ) -> List[Preprocessor]:
+        """Fit the preprocessors of the group in a single pass over the dataset.
+
+        Returns the fitted preprocessors, which are none if the group has less than
+        two preprocessors or the dataset is empty.
+        """
+        if len(group) < 2:
+            return []
+        aggs_per_preprocessor = [p._get_fit_aggregates() for p in group]
+        results = _aggregate_in_single_pass(
+            ds, [agg for aggs in aggs_per_preprocessor for agg in aggs]
+        )
+        if results is None:
+            return []
+        results = iter(results)
+        for preprocessor, aggs in zip(group, aggs_per_preprocessor):
+            preprocessor._fit_from_aggregates({agg.name: next(results) for agg in aggs})
+            preprocessor._fitted = True
+        return group
+
     def fit_transform(self, ds: Dataset) -> Dataset:
         for preprocessor in self.preprocessors:
             ds = preprocessor.fit_transform(ds)
@@ -106,3 +164,34 @@ class Chain(Preprocessor):
         # TODO (jiaodong): We should revisit if our Chain preprocessor is
         # still optimal with context of lazy execution.
         return self.preprocessors[0]._determine_transform_to_use()
+
+
+def _aggregate_in_single_pass(
+    ds: Dataset, aggs: List["AggregateFn"]
+) -> Optional[List[Any]]:
+    """Compute the aggregations in a single pass over the dataset.
+
+    Unlike ``Dataset.aggregate()``, this doesn't require the intermediate
+    accumulators to be representable in a block, since they're pickled.
+
+    Returns the results of the aggregations, or None if the dataset is empty.
+    """
+
+    def accumulate(block):
+        accumulators = [agg.accumulate_block(agg.init(None), block) for agg in aggs]
+        return {"accumulators": [pickle.dumps(accumulators)]}
+
+    partials = ds.map_batches(accumulate, batch_format=None, batch_size=None)
+    merged = None
+    for batch in partials.iter_batches(batch_size=None, batch_format="numpy"):
+        for serialized in batch["accumulators"]:
+            accumulators = pickle.loads(serialized)
+            if merged is None:
+                merged = accumulators
+            else:
+                merged = [
+                    agg.merge(a1, a2) for agg, a1, a2 in zip(aggs, merged, accumulators)
+                ]
+    if merged is None:
+        return None
+    return [agg.finalize(a) for agg, a in zip(aggs, merged)]
@@ -1,12 +1,18 @@
 from collections import Counter, OrderedDict
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 import pandas.api.types
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset
+from ray.data.aggregate import AggregateFn
+from ray.data.aggregate._aggregate import _AggregateOnKeyBase
+from ray.data.block import BlockAccessor
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -93,6 +99,12 @@ class OrdinalEncoder(Preprocessor):
         )
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return [_ValueCounts(col, self.encode_lists) for col in self.columns]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = _unique_value_indices_from_aggregates(stats, self.columns)
+
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
 
@@ -118,6 +130,25 @@ class OrdinalEncoder(Preprocessor):
         df[self.columns] = df[self.columns].apply(column_ordinal_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, *self.columns)
+
+        encoded_columns = {}
+        for column in self.columns:
+            s_values = self.stats_[f"unique_values({column})"]
+            if self.encode_lists and pa.types.is_list(table[column].type):
+                encoded = _index_in_lists(table[column], s_values)
+            else:
+                encoded = _index_in(table[column], s_values)
+            if encoded is None:
+                return self._transform_pandas(table.to_pandas())
+            encoded_columns[column] = encoded
+        return _set_columns(table, encoded_columns)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -206,6 +237,9 @@ class OneHotEncoder(Preprocessor):
         self.columns = columns
         self.max_categories = max_categories
 
+    # The transform adds a column for each unique value.
+    _transform_adds_columns = True
+
     def _fit(self, dataset: Dataset) -> Preprocessor:
         self.stats_ = _get_unique_value_indices(
             dataset,
@@ -215,6 +249,15 @@ class OneHotEncoder(Preprocessor):
         )
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        _validate_max_categories(self.columns, self.max_categories)
+        return [_ValueCounts(col, encode_lists=False) for col in self.columns]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = _unique_value_indices_from_aggregates(
+            stats, self.columns, max_categories=self.max_categories
+        )
+
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
 
@@ -233,6 +276,31 @@ class OneHotEncoder(Preprocessor):
         df = df.drop(columns=list(columns_to_drop))
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, *self.columns)
+
+        encoded_columns = {}
+        for column in self.columns:
+            column_values = self.stats_[f"unique_values({column})"]
+            indices = _index_in(table[column], column_values)
+            if indices is None:
+                return self._transform_pandas(table.to_pandas())
+            for column_value, index in column_values.items():
+                is_value = pc.fill_null(pc.equal(indices, index), False)
+                encoded_columns[f"{column}_{column_value}"] = pc.cast(
+                    is_value, pa.int64()
+                )
+        table = _set_columns(table, encoded_columns)
+
+        # Drop original unencoded columns.
+        return table.select(
+            [column for column in table.column_names if column not in self.columns]
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -324,6 +392,15 @@ class MultiHotEncoder(Preprocessor):
         )
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        _validate_max_categories(self.columns, self.max_categories)
+        return [_ValueCounts(col, encode_lists=True) for col in self.columns]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = _unique_value_indices_from_aggregates(
+            stats, self.columns, max_categories=self.max_categories
+        )
+
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
 
@@ -407,6 +484,12 @@ class LabelEncoder(Preprocessor):
         self.stats_ = _get_unique_value_indices(dataset, [self.label_column])
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return [_ValueCounts(self.label_column, encode_lists=True)]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = _unique_value_indices_from_aggregates(stats, [self.label_column])
+
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, self.label_column)
 
@@ -417,6 +500,19 @@ class LabelEncoder(Preprocessor):
         df[self.label_column] = df[self.label_column].transform(column_label_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, self.label_column)
+
+        s_values = self.stats_[f"unique_values({self.label_column})"]
+        encoded = _index_in(table[self.label_column], s_values)
+        if encoded is None:
+            return self._transform_pandas(table.to_pandas())
+        return _set_columns(table, {self.label_column: encoded})
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return f"{self.__class__.__name__}(label_column={self.label_column!r})"
 
@@ -515,16 +611,42 @@ def _get_unique_value_indices(
     encode_lists: bool = True,
 ) -> Dict[str, Dict[str, int]]:
     """If drop_na_values is True, will silently drop NA values."""
+    _validate_max_categories(columns, max_categories)
 
-    if max_categories is None:
-        max_categories = {}
-    for column in max_categories:
+    def get_pd_value_counts(df: pd.DataFrame) -> Dict[str, List[Counter]]:
+        value_counts = _get_value_counts(df, columns, encode_lists)
+        return {col: [value_counts[col]] for col in columns}
+
+    value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
+    final_counters = {col: Counter() for col in columns}
+    for batch in value_counts.iter_batches(batch_size=None):
+        for col, counters in batch.items():
+            for counter in counters:
+                final_counters[col] += counter
+
+    return _unique_value_indices_from_counters(
+        final_counters,
+        columns,
+        drop_na_values=drop_na_values,
+        key_format=key_format,
+        max_categories=max_categories,
+    )
+
+
+def _validate_max_categories(
+    columns: List[str], max_categories: Optional[Dict[str, int]]
+) -> None:
+    for column in max_categories or {}:
         if column not in columns:
             raise ValueError(
                 f"You set `max_categories` for {column}, which is not present in "
                 f"{columns}."
             )
 
+
+def _get_value_counts(
+    df: pd.DataFrame, columns: List[str], encode_lists: bool
+) -> Dict[str, Counter]:
     def get_pd_value_counts_per_column(col: pd.Series):
         # special handling for lists
         if _is_series_composed_of_lists(col):
@@ -542,24 +664,53 @@ def _get_unique_value_indices(
                 col = col.map(lambda x: tuple(x))
         return Counter(col.value_counts(dropna=False).to_dict())
 
-    def get_pd_value_counts(df: pd.DataFrame) -> List[Dict[str, Counter]]:
-        df_columns = df.columns.tolist()
-        result = {}
-        for col in columns:
-            if col in df_columns:
-                result[col] = [get_pd_value_counts_per_column(df[col])]
-            else:
-                raise ValueError(
-                    f"Column '{col}' does not exist in DataFrame, which has columns: {df_columns}"  # noqa: E501
-                )
-        return result
+    df_columns = df.columns.tolist()
+    result = {}
+    for col in columns:
+        if col in df_columns:
+            result[col] = get_pd_value_counts_per_column(df[col])
+        else:
+            raise ValueError(
+                f"Column '{col}' does not exist in DataFrame, which has columns: {df_columns}"  # noqa: E501
+            )
+    return result
 
-    value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
-    final_counters = {col: Counter() for col in columns}
-    for batch in value_counts.iter_batches(batch_size=None):
-        for col, counters in batch.items():
-            for counter in counters:
-                final_counters[col] += counter
+
+class _ValueCounts(_AggregateOnKeyBase):
+    """Counts the occurrences of each value of a column, including nulls."""
+
+    def __init__(self, on: str, encode_lists: bool):
+        self._set_key_fn(on)
+
+        def accumulate_block(counter: Counter, block) -> Counter:
+            df = BlockAccessor.for_block(block).to_pandas()
+            return counter + _get_value_counts(df, [on], encode_lists)[on]
+
+        super().__init__(
+            init=lambda k: Counter(),
+            merge=lambda c1, c2: c1 + c2,
+            accumulate_block=accumulate_block,
+            name=f"value_counts({on})",
+        )
+
+
+def _unique_value_indices_from_aggregates(
+    stats: Dict[str, Counter], columns: List[str], **kwargs
+) -> Dict[str, Dict[str, int]]:
+    """Like `_get_unique_value_indices`, from the results of `_ValueCounts`."""
+    counters = {col: stats[f"value_counts({col})"] for col in columns}
+    return _unique_value_indices_from_counters(counters, columns, **kwargs)
+
+
+def _unique_value_indices_from_counters(
+    final_counters: Dict[str, Counter],
+    columns: List[str],
+    drop_na_values: bool = False,
+    key_format: str = "unique_values({0})",
+    max_categories: Optional[Dict[str, int]] = None,
+) -> Dict[str, Dict[str, int]]:
+    if max_categories is None:
+        max_categories = {}
 
     # Inspect if there is any NA values.
     for col in columns:
@@ -602,6 +753,67 @@ def _validate_df(df: pd.DataFrame, *columns: str) -> None:
         )
 
 
+def _validate_table(table: pa.Table, *columns: str) -> None:
+    def has_nulls(column: pa.ChunkedArray) -> bool:
+        if column.null_count > 0:
+            return True
+        # Pandas considers NaNs as nulls.
+        return pa.types.is_floating(column.type) and bool(
+            pc.any(pc.is_nan(column)).as_py()
+        )
+
+    null_columns = [column for column in columns if has_nulls(table[column])]
+    if null_columns:
+        raise ValueError(
+            f"Unable to transform columns {null_columns} because they contain "
+            f"null values. Consider imputing missing values first."
+        )
+
+
+def _index_in(
+    column: Union[pa.Array, pa.ChunkedArray], values: Dict[Any, int]
+) -> Optional[Union[pa.Array, pa.ChunkedArray]]:
+    """Encode the elements of the column as their indices in ``values``, and the
+    unknown elements as nulls.
+
+    The indices in ``values`` must be in order, i.e., ``0, ..., len(values) - 1``,
+    which is the case for the fitted unique value indices. Returns None if the
+    column can't be encoded with Arrow, e.g. if it's a column of lists.
+    """
+    try:
+        value_set = pa.array(list(values), type=column.type)
+        indices = pc.index_in(column, value_set=value_set)
+    except (pa.ArrowException, TypeError):
+        return None
+    return pc.cast(indices, pa.int64())
+
+
+def _index_in_lists(
+    column: pa.ChunkedArray, values: Dict[Any, int]
+) -> Optional[pa.ChunkedArray]:
+    """Like `_index_in`, for the elements of a column of lists."""
+    chunks = []
+    for chunk in column.chunks:
+        indices = _index_in(chunk.flatten(), values)
+        if indices is None:
+            return None
+        # The offsets of a sliced array don't start at 0.
+        offsets = pc.subtract(chunk.offsets, chunk.offsets[0])
+        chunks.append(pa.ListArray.from_arrays(offsets, indices))
+    return pa.chunked_array(chunks, type=pa.list_(pa.int64()))
+
+
+def _set_columns(table: pa.Table, columns: Dict[str, pa.ChunkedArray]) -> pa.Table:
+    """Replace the columns of the table, or append them if they don't exist."""
+    for name, column in columns.items():
+        index = table.schema.get_field_index(name)
+        if index == -1:
+            table = table.append_column(name, column)
+        else:
+            table = table.set_column(index, name, column)
+    return table
+
+
 def _is_series_composed_of_lists(series: pd.Series) -> bool:
     # we assume that all elements are a list here
     first_not_none_element = next(
@@ -2,7 +2,10 @@ import collections
 from typing import List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data.preprocessor import Preprocessor
 from ray.data.preprocessors.utils import simple_hash
 from ray.util.annotations import PublicAPI
@@ -99,6 +102,34 @@ class FeatureHasher(Preprocessor):
         df.drop(columns=self.columns, inplace=True)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        # The hashes only depend on the column names, so each feature is the sum of
+        # the columns that hash to it.
+        columns_per_feature = collections.defaultdict(list)
+        for column in self.columns:
+            columns_per_feature[simple_hash(column, self.num_features)].append(column)
+
+        features = {}
+        for i in range(self.num_features):
+            feature = pa.scalar(0, pa.int64())
+            for column in columns_per_feature[i]:
+                feature = pc.add(feature, table[column])
+            if isinstance(feature, pa.Scalar):
+                feature = pa.repeat(feature, table.num_rows)
+            features[f"hash_{i}"] = feature
+
+        # Drop original unhashed columns.
+        table = table.select(
+            [column for column in table.column_names if column not in self.columns]
+        )
+        for name, feature in features.items():
+            table = table.append_column(name, feature)
+        return table
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
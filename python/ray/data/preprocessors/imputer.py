@@ -1,12 +1,12 @@
 from collections import Counter
 from numbers import Number
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from pandas.api.types import is_categorical_dtype
 
 from ray.data import Dataset
-from ray.data.aggregate import Mean
+from ray.data.aggregate import AggregateFn, Mean
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -108,13 +108,20 @@ class SimpleImputer(Preprocessor):
 
     def _fit(self, dataset: Dataset) -> Preprocessor:
         if self.strategy == "mean":
-            aggregates = [Mean(col) for col in self.columns]
-            self.stats_ = dataset.aggregate(*aggregates)
+            self.stats_ = dataset.aggregate(*self._get_fit_aggregates())
         elif self.strategy == "most_frequent":
             self.stats_ = _get_most_frequent_values(dataset, *self.columns)
 
         return self
 
+    def _get_fit_aggregates(self) -> Optional[List[AggregateFn]]:
+        if self.strategy == "mean":
+            return [Mean(col) for col in self.columns]
+        return None
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = stats
+
     def _transform_pandas(self, df: pd.DataFrame):
         if self.strategy == "mean":
             new_values = {
@@ -1,10 +1,10 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ray.data import Dataset
-from ray.data.aggregate import AbsMax, Max, Mean, Min, Std
+from ray.data.aggregate import AbsMax, AggregateFn, Max, Mean, Min, Std
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -67,10 +67,16 @@ class StandardScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, dataset: Dataset) -> Preprocessor:
+        self.stats_ = dataset.aggregate(*self._get_fit_aggregates())
+        return self
+
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
         mean_aggregates = [Mean(col) for col in self.columns]
         std_aggregates = [Std(col, ddof=0) for col in self.columns]
-        self.stats_ = dataset.aggregate(*mean_aggregates, *std_aggregates)
-        return self
+        return mean_aggregates + std_aggregates
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = stats
 
     def _transform_pandas(self, df: pd.DataFrame):
         def column_standard_scaler(s: pd.Series):
@@ -151,10 +157,15 @@ class MinMaxScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, dataset: Dataset) -> Preprocessor:
-        aggregates = [Agg(col) for Agg in [Min, Max] for col in self.columns]
-        self.stats_ = dataset.aggregate(*aggregates)
+        self.stats_ = dataset.aggregate(*self._get_fit_aggregates())
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return [Agg(col) for Agg in [Min, Max] for col in self.columns]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = stats
+
     def _transform_pandas(self, df: pd.DataFrame):
         def column_min_max_scaler(s: pd.Series):
             s_min = self.stats_[f"min({s.name})"]
@@ -231,10 +242,15 @@ class MaxAbsScaler(Preprocessor):
         self.columns = columns
 
     def _fit(self, dataset: Dataset) -> Preprocessor:
-        aggregates = [AbsMax(col) for col in self.columns]
-        self.stats_ = dataset.aggregate(*aggregates)
+        self.stats_ = dataset.aggregate(*self._get_fit_aggregates())
         return self
 
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return [AbsMax(col) for col in self.columns]
+
+    def _fit_from_aggregates(self, stats: Dict[str, Any]) -> None:
+        self.stats_ = stats
+
     def _transform_pandas(self, df: pd.DataFrame):
         def column_abs_max_scaler(s: pd.Series):
             s_abs_max = self.stats_[f"abs_max({s.name})"]
@@ -1,7 +1,10 @@
 from typing import Callable, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data.preprocessor import Preprocessor
 from ray.data.preprocessors.utils import simple_split_tokenizer
 from ray.util.annotations import PublicAPI
@@ -66,6 +69,24 @@ class Tokenizer(Preprocessor):
         df.loc[:, self.columns] = df.loc[:, self.columns].transform(column_tokenizer)
         return df
 
+    def _use_arrow_transform(self) -> bool:
+        # Only the default tokenization function has an Arrow equivalent.
+        return (
+            self.tokenization_fn is simple_split_tokenizer
+            and super()._use_arrow_transform()
+        )
+
+    def _transform_arrow(self, table: pa.Table):
+        for column in self.columns:
+            index = table.schema.get_field_index(column)
+            tokens = pc.split_pattern(table[column], pattern=" ")
+            table = table.set_column(index, column, tokens)
+        return table
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         name = getattr(self.tokenization_fn, "__name__", self.tokenization_fn)
         return (
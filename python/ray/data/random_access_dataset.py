@@ -1,9 +1,10 @@
 import bisect
+import collections
 import logging
 import random
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -24,6 +25,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The number of looked up keys after which the hot blocks are replicated.
+_HOT_BLOCK_CHECK_INTERVAL = 1000
+
+# A block is hot if it's accessed this many times more than the average block.
+_HOT_BLOCK_ACCESS_RATIO = 2
+
+# The number of the most recent access latencies kept by each worker.
+_MAX_LATENCY_SAMPLES = 10000
+
 
 @PublicAPI(stability="alpha")
 class RandomAccessDataset:
@@ -37,6 +47,9 @@ class RandomAccessDataset:
         ds: "Dataset",
         key: str,
         num_workers: int,
+        use_hash_index: bool = False,
+        max_replicas: int = 1,
+        max_cached_blocks: Optional[int] = None,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -46,6 +59,12 @@ class RandomAccessDataset:
         schema = ds.schema(fetch_if_missing=True)
         if schema is None or isinstance(schema, type):
             raise ValueError("RandomAccessDataset only supports Arrow-format blocks.")
+        if max_replicas < 1:
+            raise ValueError(f"max_replicas must be at least 1, got {max_replicas}.")
+        if max_cached_blocks is not None and max_cached_blocks < 1:
+            raise ValueError(
+                f"max_cached_blocks must be at least 1, got {max_cached_blocks}."
+            )
 
         start = time.perf_counter()
         logger.info("[setup] Indexing dataset by sort key.")
@@ -64,13 +83,19 @@ class RandomAccessDataset:
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+        self._upper_bounds_array = np.array(self._upper_bounds)
+
+        self._max_replicas = max_replicas
+        self._block_access_counts = np.zeros(len(self._non_empty_blocks))
+        self._num_lookups_since_check = 0
+        self._num_replicated_blocks = 0
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
         scheduling_strategy = ctx.scheduling_strategy
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, use_hash_index, max_cached_blocks
             )
             for _ in range(num_workers)
         ]
@@ -140,35 +165,43 @@ class RandomAccessDataset:
         block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
+        self._record_block_accesses([block_index])
         return self._worker_for(block_index).get.remote(block_index, key)
 
     def multiget(self, keys: List[Any]) -> List[Optional[Any]]:
         """Synchronously find the records for a list of keys.
 
+        The keys are looked up with a single call to each of the workers that hold
+        their blocks.
+
         Args:
             keys: List of keys to find the records for.
 
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
+        block_indices = self._find_le_batch(keys)
+        self._record_block_accesses(block_indices)
+        # The positions of the keys to look up by each worker.
+        batches: Dict["ray.ActorHandle", List[int]] = defaultdict(list)
+        block_workers = {}
+        for i, block_index in enumerate(block_indices):
+            if block_index is None:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+            if block_index not in block_workers:
+                block_workers[block_index] = self._worker_for(block_index)
+            batches[block_workers[block_index]].append(i)
+        futures = [
+            worker.multiget.remote(
+                [block_indices[i] for i in positions], [keys[i] for i in positions]
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            for worker, positions in batches.items()
+        ]
+        results = [None] * len(keys)
+        for positions, values in zip(batches.values(), ray.get(futures)):
+            for i, value in zip(positions, values):
+                results[i] = value
+        return results
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -176,20 +209,71 @@ class RandomAccessDataset:
         total_time = sum(s["total_time"] for s in stats)
         accesses = [s["num_accesses"] for s in stats]
         blocks = [s["num_blocks"] for s in stats]
+        latencies = [latency for s in stats for latency in s["latencies"]]
         msg = "RandomAccessDataset:\n"
         msg += "- Build time: {}s\n".format(round(self._build_time, 2))
         msg += "- Num workers: {}\n".format(len(stats))
         msg += "- Blocks per worker: {} min, {} max, {} mean\n".format(
             min(blocks), max(blocks), int(sum(blocks) / len(blocks))
         )
+        msg += "- Replicated hot blocks: {}\n".format(self._num_replicated_blocks)
+        msg += "- Block cache hits: {}\n".format(
+            sum(s["num_cache_hits"] for s in stats)
+        )
+        msg += "- Block cache misses: {}\n".format(
+            sum(s["num_cache_misses"] for s in stats)
+        )
         msg += "- Accesses per worker: {} min, {} max, {} mean\n".format(
             min(accesses), max(accesses), int(sum(accesses) / len(accesses))
         )
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        if latencies:
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e6
+            msg += "- Access time percentiles: {}us p50, {}us p90, {}us p99\n".format(
+                int(p50), int(p90), int(p99)
+            )
         return msg
 
+    def _record_block_accesses(self, block_indices: List[Optional[int]]):
+        """Count the accesses to the blocks, and periodically replicate the hot
+        blocks to more workers."""
+        if self._max_replicas <= 1:
+            return
+        for block_index in block_indices:
+            if block_index is not None:
+                self._block_access_counts[block_index] += 1
+        self._num_lookups_since_check += len(block_indices)
+        if self._num_lookups_since_check >= _HOT_BLOCK_CHECK_INTERVAL:
+            self._replicate_hot_blocks()
+            self._block_access_counts[:] = 0
+            self._num_lookups_since_check = 0
+
+    def _replicate_hot_blocks(self):
+        """Assign each hot block to one more worker, up to `max_replicas` workers.
+
+        The new worker is the one with the fewest blocks that doesn't hold the block
+        yet. Since the calls to a worker are executed in order, it can serve the block
+        as soon as the assignment is submitted.
+        """
+        threshold = _HOT_BLOCK_ACCESS_RATIO * self._block_access_counts.mean()
+        for block_index in np.flatnonzero(self._block_access_counts > threshold):
+            block_index = int(block_index)
+            workers = self._block_to_workers_map[block_index]
+            if len(workers) >= self._max_replicas:
+                continue
+            candidates = [w for w in self._workers if w not in workers]
+            if not candidates:
+                continue
+            worker = min(candidates, key=lambda w: len(self._worker_to_blocks_map[w]))
+            worker.assign_blocks.remote(
+                {block_index: self._non_empty_blocks[block_index]}
+            )
+            workers.append(worker)
+            self._worker_to_blocks_map[worker].append(block_index)
+            self._num_replicated_blocks += 1
+
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
@@ -199,43 +283,56 @@ class RandomAccessDataset:
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> List[Optional[int]]:
+        """Vectorized version of `_find_le`."""
+        if not self._upper_bounds:
+            return [None] * len(keys)
+        try:
+            indices = np.searchsorted(self._upper_bounds_array, keys).tolist()
+        except TypeError:
+            return [self._find_le(k) for k in keys]
+        return [
+            i if i < len(self._upper_bounds) and not k < self._lower_bound else None
+            for i, k in zip(indices, keys)
+        ]
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
-        self.blocks = None
+    def __init__(
+        self,
+        key_field: str,
+        use_hash_index: bool = False,
+        max_cached_blocks: Optional[int] = None,
+    ):
+        self.block_refs = {}
         self.key_field = key_field
+        self.use_hash_index = use_hash_index
+        self.max_cached_blocks = max_cached_blocks
+        # LRU cache of the indexed blocks.
+        self.cache: Dict[int, _BlockIndex] = collections.OrderedDict()
         self.num_accesses = 0
+        self.num_cache_hits = 0
+        self.num_cache_misses = 0
         self.total_time = 0
+        self.latencies = collections.deque(maxlen=_MAX_LATENCY_SAMPLES)
 
     def assign_blocks(self, block_ref_dict):
-        self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.block_refs.update(block_ref_dict)
+        # Warm up the cache.
+        for block_index in list(block_ref_dict)[: self.max_cached_blocks]:
+            self._get_block_index(block_index)
 
     def get(self, block_index, key):
         start = time.perf_counter()
-        result = self._get(block_index, key)
-        self.total_time += time.perf_counter() - start
-        self.num_accesses += 1
+        result = self._multiget([block_index], [key])[0]
+        self._record_access(start)
         return result
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
-        self.total_time += time.perf_counter() - start
-        self.num_accesses += 1
+        result = self._multiget(block_indices, keys)
+        self._record_access(start)
         return result
 
     def ping(self):
@@ -243,41 +340,76 @@ class _RandomAccessWorker:
 
     def stats(self) -> dict:
         return {
-            "num_blocks": len(self.blocks),
+            "num_blocks": len(self.block_refs),
             "num_accesses": self.num_accesses,
+            "num_cache_hits": self.num_cache_hits,
+            "num_cache_misses": self.num_cache_misses,
             "total_time": self.total_time,
+            "latencies": list(self.latencies),
         }
 
-    def _get(self, block_index, key):
-        if block_index is None:
-            return None
-        block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
-            return None
-        acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
-
-
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
-
+    def _multiget(self, block_indices, keys):
+        # The positions of the keys in each block.
+        positions = defaultdict(list)
+        for i, block_index in enumerate(block_indices):
+            if block_index is not None:
+                positions[block_index].append(i)
+        result = [None] * len(keys)
+        for block_index, block_positions in positions.items():
+            index = self._get_block_index(block_index)
+            rows = index.find([keys[i] for i in block_positions])
+            for i, row in zip(block_positions, rows):
+                if row is not None:
+                    result[i] = index.accessor._get_row(row)
+        return result
 
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
+    def _get_block_index(self, block_index: int) -> "_BlockIndex":
+        index = self.cache.pop(block_index, None)
+        if index is None:
+            self.num_cache_misses += 1
+            block = ray.get(self.block_refs[block_index])
+            index = _BlockIndex(block, self.key_field, self.use_hash_index)
+            if (
+                self.max_cached_blocks is not None
+                and len(self.cache) >= self.max_cached_blocks
+            ):
+                # Evict the least recently used block.
+                self.cache.popitem(last=False)
+        else:
+            self.num_cache_hits += 1
+        self.cache[block_index] = index
+        return index
+
+    def _record_access(self, start: float):
+        latency = time.perf_counter() - start
+        self.total_time += latency
+        self.latencies.append(latency)
+        self.num_accesses += 1
 
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
 
-    def __len__(self):
-        return len(self.arrow_col)
+class _BlockIndex:
+    """A block with an index to find the rows of keys in a vectorized way."""
+
+    def __init__(self, block, key_field: str, use_hash_index: bool):
+        self.accessor = BlockAccessor.for_block(block)
+        # The key column of Arrow and Pandas blocks.
+        self.keys = block[key_field].to_numpy()
+        self.hash_index = None
+        if use_hash_index:
+            self.hash_index = {}
+            for i, k in enumerate(self.keys.tolist()):
+                # Like the binary search, find the first row of duplicate keys.
+                self.hash_index.setdefault(k, i)
+
+    def find(self, keys: List[Any]) -> List[Optional[int]]:
+        """Return the row indices of the keys, or None for the missing keys."""
+        if self.hash_index is not None:
+            return [self.hash_index.get(k) for k in keys]
+        indices = np.searchsorted(self.keys, keys).tolist()
+        return [
+            i if i < len(self.keys) and self.keys[i] == k else None
+            for i, k in zip(indices, keys)
+        ]
 
 
 def _get_bounds(block, key):
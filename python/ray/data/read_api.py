@@ -44,6 +44,7 @@ from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import WARN_PREFIX, DataContext
 from ray.data.dataset import Dataset, MaterializedDataset
 from ray.data.datasource import (
+    ArrowIPCDatasource,
     BaseFileMetadataProvider,
     BinaryDatasource,
     Connection,
@@ -436,7 +437,13 @@ def read_datasource(
 
     # TODO(hchen): move _get_read_tasks and related code to the Read physical operator,
     # after removing LazyBlockList code path.
-    read_op = Read(datasource, read_tasks, estimated_num_blocks, ray_remote_args)
+    read_op = Read(
+        datasource,
+        read_tasks,
+        estimated_num_blocks,
+        ray_remote_args,
+        read_args=read_args,
+    )
     logical_plan = LogicalPlan(read_op)
 
     return Dataset(
@@ -1346,6 +1353,79 @@ def read_numpy(
     )
 
 
+@PublicAPI(stability="alpha")
+def read_arrow_ipc(
+    paths: Union[str, List[str]],
+    *,
+    filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    parallelism: int = -1,
+    ray_remote_args: Dict[str, Any] = None,
+    arrow_open_stream_args: Optional[Dict[str, Any]] = None,
+    meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
+    partition_filter: Optional[
+        PathPartitionFilter
+    ] = ArrowIPCDatasource.file_extension_filter(),
+    partitioning: Partitioning = None,
+    ignore_missing_paths: bool = False,
+    **arrow_ipc_args,
+) -> Dataset:
+    """Create an Arrow dataset from Arrow IPC (Feather V2) files.
+
+    Local files are memory-mapped, so that the blocks are read from the files without
+    decoding or copying them, unless the files are compressed. This makes Arrow IPC
+    a fast format for intermediate datasets that are reread from local disks.
+
+    Examples:
+        Read a directory of files in remote storage.
+
+        >>> import ray
+        >>> ray.data.read_arrow_ipc("s3://bucket/path") # doctest: +SKIP
+
+        Read multiple local files.
+
+        >>> ray.data.read_arrow_ipc(["/path/to/file1", "/path/to/file2"]) # doctest: +SKIP
+
+    Args:
+        paths: A single file/directory path or a list of file/directory paths.
+            A list of paths can contain both files and directories.
+        filesystem: The filesystem implementation to read from.
+        parallelism: The requested parallelism of the read. Parallelism may be
+            limited by the number of files of the dataset.
+        ray_remote_args: kwargs passed to ray.remote in the read tasks.
+        arrow_open_stream_args: kwargs passed to
+            `pyarrow.fs.FileSystem.open_input_stream <https://arrow.apache.org/docs/python/generated/pyarrow.fs.FileSystem.html>`_
+            when reading compressed files.
+        meta_provider: File metadata provider. Custom metadata providers may
+            be able to resolve file metadata more quickly and/or accurately.
+        partition_filter: Path-based partition filter, if any. Can be used
+            with a custom callback to read only selected partitions of a dataset.
+            By default, this filters out any file paths whose file extension does not
+            match "*.arrow*", "*.feather*" or "*.ipc*".
+        partitioning: A :class:`~ray.data.datasource.partitioning.Partitioning` object
+            that describes how paths are organized. Defaults to ``None``.
+        ignore_missing_paths: If True, ignores any file paths in ``paths`` that are not
+            found. Defaults to False.
+        arrow_ipc_args: Other options to pass to
+            `pyarrow.ipc.open_file <https://arrow.apache.org/docs/python/generated/pyarrow.ipc.open_file.html>`_.
+
+    Returns:
+        Dataset holding Arrow records read from the specified paths.
+    """  # noqa: E501
+    return read_datasource(
+        ArrowIPCDatasource(),
+        parallelism=parallelism,
+        paths=paths,
+        filesystem=filesystem,
+        ray_remote_args=ray_remote_args,
+        open_stream_args=arrow_open_stream_args,
+        meta_provider=meta_provider,
+        partition_filter=partition_filter,
+        partitioning=partitioning,
+        ignore_missing_paths=ignore_missing_paths,
+        **arrow_ipc_args,
+    )
+
+
 @PublicAPI(stability="alpha")
 def read_tfrecords(
     paths: Union[str, List[str]],
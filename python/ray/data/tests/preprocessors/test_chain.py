@@ -8,6 +8,9 @@ from ray.data.preprocessors import (
     BatchMapper,
     Chain,
     LabelEncoder,
+    MinMaxScaler,
+    OneHotEncoder,
+    OrdinalEncoder,
     SimpleImputer,
     StandardScaler,
 )
@@ -83,6 +86,43 @@ def test_chain():
     assert pred_out_df.equals(pred_expected_df)
 
 
+def test_chain_fit_in_single_pass():
+    """Tests that preprocessors fit on different columns are fit in one pass."""
+    in_df = pd.DataFrame.from_dict(
+        {
+            "A": [-1, -1, 1, 1],
+            "B": [1, 2, 3, 4],
+            "C": ["sunday", "monday", "tuesday", "tuesday"],
+            "D": ["a", "b", "a", "a"],
+        }
+    )
+    ds = ray.data.from_pandas(in_df)
+
+    def get_preprocessors():
+        return [
+            StandardScaler(["A"]),
+            MinMaxScaler(["B"]),
+            OrdinalEncoder(["C"]),
+            OneHotEncoder(["D"]),
+            # Fit on a column transformed by the previous preprocessor.
+            StandardScaler(["C"]),
+        ]
+
+    chain = Chain(*get_preprocessors())
+    assert chain._get_fusable_group(0) == list(chain.preprocessors[:4])
+    assert chain._get_fusable_group(4) == [chain.preprocessors[4]]
+    chain.fit(ds)
+    assert chain.fit_status() == Preprocessor.FitStatus.FITTED
+
+    # The stats must match those of fitting the preprocessors one by one.
+    expected_ds = ds
+    for preprocessor, expected in zip(chain.preprocessors, get_preprocessors()):
+        expected_ds = expected.fit_transform(expected_ds)
+        assert preprocessor.stats_ == expected.stats_
+
+    assert chain.transform(ds).to_pandas().equals(expected_ds.to_pandas())
+
+
 def test_chain_pipeline():
     """Tests Chain functionality with DatasetPipeline."""
 
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -577,6 +578,64 @@ def test_categorizer(predefined_dtypes):
     assert pred_out_df.dtypes["C"] == expected_dtypes["C"]
 
 
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        OrdinalEncoder(["B", "C", "D"]),
+        OrdinalEncoder(["B", "C", "D"], encode_lists=False),
+        OneHotEncoder(["B", "C"]),
+        LabelEncoder("B"),
+    ],
+)
+def test_encoders_arrow(encoder):
+    """Tests that the Arrow transforms match the Pandas transforms."""
+    in_df = pd.DataFrame.from_dict(
+        {
+            "A": ["red", "green", "blue", "red"],
+            "B": ["warm", "cold", "hot", "cold"],
+            "C": [1, 10, 5, 10],
+            "D": [["warm"], [], ["hot", "warm", "cold"], ["cold", "cold"]],
+        }
+    )
+    encoder.fit(ray.data.from_pandas(in_df))
+
+    pred_in_df = pd.DataFrame.from_dict(
+        {
+            "A": ["blue", "yellow", None],
+            "B": ["cold", "warm", "other"],
+            "C": [10, 1, 20],
+            "D": [["cold", "warm"], [], ["other", "cold"]],
+        }
+    )
+    pred_in_table = pa.Table.from_pandas(pred_in_df)
+
+    def to_pandas(batch):
+        if isinstance(batch, pa.Table):
+            batch = batch.to_pandas()
+        # Arrow converts lists to NumPy arrays, with NaNs for nulls.
+        if "D" in batch:
+            batch["D"] = batch["D"].map(
+                lambda x: [None if pd.isnull(v) else v for v in x]
+                if isinstance(x, (list, np.ndarray))
+                else x
+            )
+        return batch
+
+    expected_df = to_pandas(encoder.transform_batch(pred_in_df.copy()))
+    out_df = to_pandas(encoder.transform_batch(pred_in_table))
+    assert out_df.equals(expected_df)
+
+    # Transform a dataset of Arrow blocks.
+    ds = ray.data.from_arrow(pred_in_table)
+    out_df = to_pandas(encoder.transform(ds).to_pandas())
+    assert out_df.equals(expected_df)
+
+    # Verify transform fails for null values.
+    null_table = pa.table({"B": ["cold", None], "C": [1, 5], "D": [[], []]})
+    with pytest.raises(ValueError):
+        encoder.transform_batch(null_table)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -32,6 +33,20 @@ def test_feature_hasher():
     assert all(document_term_matrix.iloc[1] <= 1)
 
 
+def test_feature_hasher_arrow():
+    """Tests that the Arrow transform matches the Pandas transform."""
+    token_counts = pd.DataFrame(
+        {"I": [1, 1], "like": [1, 0], "dislike": [0, 1], "Python": [1, 1]}
+    )
+    # Use few features to get hash collisions.
+    hasher = FeatureHasher(["I", "like", "dislike", "Python"], num_features=3)
+
+    expected_df = hasher.transform_batch(token_counts.copy())
+    out_table = hasher.transform_batch(pa.Table.from_pandas(token_counts))
+    assert isinstance(out_table, pa.Table)
+    assert out_table.to_pandas().equals(expected_df)
+
+
 def test_hashing_vectorizer():
     """Tests basic HashingVectorizer functionality."""
 
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -27,6 +28,25 @@ def test_tokenizer():
     assert out_df.equals(expected_df)
 
 
+def test_tokenizer_arrow():
+    """Tests that Arrow blocks are tokenized without conversion."""
+    in_table = pa.table({"A": ["this is a test", "apple"], "B": [1, 2]})
+    ds = ray.data.from_arrow(in_table)
+
+    tokenizer = Tokenizer(["A"])
+    assert tokenizer._use_arrow_transform()
+    out_table = tokenizer.transform_batch(in_table)
+    assert isinstance(out_table, pa.Table)
+    assert out_table.column("A").to_pylist() == [["this", "is", "a", "test"], ["apple"]]
+    assert out_table.column("B").to_pylist() == [1, 2]
+    rows = tokenizer.transform(ds).take_all()
+    assert [list(row["A"]) for row in rows] == [["this", "is", "a", "test"], ["apple"]]
+
+    # Custom tokenization functions can't be applied with Arrow.
+    tokenizer = Tokenizer(["A"], tokenization_fn=lambda s: s.split("a"))
+    assert not tokenizer._use_arrow_transform()
+
+
 if __name__ == "__main__":
     import sys
 
@@ -426,6 +426,23 @@ class TestActorPool:
         assert pool.num_idle_actors() == 0
         assert pool.num_free_slots() == 0
 
+    def test_busy_time(self, ray_start_regular_shared):
+        # Test that the pool tracks the busy time of its actors.
+        pool = _ActorPool()
+        busy_actor = self._add_ready_worker(pool)
+        idle_actor = self._add_ready_worker(pool)
+        assert pool.pick_actor() == busy_actor
+        time.sleep(0.5)
+        pool.return_actor(busy_actor)
+        busy_time_s, running_time_s = pool.get_busy_time()
+        assert 0.5 <= busy_time_s < running_time_s
+        assert pool._actor_busy_time_s[busy_actor] == busy_time_s
+        assert pool._actor_busy_time_s[idle_actor] == 0
+        # The idle actor that was busy for the shortest time is killed first.
+        assert pool.kill_inactive_actor()
+        assert pool.num_running_actors() == 1
+        assert pool.pick_actor() == busy_actor
+
     def test_locality_manager_actor_ranking(self):
         pool = _ActorPool(max_tasks_in_flight=2)
 
@@ -543,6 +560,13 @@ class TestAutoscalingConfig:
         assert config.ready_to_total_workers_ratio == 0.8
         assert config.idle_to_total_workers_ratio == 0.5
 
+    def test_min_utilization_validation(self):
+        # Test min_utilization range validation.
+        with pytest.raises(ValueError):
+            AutoscalingConfig(min_workers=1, max_workers=2, min_utilization=1.5)
+        with pytest.raises(ValueError):
+            AutoscalingConfig(min_workers=1, max_workers=2, utilization_window_s=0)
+
 
 class TestAutoscalingPolicy:
     def test_min_workers(self):
@@ -630,6 +654,35 @@ class TestAutoscalingPolicy:
         # Should scale down due to being over idle workers to total workers ratio.
         assert policy.should_scale_down(num_total_workers, num_idle_workers)
 
+    def test_should_scale_down_underutilized(self):
+        # Test that scale-down is only allowed once per window, when the utilization
+        # over the window is under the configured minimum.
+        config = AutoscalingConfig(
+            min_workers=1, max_workers=4, min_utilization=0.5, utilization_window_s=10
+        )
+        policy = AutoscalingPolicy(config)
+        # The first call starts a window.
+        assert not policy.should_scale_down_underutilized(4, 0, 0, now=0)
+        # Shouldn't scale down before the end of the window.
+        assert not policy.should_scale_down_underutilized(4, 4, 20, now=5)
+        # Shouldn't scale down since the utilization is 60% over the window.
+        assert not policy.should_scale_down_underutilized(4, 24, 40, now=10)
+        # Should scale down since the utilization is 25% over the window.
+        assert policy.should_scale_down_underutilized(4, 34, 80, now=20)
+        # Shouldn't scale down again in the same window.
+        assert not policy.should_scale_down_underutilized(3, 34, 80, now=21)
+        # Shouldn't scale down after a reset of the window.
+        policy.reset_utilization_window()
+        assert not policy.should_scale_down_underutilized(3, 34, 80, now=40)
+        # Shouldn't scale down below the pool min workers.
+        assert not policy.should_scale_down_underutilized(1, 34, 90, now=60)
+
+    def test_should_scale_down_underutilized_disabled(self):
+        config = AutoscalingConfig(min_workers=1, max_workers=4, min_utilization=None)
+        policy = AutoscalingPolicy(config)
+        assert not policy.should_scale_down_underutilized(4, 0, 0, now=0)
+        assert not policy.should_scale_down_underutilized(4, 0, 40, now=10)
+
     def test_start_actor_timeout(ray_start_regular_shared):
         """Tests that ActorPoolMapOperator raises an exception on
         timeout while waiting for actors."""
@@ -9,10 +9,23 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Quantile, Std, Sum
+from ray.data.aggregate import (
+    AggregateFn,
+    ApproxCountDistinct,
+    ApproxQuantile,
+    ApproxTopK,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Quantile,
+    Std,
+    Sum,
+)
 from ray.data.context import DataContext
+from ray.data.expressions import col
 from ray.data.tests.conftest import *  # noqa
-from ray.data.tests.util import column_udf, named_values
+from ray.data.tests.util import column_udf, extract_values, named_values
 from ray.tests.conftest import *  # noqa
 
 
@@ -135,6 +148,107 @@ def test_zip_preserve_order(ray_start_regular_shared):
     ), result
 
 
+@pytest.mark.parametrize("broadcast", [True, False])
+def test_join(ray_start_regular_shared, use_push_based_shuffle, broadcast):
+    left = ray.data.from_pandas(
+        pd.DataFrame({"id": [1, 2, 3, 4], "x": ["a", "b", "c", "d"]})
+    ).repartition(2)
+    right = ray.data.from_pandas(
+        pd.DataFrame({"id": [1, 1, 3, 5], "y": [10, 11, 30, 50]})
+    ).repartition(3)
+
+    ds = left.join(right, on="id", broadcast=broadcast)
+    assert ds.schema().names == ["id", "x", "y"]
+    assert sorted(ds.take_all(), key=lambda r: (r["id"], r["y"])) == [
+        {"id": 1, "x": "a", "y": 10},
+        {"id": 1, "x": "a", "y": 11},
+        {"id": 3, "x": "c", "y": 30},
+    ]
+
+    ds = left.join(right, on="id", how="left", broadcast=broadcast)
+    rows = ds.sort("id").to_pandas()
+    assert rows["id"].tolist() == [1, 1, 2, 3, 4]
+    assert rows["y"].isnull().tolist() == [False, False, True, False, True]
+
+
+def test_join_outer(ray_start_regular_shared, use_push_based_shuffle):
+    left = ray.data.range(10, parallelism=4).map(
+        lambda r: {"k": r["id"] % 5, "v": r["id"]}
+    )
+    right = ray.data.range(6, parallelism=2).map(lambda r: {"k": r["id"], "v": -1})
+
+    ds = left.join(right, on="k", how="outer", num_blocks=3, broadcast=False)
+    df = ds.to_pandas()
+    assert len(df) == 11
+    assert set(df.columns) == {"k", "v", "v_right"}
+    assert df[df["k"] == 5]["v"].isnull().all()
+
+    ds = left.join(right, on=["k"], how="right", suffixes=("_l", "_r"))
+    df = ds.to_pandas()
+    assert len(df) == 11
+    assert set(df.columns) == {"k", "v_l", "v_r"}
+
+
+@pytest.mark.skipif(not hasattr(pa.Table, "join"), reason="Requires Table.join()")
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_join_null_keys(how):
+    from ray.data._internal.planner.join import _join_blocks, _join_pandas
+
+    left = pa.table({"k": [1, None, 2], "x": ["a", "b", "c"]})
+    right = pa.table({"k": [1, None, 3], "y": [10, 20, 30]})
+
+    def normalize(df):
+        rows = df.astype(object).where(df.notnull(), None).to_dict("records")
+        return sorted(rows, key=lambda r: [str(r[c]) for c in ["k", "x", "y"]])
+
+    # Null keys don't match each other with both Arrow and the pandas fallback.
+    arrow_result, _ = _join_blocks(["k"], how, ("", "_right"), left, right)
+    pandas_result = _join_pandas(
+        left.to_pandas(), right.to_pandas(), ["k"], how, ("", "_right")
+    )
+    assert normalize(arrow_result.to_pandas()) == normalize(pandas_result)
+    expected_num_rows = {"inner": 1, "left": 3, "right": 3, "outer": 5}
+    assert len(pandas_result) == expected_num_rows[how]
+
+
+@pytest.mark.parametrize("broadcast", [True, False])
+def test_join_empty_side(ray_start_regular_shared, broadcast):
+    left = ray.data.from_pandas(pd.DataFrame({"id": [1, 2], "x": ["a", "b"]}))
+    right = ray.data.from_pandas(pd.DataFrame({"id": [1, 3], "y": [10, 30]}))
+    # Unlike row filters, expression filters keep the schema of empty blocks.
+    empty_right = right.filter(col("id") > 10)
+    empty_left = left.filter(col("id") > 10)
+
+    # The columns of the empty side are added as nulls.
+    df = left.join(empty_right, on="id", how="left", broadcast=broadcast).to_pandas()
+    assert list(df.columns) == ["id", "x", "y"]
+    assert sorted(df["id"].tolist()) == [1, 2]
+    assert df["y"].isnull().all()
+
+    df = empty_left.join(right, on="id", how="outer").to_pandas()
+    assert set(df.columns) == {"id", "x", "y"}
+    assert sorted(df["id"].tolist()) == [1, 3]
+    assert df["x"].isnull().all()
+
+    assert left.join(empty_right, on="id").count() == 0
+
+    # The columns of an empty side without a schema are unknown, so the rows of the
+    # other side are returned as they are.
+    no_schema_right = right.filter(lambda r: r["id"] > 10)
+    ds = left.join(no_schema_right, on="id", how="left", broadcast=broadcast)
+    assert sorted(extract_values("id", ds.take_all())) == [1, 2]
+
+
+def test_join_errors(ray_start_regular_shared):
+    ds = ray.data.range(3)
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="outer", broadcast=True)
+    with pytest.raises(ValueError):
+        ds.join(ds, on=[])
+
+
 def test_empty_shuffle(ray_start_regular_shared):
     ds = ray.data.range(100, parallelism=100)
     ds = ds.filter(lambda x: x)
@@ -442,6 +556,53 @@ def test_global_tabular_sum(ray_start_regular_shared, ds_format, num_parts):
     assert nan_ds.sum("A", ignore_nulls=False) is None
 
 
+@pytest.mark.parametrize("strategy", ["hash", "auto"])
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_aggregate_strategy(
+    ray_start_regular_shared,
+    ds_format,
+    num_parts,
+    strategy,
+    use_push_based_shuffle,
+    restore_data_context,
+):
+    DataContext.get_current().aggregate_strategy = strategy
+    xs = list(range(100))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"A": (x % 3), "B": x} for x in xs]).repartition(
+        num_parts
+    )
+    if ds_format == "pandas":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+
+    agg_ds = ds.groupby("A").aggregate(Sum("B"), Mean("B"), Count())
+    assert agg_ds.count() == 3
+    assert sorted(agg_ds.take_all(), key=lambda r: r["A"]) == [
+        {"A": 0, "sum(B)": 1683, "mean(B)": 49.5, "count()": 34},
+        {"A": 1, "sum(B)": 1617, "mean(B)": 49.0, "count()": 33},
+        {"A": 2, "sum(B)": 1650, "mean(B)": 50.0, "count()": 33},
+    ]
+
+    # Test with as many keys as rows.
+    agg_ds = ds.groupby("B").count()
+    assert sorted(agg_ds.take_all(), key=lambda r: r["B"]) == [
+        {"B": x, "count()": 1} for x in range(100)
+    ]
+
+    # Test empty dataset.
+    agg_ds = ds.filter(lambda r: r["B"] > 100).groupby("A").count()
+    assert agg_ds.count() == 0
+
+
+def test_groupby_aggregate_strategy_errors(
+    ray_start_regular_shared, restore_data_context
+):
+    DataContext.get_current().aggregate_strategy = "foo"
+    with pytest.raises(ValueError, match="Unknown aggregate strategy"):
+        ray.data.range(10).groupby("id").count().materialize()
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_min(ray_start_regular_shared, ds_format, num_parts):
@@ -918,6 +1079,66 @@ def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+def test_approximate_aggregations(ray_start_regular_shared, num_parts):
+    seed = int(time.time())
+    print(f"Seeding RNG for test_approximate_aggregations with: {seed}")
+    rng = np.random.default_rng(seed)
+    xs = rng.permutation(10000)
+    # 1000 distinct values, where 0 occurs 2000 times and 1 occurs 1000 times.
+    ys = np.concatenate([np.zeros(2000), np.ones(1000), np.arange(7000) % 998 + 2])
+    df = pd.DataFrame({"A": xs % 3, "X": xs, "Y": rng.permutation(ys).astype(int)})
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+
+    # Test global aggregation.
+    result = ds.aggregate(
+        ApproxCountDistinct("X"),
+        ApproxCountDistinct("Y"),
+        ApproxQuantile("X"),
+        ApproxQuantile("X", q=0.99, alias_name="p99"),
+        ApproxTopK("Y", k=2),
+    )
+    assert abs(result["approx_count_distinct(X)"] - 10000) <= 1000
+    assert abs(result["approx_count_distinct(Y)"] - 1000) <= 100
+    assert abs(result["approx_quantile(X)"] - np.quantile(xs, 0.5)) <= 100
+    assert abs(result["p99"] - np.quantile(xs, 0.99)) <= 50
+    assert result["approx_top_k(Y)"][0]["value"] == 0
+    assert result["approx_top_k(Y)"][1]["value"] == 1
+    # The counts are lower bounds, underestimating by at most 10000 / 21 rows.
+    assert 2000 - 10000 / 21 <= result["approx_top_k(Y)"][0]["count"] <= 2000
+
+    # Test grouped aggregation.
+    agg_df = (
+        ds.groupby("A")
+        .aggregate(ApproxCountDistinct("X"), ApproxQuantile("X", q=0))
+        .to_pandas()
+    )
+    np.testing.assert_allclose(
+        agg_df["approx_count_distinct(X)"], [3334, 3333, 3333], rtol=0.1
+    )
+    np.testing.assert_array_equal(agg_df["approx_quantile(X)"], [0, 1, 2])
+
+    # Test nulls.
+    nan_ds = ray.data.from_items([{"A": x} for x in range(100)] + [{"A": None}] * 10)
+    result = nan_ds.aggregate(ApproxCountDistinct("A"))
+    assert abs(result["approx_count_distinct(A)"] - 100) <= 5
+    assert (
+        nan_ds.aggregate(ApproxQuantile("A", ignore_nulls=False))["approx_quantile(A)"]
+        is None
+    )
+    result = nan_ds.aggregate(
+        ApproxTopK("A", k=1, num_counters=100, ignore_nulls=False)
+    )
+    assert result["approx_top_k(A)"][0]["value"] is None
+
+    with pytest.raises(ValueError):
+        ApproxCountDistinct("A", precision=20)
+    with pytest.raises(ValueError):
+        ApproxQuantile("A", q=2)
+    with pytest.raises(ValueError):
+        ApproxTopK("A", k=10, num_counters=5)
+
+
 @pytest.mark.parametrize("num_parts", [1, 2, 30])
 def test_groupby_map_groups_for_none_groupkey(ray_start_regular_shared, num_parts):
     ds = ray.data.from_items(list(range(100)))
@@ -0,0 +1,67 @@
+import os
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pytest
+
+import ray
+from ray.data.datasource import ArrowIPCDatasource
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def test_arrow_ipc_roundtrip(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(100, parallelism=4).map(
+        lambda row: {"id": row["id"], "str": str(row["id"])}
+    )
+    ds.write_arrow_ipc(tmp_path)
+    assert len(os.listdir(tmp_path)) == 4
+    assert all(name.endswith(".arrow") for name in os.listdir(tmp_path))
+
+    ds = ray.data.read_arrow_ipc(tmp_path)
+    assert ds.count() == 100
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(100))
+    assert sorted(row["str"] for row in ds.take_all()) == sorted(
+        str(i) for i in range(100)
+    )
+    assert sorted(ds.input_files()) == sorted(
+        os.path.join(tmp_path, name) for name in os.listdir(tmp_path)
+    )
+
+    # Only the selected columns are read.
+    ds = ray.data.read_arrow_ipc(tmp_path, columns=["str"])
+    assert ds.schema().names == ["str"]
+    assert ds.count() == 100
+
+
+def test_arrow_ipc_compression(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(10, parallelism=1)
+    ds.write_arrow_ipc(tmp_path, compression="zstd")
+    ds = ray.data.read_arrow_ipc(tmp_path)
+    assert [row["id"] for row in ds.take_all()] == list(range(10))
+
+
+@pytest.mark.parametrize("memory_mapped", [False, True])
+def test_arrow_ipc_open_input_source(tmp_path, memory_mapped):
+    path = os.path.join(tmp_path, "data.arrow")
+    table = pa.table({"a": [1, 2, 3]})
+    with pa.ipc.new_file(path, table.schema) as writer:
+        writer.write_table(table)
+        writer.write_table(table)
+
+    if memory_mapped:
+        filesystem = pafs.LocalFileSystem()
+    else:
+        filesystem = pafs.SubTreeFileSystem("/", pafs.LocalFileSystem())
+    datasource = ArrowIPCDatasource()
+    with datasource._open_input_source(filesystem, path) as f:
+        assert isinstance(f, pa.MemoryMappedFile) == memory_mapped
+        tables = list(datasource._read_stream(f, path))
+    assert len(tables) == 2
+    assert all(t.equals(table) for t in tables)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -4,7 +4,12 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data._internal.batcher import Batcher, ShufflingBatcher
+from ray.data._internal.batcher import (
+    Batcher,
+    ShufflingBatcher,
+    WindowShufflingBatcher,
+)
+from ray.data.tests.conftest import *  # noqa
 
 
 def gen_block(num_rows):
@@ -222,6 +227,58 @@ def test_shuffling_batcher_grid(batch_size, local_shuffle_buffer_size):
     assert count == 10000
 
 
+def test_window_shuffling_batcher():
+    with pytest.raises(
+        ValueError, match="Must specify a batch_size if using a local shuffle."
+    ):
+        WindowShufflingBatcher(batch_size=None, shuffle_buffer_min_size=20)
+
+    def shuffle(seed):
+        batcher = WindowShufflingBatcher(
+            batch_size=5, shuffle_buffer_min_size=20, shuffle_seed=seed
+        )
+        batches = []
+        for i in range(10):
+            batcher.add(pa.table({"foo": list(range(i * 10, (i + 1) * 10))}))
+            # Batches are only yielded once the window holds enough rows.
+            assert batcher.has_batch() == (batcher._buffer_size >= 20)
+            while batcher.has_batch():
+                batches.append(batcher.next_batch()["foo"].to_pylist())
+                # The window isn't copied.
+                assert all(len(b) == 10 for b in batcher._blocks)
+        batcher.done_adding()
+        while batcher.has_any():
+            batches.append(batcher.next_batch()["foo"].to_pylist())
+        return batches
+
+    batches = shuffle(seed=42)
+    assert all(len(batch) == 5 for batch in batches)
+    rows = [row for batch in batches for row in batch]
+    assert sorted(rows) == list(range(100))
+    assert rows != list(range(100))
+    # The batches mix the rows of different blocks.
+    assert any(len({row // 10 for row in batch}) > 1 for batch in batches)
+    assert shuffle(seed=42) == batches
+    assert shuffle(seed=43) != batches
+
+
+@pytest.mark.parametrize("batch_size,local_shuffle_buffer_size", [(1, 1), (10, 1000)])
+def test_window_shuffling_iter_batches(
+    restore_data_context, batch_size, local_shuffle_buffer_size
+):
+    ray.data.DataContext.get_current().local_shuffle_strategy = "window"
+    ds = ray.data.range(10000, parallelism=10)
+    rows = []
+    for batch in ds.iter_batches(
+        batch_size=batch_size, local_shuffle_buffer_size=local_shuffle_buffer_size
+    ):
+        assert len(batch["id"]) <= batch_size
+        rows.extend(batch["id"])
+    assert sorted(rows) == list(range(10000))
+    if local_shuffle_buffer_size > 1:
+        assert rows != list(range(10000))
+
+
 if __name__ == "__main__":
     import sys
 
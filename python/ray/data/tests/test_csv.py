@@ -798,6 +798,34 @@ def test_csv_write_block_path_provider(
     assert df.equals(ds_df)
 
 
+@pytest.mark.parametrize("header", [True, False])
+def test_csv_read_split_files(
+    ray_start_regular_shared, restore_data_context, tmp_path, header
+):
+    from pyarrow import csv
+
+    ctx = ray.data.DataContext.get_current()
+    ctx.read_file_splitting_enabled = True
+    ctx.target_min_block_size = 1
+    path = os.path.join(tmp_path, "test.csv")
+    df = pd.DataFrame({"one": list(range(1000)), "two": [f"a{i}" for i in range(1000)]})
+    df.to_csv(path, index=False, header=header)
+
+    read_options = None if header else csv.ReadOptions(column_names=["one", "two"])
+    ds = ray.data.read_csv(path, parallelism=8, read_options=read_options)
+    ds = ds.materialize()
+    assert ds.num_blocks() == 8
+    assert ds.to_pandas().equals(df)
+
+    # The rows skipped at the beginning of the file can't be skipped in each split.
+    # The output blocks of the read task may still be split to match the
+    # parallelism, so the read tasks are counted.
+    ds = ray.data.read_csv(
+        path, parallelism=8, read_options=csv.ReadOptions(skip_rows=1)
+    )
+    assert len(ds._plan._logical_plan.dag._read_tasks) == 1
+
+
 # NOTE: The last test using the shared ray_start_regular_shared cluster must use the
 # shutdown_only fixture so the shared cluster is shut down, otherwise the below
 # test_write_datasource_ray_remote_args test, which uses a cluster_utils cluster, will
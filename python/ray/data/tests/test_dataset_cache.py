@@ -0,0 +1,90 @@
+import os
+
+import pandas as pd
+import pytest
+
+import ray
+from ray.data._internal.dataset_cache import get_plan_fingerprint
+from ray.data._internal.logical.operators.from_operators import FromArrow
+from ray.data.datasource import DefaultFileMetadataProvider
+from ray.tests.conftest import *  # noqa
+
+
+class _NoInputFilesMetadataProvider(DefaultFileMetadataProvider):
+    def _get_block_metadata(self, paths, schema, **kwargs):
+        metadata = super()._get_block_metadata(paths, schema, **kwargs)
+        metadata.input_files = None
+        return metadata
+
+
+def _fingerprint(ds):
+    return get_plan_fingerprint(ds._logical_plan)
+
+
+def test_cache(ray_start_regular_shared, tmp_path):
+    data_path = os.path.join(tmp_path, "data")
+    os.mkdir(data_path)
+    for i in range(3):
+        pd.DataFrame({"x": range(i * 10, (i + 1) * 10)}).to_csv(
+            os.path.join(data_path, f"{i}.csv"), index=False
+        )
+    cache_path = os.path.join(tmp_path, "cache")
+
+    def add_one(batch):
+        batch["x"] = batch["x"] + 1
+        return batch
+
+    def create_dataset():
+        return ray.data.read_csv(data_path).map_batches(add_one)
+
+    expected = [{"x": i + 1} for i in range(30)]
+    ds = create_dataset().cache(cache_path)
+    assert sorted(ds.take_all(), key=lambda row: row["x"]) == expected
+    (entry,) = os.listdir(cache_path)
+    assert entry == _fingerprint(create_dataset())
+    assert "_manifest.json" in os.listdir(os.path.join(cache_path, entry))
+
+    # An identical dataset is read from the cache.
+    ds = create_dataset().cache(cache_path)
+    assert isinstance(ds._logical_plan.dag, FromArrow)
+    assert sorted(ds.take_all(), key=lambda row: row["x"]) == expected
+
+    # A dataset with a different UDF isn't.
+    ds = create_dataset().map_batches(add_one).cache(cache_path)
+    assert not isinstance(ds._logical_plan.dag, FromArrow)
+    assert len(os.listdir(cache_path)) == 2
+
+
+def test_plan_fingerprint(ray_start_regular_shared, tmp_path):
+    path = os.path.join(tmp_path, "data.csv")
+    pd.DataFrame({"x": [1, 2, 3]}).to_csv(path, index=False)
+
+    def create_dataset(factor):
+        return ray.data.read_csv(path).map_batches(lambda b: {"x": b["x"] * factor})
+
+    fingerprint = _fingerprint(create_dataset(2))
+    assert fingerprint is not None
+    assert _fingerprint(create_dataset(2)) == fingerprint
+    # The fingerprint covers the closures of the UDFs.
+    assert _fingerprint(create_dataset(3)) != fingerprint
+    # The fingerprint covers the arguments of the operators.
+    assert _fingerprint(create_dataset(2).limit(2)) != fingerprint
+
+    # The fingerprint covers the modification times of the files.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _fingerprint(create_dataset(2)) != fingerprint
+
+    # The data of these datasets isn't determined by their definition.
+    assert _fingerprint(ray.data.from_items([{"x": 1}])) is None
+    # The read doesn't report its input files, so their changes can't be detected.
+    ds = ray.data.read_csv(path, meta_provider=_NoInputFilesMetadataProvider())
+    assert _fingerprint(ds) is None
+    assert _fingerprint(ray.data.range(10).random_shuffle()) is None
+    assert _fingerprint(ray.data.range(10).random_shuffle(seed=0)) is not None
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -5,6 +5,7 @@ from typing import List, Optional
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import ray
@@ -13,6 +14,9 @@ from ray.data._internal.execution.legacy_compat import _blocks_to_input_buffer
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.block_resizing_operator import (
+    BlockResizingOperator,
+)
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.union_operator import UnionOperator
@@ -35,8 +39,10 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    WithColumn,
 )
 from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import PhysicalOptimizer
@@ -227,6 +233,43 @@ def test_filter_e2e(ray_start_regular_shared, enable_optimizer):
     _check_usage_record(["ReadRange", "Filter"])
 
 
+def test_with_column_operator(ray_start_regular_shared, enable_optimizer):
+    from ray.data.expressions import col
+
+    planner = Planner()
+    read_op = Read(ParquetDatasource(), [], 0)
+    op = WithColumn(read_op, "c", col("a") * 2 + col("b"))
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "WithColumn(((col('a') * 2) + col('b')))"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_with_column_e2e(ray_start_regular_shared, enable_optimizer):
+    from ray.data.expressions import col, lit
+
+    ds = ray.data.range(4, parallelism=2)
+    ds = ds.with_column("a", col("id") * 2 + 1)
+    ds = ds.with_column("b", (col("a") - col("id")) / 2)
+    ds = ds.with_column("id", -col("id"))
+    ds = ds.with_column("c", lit(1))
+    assert ds.take_all() == [
+        {"id": 0, "a": 1, "b": 0.5, "c": 1},
+        {"id": -1, "a": 3, "b": 1.0, "c": 1},
+        {"id": -2, "a": 5, "b": 1.5, "c": 1},
+        {"id": -3, "a": 7, "b": 2.0, "c": 1},
+    ]
+    # The expressions are fused into the read tasks.
+    assert "ReadRange->WithColumn" in ds.stats()
+    _check_usage_record(["ReadRange", "WithColumn"])
+
+    with pytest.raises(ValueError):
+        ds.with_column("d", lambda batch: batch["id"])
+
+
 def test_flat_map(ray_start_regular_shared, enable_optimizer):
     planner = Planner()
     read_op = Read(ParquetDatasource(), [], 0)
@@ -878,6 +921,26 @@ def test_read_map_chain_operator_fusion_e2e(ray_start_regular_shared, enable_opt
     _check_usage_record(["ReadRange", "Filter", "Map", "MapBatches", "FlatMap"])
 
 
+def test_block_resizing_e2e(
+    ray_start_regular_shared, enable_optimizer, restore_data_context
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.block_resizing_enabled = True
+    ctx.target_min_block_size = 1024 * 1024
+    ds = ray.data.range(1000, parallelism=20).filter(lambda x: x["id"] % 10 == 0)
+
+    # A BlockResizingOperator is inserted after the fused map operator.
+    logical_plan = ds._plan._logical_plan
+    physical_plan = PhysicalOptimizer().optimize(Planner().plan(logical_plan))
+    assert isinstance(physical_plan.dag, BlockResizingOperator)
+    assert isinstance(physical_plan.dag.input_dependencies[0], MapOperator)
+
+    # The tiny blocks output by the filter are merged into a single block.
+    ds = ds.materialize()
+    assert ds.num_blocks() == 1
+    assert sorted(extract_values("id", ds.take_all())) == list(range(0, 1000, 10))
+
+
 def test_write_fusion(ray_start_regular_shared, enable_optimizer, tmp_path):
     ds = ray.data.range(10, parallelism=2)
     ds.write_csv(tmp_path)
@@ -1475,6 +1538,162 @@ def test_schema_partial_execution(
     )
 
 
+def test_projection_pushdown(ray_start_regular_shared, enable_optimizer, tmp_path):
+    df = pd.DataFrame({"one": [1, 2, 3], "two": ["a", "b", "c"], "three": [4, 5, 6]})
+    path = str(tmp_path / "test.parquet")
+    df.to_parquet(path)
+
+    # The projection is pushed into the read, and the MapBatches is removed.
+    ds = ray.data.read_parquet(path).select_columns(["three", "one"])
+    assert ds.take_all() == [
+        {"three": 4, "one": 1},
+        {"three": 5, "one": 2},
+        {"three": 6, "one": 3},
+    ]
+    # The operator names depend on the read parallelism, so only the types of the
+    # operators are checked.
+    read_op = ds._plan._logical_plan.dag
+    assert isinstance(read_op, Read)
+    assert all(t._read_columns == ["three", "one"] for t in read_op._read_tasks)
+
+    ds = ray.data.read_parquet(path).limit(2).drop_columns(["two"])
+    assert ds.take_all() == [{"one": 1, "three": 4}, {"one": 2, "three": 5}]
+    dag = ds._plan._logical_plan.dag
+    assert isinstance(dag, Limit)
+    assert isinstance(dag.input_dependency, Read)
+    assert all(
+        t._read_columns == ["one", "three"] for t in dag.input_dependency._read_tasks
+    )
+
+    # Projections are not pushed past arbitrary UDFs.
+    ds = ray.data.read_parquet(path).map_batches(lambda x: x).select_columns(["one"])
+    assert extract_values("one", ds.take_all()) == [1, 2, 3]
+    read_op = ds._plan._logical_plan.dag.input_dependency.input_dependency
+    assert all(t._read_columns is None for t in read_op._read_tasks)
+
+    # Dropping a missing column still raises an error.
+    with pytest.raises(KeyError):
+        ray.data.read_parquet(path).drop_columns(["four"]).materialize()
+
+    # CSV reads only convert the projected columns.
+    csv_path = str(tmp_path / "test.csv")
+    df.to_csv(csv_path, index=False)
+    ds = ray.data.read_csv(csv_path).select_columns(["two"])
+    assert extract_values("two", ds.take_all()) == ["a", "b", "c"]
+    assert isinstance(ds._plan._logical_plan.dag, Read)
+
+
+def test_projection_pushdown_with_column(
+    ray_start_regular_shared, enable_optimizer, tmp_path
+):
+    from ray.data.expressions import col
+
+    df = pd.DataFrame({"one": [1, 2, 3], "two": ["a", "b", "c"], "three": [4, 5, 6]})
+    path = str(tmp_path / "test.parquet")
+    df.to_parquet(path)
+
+    # Only the columns referenced by the expression are read.
+    ds = (
+        ray.data.read_parquet(path)
+        .with_column("four", col("one") + col("three"))
+        .select_columns(["four"])
+    )
+    assert extract_values("four", ds.take_all()) == [5, 7, 9]
+    read_op = ds._plan._logical_plan.dag.input_dependency.input_dependency
+    assert all(t._read_columns == ["one", "three"] for t in read_op._read_tasks)
+
+    # The projection is removed if the derived columns are exactly the selected
+    # columns.
+    ds = (
+        ray.data.read_parquet(path)
+        .with_column("one", col("one") * 10)
+        .select_columns(["one"])
+    )
+    assert extract_values("one", ds.take_all()) == [10, 20, 30]
+    dag = ds._plan._logical_plan.dag
+    assert isinstance(dag, WithColumn)
+    assert isinstance(dag.input_dependency, Read)
+    assert all(t._read_columns == ["one"] for t in dag.input_dependency._read_tasks)
+
+
+def test_predicate_pushdown(ray_start_regular_shared, enable_optimizer, tmp_path):
+    from ray.data.expressions import col
+
+    for i in range(3):
+        df = pd.DataFrame(
+            {"one": [3 * i, 3 * i + 1, 3 * i + 2], "two": ["a", "b", "c"]}
+        )
+        df.to_parquet(str(tmp_path / f"test{i}.parquet"))
+
+    # The filter is pushed into the read, and the files that can't match are
+    # skipped using the Parquet column statistics.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(col("one") >= 5)
+    assert sorted(extract_values("one", ds.take_all())) == [5, 6, 7, 8]
+    # The operator names depend on the read parallelism, so only the types of the
+    # operators are checked.
+    read_op = ds._plan._logical_plan.dag
+    assert isinstance(read_op, Read)
+    assert len(read_op._read_tasks) == 2
+
+    # Filters are pushed through projections, and combined.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .select_columns(["two"])
+        .filter(col("two") == "b")
+        .filter(col("two") != "a")
+    )
+    assert extract_values("two", ds.take_all()) == ["b", "b", "b"]
+    read_op = ds._plan._logical_plan.dag
+    assert isinstance(read_op, Read)
+    assert all(t._read_columns == ["two"] for t in read_op._read_tasks)
+
+    # Projections are pushed through filters on other columns.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .filter(col("one").is_in([1, 4]))
+        .select_columns(["two"])
+    )
+    assert extract_values("two", ds.take_all()) == ["b", "b"]
+    # The filter is pushed into the read first, so only the projected columns are
+    # read, and the projection is removed.
+    read_op = ds._plan._logical_plan.dag
+    assert isinstance(read_op, Read)
+    assert all(t._read_columns == ["two"] for t in read_op._read_tasks)
+    assert all(t._read_filter is not None for t in read_op._read_tasks)
+
+    # No file can match.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(col("one") > 100)
+    assert ds.take_all() == []
+    assert ds.schema().names == ["one", "two"]
+
+    # Filters are not pushed past arbitrary UDFs, or into datasources that don't
+    # support them.
+    ds = ray.data.read_parquet(str(tmp_path)).map(lambda r: r).filter(col("one") < 1)
+    assert extract_values("one", ds.take_all()) == [0]
+    assert str(ds._plan._logical_plan.dag).endswith(
+        "-> Filter[Filter((col('one') < 1))]"
+    )
+    ds = ray.data.range(10).filter(~(col("id") < 8))
+    assert extract_values("id", ds.take_all()) == [8, 9]
+    assert (
+        str(ds._plan._logical_plan.dag)
+        == "Read[ReadRange] -> Filter[Filter(~(col('id') < 8))]"
+    )
+
+    # The statistics of float columns leave out NaNs, so files whose other values
+    # all equal the literal aren't skipped.
+    float_path = tmp_path / "float"
+    float_path.mkdir()
+    # pandas writes NaNs as nulls, so the file is written with Arrow.
+    pq.write_table(
+        pa.table({"x": pa.array([5.0, float("nan")], from_pandas=False)}),
+        str(float_path / "test.parquet"),
+    )
+    ds = ray.data.read_parquet(str(float_path)).filter(col("x") != 5.0)
+    values = extract_values("x", ds.take_all())
+    assert len(values) == 1 and np.isnan(values[0])
+
+
 if __name__ == "__main__":
     import sys
 
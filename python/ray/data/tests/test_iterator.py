@@ -69,6 +69,32 @@ def test_basic_dataset_preemption(ray_start_regular_shared):
         assert result == list(range(50))
 
 
+def test_basic_dataset_resume(ray_start_regular_shared):
+    """Tests that the iteration resumes from the position loaded from a snapshot."""
+    ds = ray.data.range(100, parallelism=10)
+    it = ds.iterator()
+    batches = iter(it.iter_batches(batch_size=15))
+    next(batches)
+    next(batches)
+    state = it.state_dict()
+    assert state == {"num_epochs_completed": 0, "num_rows_consumed": 30}
+
+    # The skipped rows don't align with the blocks.
+    it = ds.iterator()
+    it.load_state_dict(state)
+    result = []
+    for batch in it.iter_batches(batch_size=15):
+        result += batch["id"].tolist()
+    assert result == list(range(30, 100))
+    assert it.state_dict() == {"num_epochs_completed": 1, "num_rows_consumed": 0}
+
+    # The next epochs start from the beginning.
+    result = []
+    for batch in it.iter_batches(batch_size=15):
+        result += batch["id"].tolist()
+    assert result == list(range(100))
+
+
 def test_basic_dataset_iter_rows(ray_start_regular_shared):
     ds = ray.data.range(100)
     it = ds.iterator()
@@ -614,6 +614,21 @@ def test_json_write_block_path_provider(
     assert df.equals(ds_df)
 
 
+def test_json_read_split_files(
+    ray_start_regular_shared, restore_data_context, tmp_path
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.read_file_splitting_enabled = True
+    ctx.target_min_block_size = 1
+    path = os.path.join(tmp_path, "test.json")
+    df = pd.DataFrame({"one": list(range(1000)), "two": [str(i) for i in range(1000)]})
+    df.to_json(path, orient="records", lines=True)
+
+    ds = ray.data.read_json(path, parallelism=8).materialize()
+    assert ds.num_blocks() == 8
+    assert ds.to_pandas().equals(df)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -12,6 +12,9 @@ import pytest
 from pyarrow.fs import LocalFileSystem
 from pytest_lazyfixture import lazy_fixture
 
+import ray
+
+from ray.data._internal.remote_fn import CACHED_FUNCTIONS
 from ray.data.datasource import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -22,6 +25,7 @@ from ray.data.datasource import (
 )
 from ray.data.datasource.file_based_datasource import (
     FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD,
+    _fetch_metadata_threaded,
     _resolve_paths_and_filesystem,
     _unwrap_protocol,
 )
@@ -30,6 +34,7 @@ from ray.data.datasource.file_meta_provider import (
     _get_file_infos_parallel,
     _get_file_infos_serial,
 )
+from ray.data.datasource.parquet_datasource import _ParquetMetadataCache
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.test_partitioning import PathPartitionEncoder
 from ray.tests.conftest import *  # noqa
@@ -489,6 +494,68 @@ def test_fast_file_metadata_provider_ignore_missing():
             pass
 
 
+@pytest.mark.parametrize("num_files", [10, 30])
+def test_default_parquet_metadata_provider_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path, num_files
+):
+    data_path = os.path.join(tmp_path, "data")
+    cache_dir = os.path.join(tmp_path, "cache")
+    os.mkdir(data_path)
+    paths = [os.path.join(data_path, f"test{i}.parquet") for i in range(num_files)]
+    for i, path in enumerate(paths):
+        pq.write_table(pa.table({"one": list(range(i + 1))}), path)
+    ray.data.DataContext.get_current().parquet_metadata_cache_dir = cache_dir
+
+    def prefetch():
+        pq_ds = pq.ParquetDataset(paths, use_legacy_dataset=False)
+        file_metas = DefaultParquetMetadataProvider().prefetch_file_metadata(
+            pq_ds.pieces
+        )
+        return [m.num_rows for m in file_metas]
+
+    assert prefetch() == list(range(1, num_files + 1))
+    assert len(os.listdir(cache_dir)) == num_files
+    num_remote_fns = len(CACHED_FUNCTIONS)
+    assert prefetch() == list(range(1, num_files + 1))
+    assert len(os.listdir(cache_dir)) == num_files
+    # The remote function fetching the metadata is reused.
+    assert len(CACHED_FUNCTIONS) == num_remote_fns
+
+    # The metadata of modified files is fetched again.
+    pq.write_table(pa.table({"one": list(range(100))}), paths[0])
+    assert prefetch() == [100] + list(range(2, num_files + 1))
+    assert len(os.listdir(cache_dir)) == num_files + 1
+
+
+def test_parquet_metadata_cache_hit(tmp_path):
+    path = os.path.join(tmp_path, "test.parquet")
+    pq.write_table(pa.table({"one": [1, 2, 3]}), path)
+    piece = pq.ParquetDataset(path, use_legacy_dataset=False).pieces[0]
+    cache = _ParquetMetadataCache(os.path.join(tmp_path, "cache"))
+
+    assert cache.get_or_fetch(piece).num_rows == 3
+    with patch.object(
+        _ParquetMetadataCache, "_put", side_effect=AssertionError("Cache miss")
+    ):
+        metadata = cache.get_or_fetch(piece)
+    assert metadata.num_rows == 3
+    assert metadata.row_group(0).column(0).statistics.max == 3
+
+
+def test_fetch_metadata_threaded():
+    assert _fetch_metadata_threaded(list(range(100)), lambda i: i * 2) == list(
+        range(0, 200, 2)
+    )
+
+    def fetch(i):
+        if i >= 50:
+            raise FileNotFoundError(str(i))
+        return i
+
+    with pytest.raises(FileNotFoundError, match="50"):
+        _fetch_metadata_threaded(list(range(100)), fetch)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -22,6 +23,9 @@ from ray.data._internal.execution.operators.actor_pool_map_operator import (
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.block_resizing_operator import (
+    BlockResizingOperator,
+)
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.map_operator import (
@@ -34,7 +38,7 @@ from ray.data._internal.execution.operators.task_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.util import make_ref_bundles
-from ray.data.block import Block
+from ray.data.block import Block, BlockAccessor
 from ray.tests.conftest import *  # noqa
 
 
@@ -386,6 +390,44 @@ def test_map_operator_actor_locality_stats(ray_start_regular_shared):
     assert not op.completed()
 
 
+def test_map_operator_task_locality_stats(ray_start_regular_shared):
+    # Create with inputs.
+    input_op = InputDataBuffer(
+        make_ref_bundles([[np.ones(100) * i] for i in range(100)])
+    )
+    op = MapOperator.create(
+        _mul2_transform,
+        input_op=input_op,
+        name="TestMapper",
+        compute_strategy=TaskPoolStrategy(),
+    )
+
+    # Feed data and implement streaming exec.
+    output = []
+    options = ExecutionOptions()
+    options.preserve_order = True
+    options.task_locality_enabled = True
+    op.start(options)
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+        while not op.has_next():
+            work_refs = op.get_work_refs()
+            ready, _ = ray.wait(work_refs, num_returns=1, fetch_local=False)
+            op.notify_work_completed(ready[0])
+        while op.has_next():
+            ref = op.get_next()
+            _get_blocks(ref, output)
+
+    # Check equivalent to bulk execution in order.
+    assert np.array_equal(output, [[np.ones(100) * i * 2] for i in range(100)])
+    # Check that all the tasks ran on the node of their inputs.
+    metrics = op.get_metrics()
+    assert metrics["locality_hits"] == 100, metrics
+    assert metrics["locality_misses"] == 0, metrics
+    assert metrics["remote_input_bytes"] == 0, metrics
+    assert "all objects local" in op.progress_str()
+
+
 @pytest.mark.parametrize("use_actors", [False, True])
 def test_map_operator_min_rows_per_bundle(ray_start_regular_shared, use_actors):
     # Simple sanity check of batching behavior.
@@ -659,6 +701,41 @@ def test_limit_operator(ray_start_regular_shared):
         assert limit_op.completed(), limit
 
 
+def test_block_resizing_operator(ray_start_regular_shared):
+    small_blocks = [[i] for i in range(4)]
+    large_block = list(range(4, 104))
+    # Arrow blocks are used, since their sizes are exactly 8 bytes per row.
+    refs = []
+    for data in small_blocks + [large_block] + [[104], [105]]:
+        block = pa.table({"id": data})
+        metadata = BlockAccessor.for_block(block).get_metadata([], None)
+        refs.append(RefBundle([(ray.put(block), metadata)], owns_blocks=True))
+    assert refs[0].size_bytes() == 8
+    assert refs[4].size_bytes() == 800
+    input_op = InputDataBuffer(refs)
+    op = BlockResizingOperator(input_op, min_block_size=16, max_block_size=200)
+    op.start(ExecutionOptions())
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.all_inputs_done()
+    while op.get_work_refs():
+        ready, _ = ray.wait(op.get_work_refs(), num_returns=1, fetch_local=False)
+        op.notify_work_completed(ready[0])
+
+    output = []
+    while op.has_next():
+        for block, _ in op.get_next().blocks:
+            output.append(ray.get(block)["id"].to_pylist())
+    assert op.completed()
+    # The small blocks are merged in pairs, and the large block is split, in order.
+    assert output[:2] == [[0, 1], [2, 3]]
+    assert output[-1] == [104, 105]
+    assert output[2:-1] == [large_block[i : i + 25] for i in range(0, 100, 25)]
+    metrics = op.get_metrics()
+    assert metrics["num_merged_blocks"] == 6, metrics
+    assert metrics["num_split_blocks"] == 1, metrics
+
+
 def _get_bundles(bundle: RefBundle):
     output = []
     for block, _ in bundle.blocks:
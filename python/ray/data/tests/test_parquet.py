@@ -905,6 +905,89 @@ def test_parquet_write_with_udf(ray_start_regular_shared, tmp_path):
     assert expected_df.equals(dfds)
 
 
+def test_parquet_write_partitioned(ray_start_regular_shared, tmp_path):
+    df1 = pd.DataFrame(
+        {"one": [1, 1, 2, 3], "two": ["a", "b", "a", None], "three": [0, 1, 2, 3]}
+    )
+    df2 = pd.DataFrame(
+        {"one": [3, 2, 1, 1], "two": ["a", "a", "b", "a/b"], "three": [4, 5, 6, 7]}
+    )
+    ds = ray.data.from_pandas([df1, df2])
+    ds._set_uuid("data")
+    ds.write_parquet(str(tmp_path), partition_cols=["one", "two"])
+
+    # Each write task writes a file per partition.
+    assert sorted(os.listdir(tmp_path / "one=1")) == ["two=a", "two=a%2Fb", "two=b"]
+    assert sorted(os.listdir(tmp_path / "one=3")) == [
+        "two=__HIVE_DEFAULT_PARTITION__",
+        "two=a",
+    ]
+    files = os.listdir(tmp_path / "one=1" / "two=b")
+    assert len(files) == 2
+    assert all(f.startswith("data_") and f.endswith(".parquet") for f in files)
+    # The partition columns aren't written to the files.
+    for f in os.listdir(tmp_path / "one=2" / "two=a"):
+        table = pq.read_table(tmp_path / "one=2" / "two=a" / f)
+        assert table.column_names == ["three"]
+
+    table = pq.read_table(str(tmp_path), partitioning="hive")
+    assert sorted(table.column("three").to_pylist()) == list(range(8))
+    rows = {row["three"]: row for row in table.to_pylist()}
+    assert (rows[3]["one"], rows[3]["two"]) == (3, None)
+    assert (rows[7]["one"], rows[7]["two"]) == (1, "a/b")
+
+
+def test_parquet_write_partitioned_nulls():
+    from ray.data.datasource.parquet_base_datasource import _PartitionedWriter
+
+    writer = _PartitionedWriter(
+        filesystem=None,
+        base_path="",
+        file_prefix="data",
+        partition_cols=["one"],
+        max_file_size=None,
+        max_open_files=1,
+        open_stream_args={},
+        writer_args={},
+    )
+    table = pa.table(
+        {
+            "one": pa.array([None, 1, None, 2, 1, None], type=pa.int64()),
+            "two": list(range(6)),
+        }
+    )
+    # The null rows are sorted together, and are written to a single partition.
+    partitions = [
+        (partition_dir, partition.column("two").to_pylist())
+        for partition_dir, partition in writer._split_by_partition(table)
+    ]
+    assert partitions == [
+        ("one=1", [1, 4]),
+        ("one=2", [3]),
+        ("one=__HIVE_DEFAULT_PARTITION__", [0, 2, 5]),
+    ]
+
+
+def test_parquet_write_max_file_size(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(1000, parallelism=1).map_batches(
+        lambda batch: {"id": batch["id"], "group": batch["id"] % 2}, batch_size=10
+    )
+    ds._set_uuid("data")
+    # Roll the files over after every row group.
+    ds.write_parquet(
+        str(tmp_path),
+        partition_cols=["group"],
+        max_file_size=1,
+        max_open_files=1,
+        row_group_size=100,
+    )
+    for group in [0, 1]:
+        files = os.listdir(tmp_path / f"group={group}")
+        assert len(files) == 5
+        table = pq.read_table(tmp_path / f"group={group}")
+        assert sorted(table.column("id").to_pylist()) == list(range(group, 1000, 2))
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
@@ -1004,11 +1087,70 @@ def test_parquet_reader_batch_size(ray_start_regular_shared, tmp_path):
     assert ds.count() == 1000
 
 
+def test_parquet_min_max_from_column_statistics(ray_start_regular_shared, tmp_path):
+    pq.write_table(
+        pa.table({"a": [3, 1, 2], "b": ["x", "y", None], "c": [0.5, 1.5, 2.5]}),
+        os.path.join(tmp_path, "1.parquet"),
+    )
+    pq.write_table(
+        pa.table({"a": [5, 4, 0], "b": ["z", "w", "v"], "c": [3.5, 4.5, 5.5]}),
+        os.path.join(tmp_path, "2.parquet"),
+    )
+    ds = ray.data.read_parquet(str(tmp_path))
+    column_statistics = ds._plan.meta_column_statistics()
+    assert column_statistics["a"].min == 0
+    assert column_statistics["a"].max == 5
+    assert column_statistics["b"].null_count == 1
+
+    # The integer and string columns are answered from the statistics.
+    assert ds.min("a") == 0
+    assert ds.max("a") == 5
+    assert ds.min(["a", "b"]) == {"min(a)": 0, "min(b)": "v"}
+    assert ds.max(["a", "b"]) == {"max(a)": 5, "max(b)": "z"}
+    assert ds.min("b", ignore_nulls=False) is None
+    # The float columns are computed, along with the columns that the statistics
+    # answer.
+    assert ds.max("c") == 5.5
+    assert ds.min(["c", "a"]) == {"min(c)": 0.5, "min(a)": 0}
+    assert ds.max() == {"max(a)": 5, "max(b)": "z", "max(c)": 5.5}
+
+    # The statistics don't describe the transformed data.
+    ds = ds.map_batches(lambda df: df.assign(a=df["a"] * 10), batch_format="pandas")
+    assert ds._plan.meta_column_statistics() is None
+    assert ds.min("a") == 0
+    assert ds.max("a") == 50
+
+
 def test_parquet_datasource_names(ray_start_regular_shared):
     assert ParquetBaseDatasource().get_name() == "ParquetBulk"
     assert ParquetDatasource().get_name() == "Parquet"
 
 
+def test_parquet_read_split_files(
+    ray_start_regular_shared, restore_data_context, tmp_path
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.read_file_splitting_enabled = True
+    ctx.target_min_block_size = 1
+    path = os.path.join(tmp_path, "data.parquet")
+    table = pa.table({"one": list(range(1000))})
+    pq.write_table(table, path, row_group_size=100)
+
+    ds = ray.data.read_parquet(path, parallelism=5)
+    assert ds.count() == 1000
+    ds = ds.materialize()
+    # The row groups may have slightly different sizes.
+    assert 1 < ds.num_blocks() <= 5
+    assert pa.concat_tables(ray.get(ds.to_arrow_refs())).equals(table)
+
+    # Files with a single row group aren't split. The output blocks of the read task
+    # may still be split to match the parallelism, so the read tasks are counted.
+    pq.write_table(table, path)
+    ds = ray.data.read_parquet(path, parallelism=5)
+    assert len(ds._plan._logical_plan.dag._read_tasks) == 1
+    assert ds.count() == 1000
+
+
 # NOTE: All tests above share a Ray cluster, while the tests below do not. These
 # tests should only be carefully reordered to retain this invariant!
 
@@ -1,3 +1,6 @@
+import re
+from typing import Tuple
+
 import pyarrow
 import pytest
 
@@ -57,6 +60,87 @@ def test_stats(ray_start_regular_shared):
     assert "Accesses per worker: 2 min, 2 max, 2 mean" in stats, stats
 
 
+@pytest.mark.parametrize("use_hash_index", [False, True])
+def test_multiget_multiple_workers(ray_start_regular_shared, use_hash_index):
+    ds = ray.data.range(100, parallelism=10)
+    rad = ds.to_random_access_dataset(
+        "id", num_workers=3, use_hash_index=use_hash_index, max_cached_blocks=2
+    )
+
+    # Missing keys in between existing keys aren't found.
+    keys = [99, -1, 3.5] + list(range(0, 100, 7)) + [5, 5, 100]
+    expected = [{"id": 99}, None, None]
+    expected += [{"id": i} for i in range(0, 100, 7)] + [{"id": 5}, {"id": 5}, None]
+    assert rad.multiget(keys) == expected
+    assert ray.get(rad.get_async(42)) == {"id": 42}
+
+    stats = rad.stats()
+    assert "Access time percentiles:" in stats, stats
+    # Each worker caches at most 2 of its blocks, so some blocks are reloaded.
+    _, num_misses = _get_cache_stats(rad)
+    rad.multiget(keys)
+    assert _get_cache_stats(rad)[1] > num_misses
+
+    # The blocks of the keys are cached after the first lookup.
+    rad = ds.to_random_access_dataset(
+        "id", num_workers=1, use_hash_index=use_hash_index, max_cached_blocks=2
+    )
+    rad.multiget([1, 2, 3])
+    num_hits, num_misses = _get_cache_stats(rad)
+    rad.multiget([1, 2, 3])
+    assert _get_cache_stats(rad) == (num_hits + 1, num_misses)
+
+
+@pytest.mark.parametrize("use_hash_index", [False, True])
+def test_duplicate_keys(ray_start_regular_shared, use_hash_index):
+    ds = ray.data.from_items(
+        [{"id": 0, "v": 0}, {"id": 1, "v": 1}, {"id": 1, "v": 2}, {"id": 2, "v": 3}],
+        parallelism=1,
+    )
+    rad = ds.to_random_access_dataset("id", use_hash_index=use_hash_index)
+    # The first row of a duplicate key is returned.
+    assert rad.multiget([1, 2]) == [{"id": 1, "v": 1}, {"id": 2, "v": 3}]
+
+
+def _get_cache_stats(rad) -> Tuple[int, int]:
+    stats = rad.stats()
+    num_hits = int(re.search(r"Block cache hits: (\d+)", stats).group(1))
+    num_misses = int(re.search(r"Block cache misses: (\d+)", stats).group(1))
+    return num_hits, num_misses
+
+
+def test_replicate_hot_blocks(ray_start_regular_shared, monkeypatch):
+    monkeypatch.setattr(ray.data.random_access_dataset, "_HOT_BLOCK_CHECK_INTERVAL", 10)
+    ds = ray.data.range(100, parallelism=10)
+    rad = ds.to_random_access_dataset("id", num_workers=2, max_replicas=2)
+    hot_block = rad._find_le(0)
+    # The small blocks are inlined, so each block is initially assigned to a random
+    # worker. Assign the blocks to the workers in turn, so that the hot block is held
+    # by a single worker.
+    rad._worker_to_blocks_map.clear()
+    for block_index, workers in rad._block_to_workers_map.items():
+        worker = rad._workers[block_index % 2]
+        workers[:] = [worker]
+        rad._worker_to_blocks_map[worker].append(block_index)
+    ray.get(
+        [
+            w.assign_blocks.remote(
+                {i: rad._non_empty_blocks[i] for i in rad._worker_to_blocks_map[w]}
+            )
+            for w in rad._workers
+        ]
+    )
+
+    assert rad.multiget([0] * 10) == [{"id": 0}] * 10
+    assert len(rad._block_to_workers_map[hot_block]) == 2
+    assert "Replicated hot blocks: 1" in rad.stats()
+
+    # Both replicas serve the block.
+    for _ in range(10):
+        assert rad.multiget([0, 1]) == [{"id": 0}, {"id": 1}]
+    assert len(rad._block_to_workers_map[hot_block]) == 2
+
+
 if __name__ == "__main__":
     import sys
 
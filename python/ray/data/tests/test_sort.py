@@ -238,6 +238,109 @@ def test_sort_with_one_block(shutdown_only, use_push_based_shuffle):
     ).sum("token_counts")
 
 
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("batch_format", ["pyarrow", "pandas"])
+def test_sort_split_heavy_keys(
+    ray_start_regular, descending, batch_format, restore_data_context
+):
+    num_items = 1000
+    # Half of the rows have the same key.
+    xs = [x if x % 2 else 500 for x in range(num_items)]
+    random.shuffle(xs)
+    ds = ray.data.from_items(
+        [{"a": x, "b": i} for i, x in enumerate(xs)], parallelism=10
+    ).map_batches(lambda t: t, batch_format=batch_format, batch_size=None)
+
+    sorted_ds = ds.sort("a", descending=descending).materialize()
+    # All the rows of the heavy key are in a single skewed block.
+    assert max(sorted_ds._block_num_rows()) >= num_items // 2
+    assert "Output num rows histogram" in sorted_ds.stats()
+
+    ray.data.DataContext.get_current().sort_split_heavy_keys = True
+    sorted_ds = ds.sort("a", descending=descending).materialize()
+    assert extract_values("a", sorted_ds.take_all()) == sorted(xs, reverse=descending)
+    assert max(sorted_ds._block_num_rows()) < num_items // 2
+    blocks_with_heavy_key = [
+        block
+        for block in sorted_ds.iter_batches(batch_size=None, batch_format="numpy")
+        if 500 in block["a"]
+    ]
+    assert len(blocks_with_heavy_key) > 1
+
+    # Groups are still kept in a single block.
+    counts = ds.groupby("a").map_groups(
+        lambda df: {"a": df["a"][:1], "count": [len(df["a"])]},
+        batch_format="numpy",
+    )
+    assert {row["a"]: row["count"] for row in counts.take_all()}[500] == 500
+
+
+@pytest.mark.parametrize("batch_format", ["pyarrow", "pandas"])
+def test_external_sort(ray_start_regular, batch_format, restore_data_context):
+    ctx = ray.data.DataContext.get_current()
+    ctx.use_external_sort = True
+    # Merge about 100 rows of 16 bytes at once.
+    ctx.external_sort_memory_budget = 1600
+
+    num_items = 1000
+    a = list(range(num_items))
+    random.shuffle(a)
+    ds = ray.data.from_items(
+        [{"a": x % 300, "b": x} for x in a], parallelism=4
+    ).map_batches(lambda t: t, batch_format=batch_format, batch_size=None)
+
+    sorted_ds = ds.sort(key="a").materialize()
+    rows = sorted_ds.take_all()
+    assert [row["a"] for row in rows] == sorted(x % 300 for x in a)
+    assert sorted(row["b"] for row in rows) == list(range(num_items))
+    # Each reduce task outputs multiple bounded blocks.
+    block_num_rows = sorted_ds._block_num_rows()
+    assert len(block_num_rows) > 4
+    assert max(block_num_rows) <= 100
+
+    rows = ds.sort(key="a", descending=True).take_all()
+    assert [row["a"] for row in rows] == sorted((x % 300 for x in a), reverse=True)
+
+    # Test empty dataset.
+    ds = ray.data.range(10).filter(lambda r: r["id"] > 10)
+    assert ds.sort("id").count() == 0
+
+
+@pytest.mark.parametrize("columns", [["a"], ["a", "b"]])
+@pytest.mark.parametrize("descending", [False, True])
+def test_merge_sorted_runs(ray_start_regular_shared, columns, descending):
+    from ray.data._internal.planner.exchange.sort_task_spec import (
+        _merge_sorted_runs,
+    )
+
+    rng = random.Random(0)
+    sort_key = SortKey(columns, descending)
+    b = list(range(400))
+    rng.shuffle(b)
+    runs = []
+    for i in range(4):
+        table = pa.table(
+            {
+                "a": [rng.randint(0, 5) for _ in range(100)],
+                "b": b[i * 100 : (i + 1) * 100],
+            }
+        )
+        runs.append(table.sort_by(sort_key.to_arrow_sort_args()))
+    row_size = runs[0].nbytes / runs[0].num_rows
+
+    # Merge about 20 rows at once.
+    blocks = list(_merge_sorted_runs(runs, sort_key, int(40 * row_size)))
+    assert len(blocks) > 1
+    # Only the rows with keys equal to the pivot can exceed the bounded size, and
+    # the keys of both columns are unique.
+    if len(columns) > 1:
+        assert max(block.num_rows for block in blocks) <= 20
+    merged = pa.concat_tables(blocks)
+    expected = pa.concat_tables(runs).sort_by(sort_key.to_arrow_sort_args())
+    assert merged.select(columns).equals(expected.select(columns))
+    assert sorted(merged["b"].to_pylist()) == sorted(expected["b"].to_pylist())
+
+
 @pytest.mark.parametrize("streaming", [False, True])
 def test_push_based_shuffle_schedule(streaming):
     def _test(num_input_blocks, merge_factor, num_cpus_per_node_map):
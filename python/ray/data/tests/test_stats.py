@@ -1,3 +1,4 @@
+import json
 import re
 import time
 from collections import Counter
@@ -1239,6 +1240,48 @@ Dataset iterator time breakdown:
     )
 
 
+def test_task_profiling(ray_start_regular_shared, restore_data_context, tmp_path):
+    DataContext.get_current().task_profiling_enabled = True
+
+    def slow_udf(batch):
+        time.sleep(0.1)
+        return batch
+
+    ds = ray.data.range(100, parallelism=4).map_batches(slow_udf).materialize()
+    stats = canonicalize(ds.stats())
+    assert "* Task time breakdown (summed across profiled tasks):" in stats
+    for name in ["udf", "read", "format_conversion", "serialization", "scheduling"]:
+        assert f"    * {name}: T (N%)" in stats
+
+    summary = ds._get_stats_summary()
+    breakdown = summary.stages_stats[0].task_time_breakdown
+    assert breakdown["udf"] >= 0.4
+
+    path = str(tmp_path / "trace.json")
+    ds.export_trace(path)
+    with open(path) as f:
+        events = json.load(f)
+    spans = [e for e in events if e["ph"] == "X"]
+    assert {e["tid"] for e in spans if e["name"] == "task"} == {0, 1, 2, 3}
+    for task_span in [e for e in spans if e["name"] == "task"]:
+        udf_spans = [
+            e for e in spans if e["name"] == "udf" and e["tid"] == task_span["tid"]
+        ]
+        assert len(udf_spans) == 1
+        # The UDF spans are nested in the task spans.
+        assert task_span["ts"] <= udf_spans[0]["ts"]
+        assert (
+            udf_spans[0]["ts"] + udf_spans[0]["dur"]
+            <= task_span["ts"] + task_span["dur"]
+        )
+
+    # The tasks aren't profiled by default.
+    DataContext.get_current().task_profiling_enabled = False
+    ds = ray.data.range(100, parallelism=4).map_batches(slow_udf).materialize()
+    assert "Task time breakdown" not in ds.stats()
+    assert ds._plan.stats().to_chrome_trace() == []
+
+
 # NOTE: All tests above share a Ray cluster, while the tests below do not. These
 # tests should only be carefully reordered to retain this invariant!
 
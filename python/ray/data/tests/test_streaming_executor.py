@@ -6,6 +6,9 @@ import pytest
 
 import ray
 from ray._private.test_utils import wait_for_condition
+from ray.data._internal.execution.backpressure_policy import (
+    MemoryBudgetBackpressurePolicy,
+)
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -653,6 +656,75 @@ def test_execution_allowed_nothrottle():
     )
 
 
+def test_memory_budget_backpressure_policy():
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(make_transform(lambda block: [b * -1 for b in block]), o1)
+    o3 = MapOperator.create(make_transform(lambda block: [b * 2 for b in block]), o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions())
+    policy = MemoryBudgetBackpressurePolicy(topo)
+    limits = ExecutionResources(object_store_memory=1000)
+
+    # Nothing was output yet.
+    assert policy.memory_budget(o2, limits) == 500
+    assert policy.can_add_input(o2, limits)
+
+    # o2 output 100 bytes per bundle so far, and 400 bytes are queued for o3.
+    topo[o2].num_completed_tasks = 5
+    topo[o2].output_size_bytes = 500
+    topo[o2].outqueue_memory_usage = MagicMock(return_value=400)
+    assert policy.memory_usage(o2) == 400
+    assert policy.can_add_input(o2, limits)
+    # The expected output of an active task doesn't fit in the budget anymore.
+    o2.num_active_work_refs = MagicMock(return_value=1)
+    assert policy.memory_usage(o2) == 500
+    assert not policy.can_add_input(o2, limits)
+    # Other operators have their own budget.
+    assert policy.can_add_input(o3, limits)
+
+    # Operators always reserve memory for the output of one task.
+    topo[o3].num_completed_tasks = 1
+    topo[o3].output_size_bytes = 2000
+    assert policy.memory_budget(o3, limits) == 2000
+
+    # The executor doesn't dispatch inputs to backpressured operators.
+    topo[o1].outqueue.append(inputs[0])
+    assert (
+        select_operator_to_run(
+            topo,
+            NO_USAGE,
+            limits,
+            False,
+            "dummy",
+            AutoscalingState(),
+            backpressure_policies=[policy],
+        )
+        is None
+    )
+    o2.num_active_work_refs = MagicMock(return_value=0)
+    assert (
+        select_operator_to_run(
+            topo,
+            NO_USAGE,
+            limits,
+            False,
+            "dummy",
+            AutoscalingState(),
+            backpressure_policies=[policy],
+        )
+        == o2
+    )
+
+
+def test_backpressure_policies_e2e(ray_start_regular_shared, restore_data_context):
+    ctx = ray.data.DataContext.get_current()
+    ctx.backpressure_policies = [MemoryBudgetBackpressurePolicy]
+    ctx.execution_options.resource_limits.object_store_memory = 10000
+
+    ds = ray.data.range(1000, parallelism=100).map_batches(lambda batch: batch)
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(1000))
+
+
 if __name__ == "__main__":
     import sys
 
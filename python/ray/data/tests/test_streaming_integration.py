@@ -237,6 +237,37 @@ def test_streaming_split_barrier(ray_start_10_cpus_shared):
         ray.get([consume.remote(i1, 2), consume.remote(i2, 1)], timeout=3)
 
 
+def test_streaming_split_resume(ray_start_10_cpus_shared):
+    ds = ray.data.range(40, parallelism=20)
+
+    @ray.remote
+    def consume(x, state, num_batches):
+        if state is not None:
+            x.load_state_dict(state)
+        num_rows = 0
+        for i, batch in enumerate(x.iter_batches(batch_size=3)):
+            num_rows += len(batch["id"])
+            if i + 1 == num_batches:
+                break
+        return num_rows, x.state_dict()
+
+    i1, i2 = ds.streaming_split(2, equal=True)
+    (n1, state1), (n2, state2) = ray.get(
+        [consume.remote(i1, None, 2), consume.remote(i2, None, 3)]
+    )
+    assert (n1, n2) == (6, 9)
+    assert state1 == {"num_epochs_completed": 0, "num_rows_consumed": 6}
+    assert state2 == {"num_epochs_completed": 0, "num_rows_consumed": 9}
+
+    # The restarted readers only read the rest of their splits.
+    i1, i2 = ds.streaming_split(2, equal=True)
+    (n1, state1), (n2, state2) = ray.get(
+        [consume.remote(i1, state1, None), consume.remote(i2, state2, None)]
+    )
+    assert (n1, n2) == (14, 11)
+    assert state1 == state2 == {"num_epochs_completed": 1, "num_rows_consumed": 0}
+
+
 def test_streaming_split_invalid_iterator(ray_start_10_cpus_shared):
     ds = ray.data.range(20, parallelism=20)
     (
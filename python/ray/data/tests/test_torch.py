@@ -305,6 +305,55 @@ def test_iter_torch_batches_tensor_ds(ray_start_10_cpus_shared):
 
 # This test catches an error in stream_split_iterator dealing with empty blocks,
 # which is difficult to reproduce outside of TorchTrainer.
+def test_torch_host_buffer_pool():
+    import torch
+
+    from ray.data._internal.torch_host_buffers import TorchHostBufferPool
+
+    pool = TorchHostBufferPool(dtypes={"a": torch.float32})
+    batches = [
+        {"a": np.arange(4) + i, "b": np.ones((4, 2), dtype=np.int32) * i}
+        for i in range(3)
+    ]
+    collated = [pool.collate(batch) for batch in batches[:2]]
+    # Both batches are in flight, so they're collated into separate buffers.
+    assert pool.num_allocated_sets() == 2
+    for batch, host_batch in zip(batches, collated):
+        # The CPU tensors are the buffers themselves, so they're cloned before the
+        # buffers are reused.
+        tensors = {k: t.clone() for k, t in pool.to_device(host_batch, "cpu").items()}
+        assert tensors["a"].dtype == torch.float32
+        np.testing.assert_array_equal(tensors["a"].numpy(), batch["a"])
+        np.testing.assert_array_equal(tensors["b"].numpy(), batch["b"])
+
+    # The released buffers are reused.
+    tensors = pool.to_device(pool.collate(batches[2]), "cpu")
+    assert pool.num_allocated_sets() == 2
+    np.testing.assert_array_equal(tensors["b"].numpy(), batches[2]["b"])
+
+    # Batches of other shapes get their own buffers.
+    pool.to_device(pool.collate({"a": np.arange(2), "b": np.ones((2, 2))}), "cpu")
+    assert pool.num_allocated_sets() == 3
+
+    # Batches that can't be copied into tensors are left to the default conversion.
+    assert pool.collate({"a": np.array(["x", "y"], dtype=object)}) is None
+
+
+def test_iter_torch_batches_host_buffers(
+    ray_start_10_cpus_shared, restore_data_context
+):
+    import torch
+
+    ray.data.DataContext.get_current().torch_host_buffers_enabled = True
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    ds = ray.data.range(100)
+    batches = list(ds.iter_torch_batches(batch_size=32, device=device))
+    assert [len(batch["id"]) for batch in batches] == [32, 32, 32, 4]
+    np.testing.assert_array_equal(
+        torch.cat([batch["id"] for batch in batches]).cpu().numpy(), np.arange(100)
+    )
+
+
 def test_torch_trainer_crash(ray_start_10_cpus_shared):
     from ray import train
     from ray.train import ScalingConfig